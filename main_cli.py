@@ -19,7 +19,18 @@ from pathlib import Path
 from typing import List, Optional
 
 from src.dsl.inference_dsl import predict_dsl
-from src.dsl.dsl2code import dsl_to_code, TOKEN_HANDLERS, _get_token_description, generate_analysis_template
+from src.dsl.dsl2code import dsl_to_code, TOKEN_HANDLERS, _TOKEN_DESCRIPTIONS, generate_analysis_template
+
+# 추천 템플릿 (키, 설명) - 표시 순서 유지
+_TEMPLATES = (
+    ("basic", "기본 분석 (데이터 구조, 상위 행, 결측치)"),
+    ("statistical", "통계 분석 (기술통계, 분포, 왜도/첨도)"),
+    ("visualization", "시각화 패키지 (히스토그램, 박스플롯, 히트맵)"),
+    ("missing_data", "결측치 심층 분석"),
+    ("correlation", "상관관계 분석"),
+    ("advanced_ml", "고급 ML 분석 (시계열, 이상치, PCA)"),
+    ("comprehensive", "종합 분석 (모든 주요 분석 포함)"),
+)
 
 class DSLAnalyzer:
     """DSL 분석기 클래스"""
@@ -27,6 +38,14 @@ class DSLAnalyzer:
     def __init__(self, csv_path: str = "your_file.csv"):
         self.csv_path = csv_path
         self.available_tokens = self._get_available_tokens()
+        # 대화형 모드 명령어 → 동작 (True를 반환하면 루프 종료)
+        self._repl_dispatch = {
+            'quit': self._quit,
+            'exit': self._quit,
+            'q': self._quit,
+            'help': self.show_help,
+            'analysis': self.analysis_mode,
+        }
     
     def _get_available_tokens(self) -> List[str]:
         """사용 가능한 DSL 토큰 목록 반환"""
@@ -54,7 +73,7 @@ class DSLAnalyzer:
             print(f"\n {category}:")
             for token in tokens:
                 if token in TOKEN_HANDLERS:
-                    description = _get_token_description(token)
+                    description = _TOKEN_DESCRIPTIONS.get(token, "알 수 없는 분석")
                     print(f"  {token}: {description}")
         
         print("\n 예시 사용법:")
@@ -90,27 +109,16 @@ class DSLAnalyzer:
 
     def _wizard_template(self):
         print("\n[추천 템플릿]")
-        templates = {
-            "basic": "기본 분석 (데이터 구조, 상위 행, 결측치)",
-            "statistical": "통계 분석 (기술통계, 분포, 왜도/첨도)",
-            "visualization": "시각화 패키지 (히스토그램, 박스플롯, 히트맵)",
-            "missing_data": "결측치 심층 분석",
-            "correlation": "상관관계 분석",
-            "advanced_ml": "고급 ML 분석 (시계열, 이상치, PCA)",
-            "comprehensive": "종합 분석 (모든 주요 분석 포함)"
-        }
-        
-        keys = list(templates.keys())
-        for i, key in enumerate(keys, 1):
-            print(f"{i}. {key:<15} : {templates[key]}")
+        for i, (key, description) in enumerate(_TEMPLATES, 1):
+            print(f"{i}. {key:<15} : {description}")
             
         try:
             sel = input("\n템플릿 번호 선택 (취소: 0) > ").strip()
             if sel == '0': return
             
             idx = int(sel) - 1
-            if 0 <= idx < len(keys):
-                selected_key = keys[idx]
+            if 0 <= idx < len(_TEMPLATES):
+                selected_key = _TEMPLATES[idx][0]
                 tokens = generate_analysis_template(selected_key)
                 print(f"\n선택된 템플릿: {selected_key}")
                 self.analyze_tokens(tokens)
@@ -141,7 +149,7 @@ class DSLAnalyzer:
             
             # Show options
             for i, t in enumerate(available, 1):
-                desc = _get_token_description(t)
+                desc = _TOKEN_DESCRIPTIONS.get(t, "알 수 없는 분석")
                 print(f"  {i}. {desc} ({t})")
             
             sel = input(f"  선택할 번호 (쉼표 구분, 건너뛰기: 엔터) > ").strip()
@@ -174,16 +182,12 @@ class DSLAnalyzer:
             try:
                 raw = input("\n DSL 토큰 입력 (예: C2 C1 C6): ").strip()
                 
-                if raw.lower() in ['quit', 'exit', 'q']:
-                    print(" DSL 분석기를 종료합니다.")
-                    break
-                elif raw.lower() == 'help':
-                    self.show_help()
-                    continue
-                elif raw.lower() == 'analysis':
-                    self.analysis_mode()
+                action = self._repl_dispatch.get(raw.lower())
+                if action:
+                    if action():
+                        break
                     continue
-                elif not raw:
+                if not raw:
                     continue
                 
                 tokens = raw.split()
@@ -195,6 +199,11 @@ class DSLAnalyzer:
             except Exception as e:
                 print(f" 오류 발생: {e}")
     
+    def _quit(self) -> bool:
+        """종료 명령 처리"""
+        print(" DSL 분석기를 종료합니다.")
+        return True
+    
     def analyze_tokens(self, tokens: List[str], output_file: Optional[str] = None):
         """토큰 분석 및 코드 생성"""
         # 유효한 토큰 확인
@@ -230,7 +239,8 @@ class DSLAnalyzer:
             # 미리보기
             print(f"\n 생성된 코드 미리보기:")
             print("-" * 40)
-            print(code[:500] + "..." if len(code) > 500 else code)
+            sys.stdout.write(code[:500])
+            sys.stdout.write("...\n" if len(code) > 500 else "\n")
             print("-" * 40)
             
         except Exception as e:
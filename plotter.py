@@ -1,10 +1,8 @@
 ﻿import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import pandas as pd
 import numpy as np
+from scipy.ndimage import uniform_filter1d
 import tkinter as tk
-from mpl_toolkits.mplot3d import Axes3D
-import matplotlib.patches as mpatches
 
 class Plotter:
     def __init__(self, is_dark_mode=False):
@@ -31,7 +29,7 @@ class Plotter:
 
     def create_figure(self, figsize=(10, 6)):
         plt.close('all') # Clear memory
-        fig = plt.figure(figsize=figsize)
+        fig = plt.figure(figsize=figsize, constrained_layout=True)
         fig.patch.set_facecolor(self.bg_color)
         return fig
 
@@ -54,6 +52,9 @@ class Plotter:
             ax.yaxis.label.set_color(self.text_color)
 
     def plot(self, viz_type, data, column, parent_frame):
+        # Deferred so importing this module does not register the Tk backend
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
         # Clear previous
         for widget in parent_frame.winfo_children():
             widget.destroy()
@@ -80,7 +81,6 @@ class Plotter:
                 
                 self._plot_specific(fig, ax, viz_type, plot_data, column, is_numeric)
 
-            plt.tight_layout()
             canvas = FigureCanvasTkAgg(fig, parent_frame)
             canvas.draw()
             canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
@@ -89,96 +89,119 @@ class Plotter:
             plt.close(fig)
             raise e
 
+    # Chart types that cannot render anything meaningful for non-numeric data
+    NUMERIC_ONLY = frozenset({
+        "Histogram", "Box Plot", "Scatter Plot", "Line Plot",
+        "3D Scatter", "Violin Plot", "Hexbin Plot",
+    })
+
     def _plot_specific(self, fig, ax, viz_type, data, column, is_numeric):
-        if viz_type == "Histogram":
-            if is_numeric:
-                n, bins, patches = ax.hist(data, bins=30, color=self.colors[0], edgecolor=self.text_color, alpha=0.7)
-                ax.set_title(f'Histogram of {column}', color=self.text_color)
-                self._add_hover_tooltip(fig, ax, patches, "bar", data)
-            else:
-                ax.text(0.5, 0.5, "Requires numeric data", ha='center', color=self.text_color)
+        if viz_type in self.NUMERIC_ONLY and not is_numeric:
+            ax.text(0.5, 0.5, "Requires numeric data", ha='center', color=self.text_color)
+            return
+        handler = self._DISPATCH.get(viz_type)
+        if handler is not None:
+            handler(self, fig, ax, data, column)
 
-        elif viz_type == "Box Plot":
-            if is_numeric:
-                bp = ax.boxplot(data, patch_artist=True)
-                bp['boxes'][0].set_facecolor(self.colors[0])
-                ax.set_title(f'Box Plot of {column}', color=self.text_color)
-            else:
-                ax.text(0.5, 0.5, "Requires numeric data", ha='center', color=self.text_color)
+    def _hist_bars(self, ax, data, bins=30, **kwargs):
+        # Bin once with numpy and draw the bars directly; ax.hist would
+        # re-convert the Series and recompute the edges internally.
+        arr = data.to_numpy(dtype=float, na_value=np.nan)
+        counts, edges = np.histogram(arr[~np.isnan(arr)], bins=bins)
+        return ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', **kwargs)
 
-        elif viz_type == "Scatter Plot":
-            if is_numeric:
-                sc = ax.scatter(data.index, data.values, c=self.colors[1], alpha=0.6, s=30)
-                ax.set_title(f'Scatter Plot: Index vs {column}', color=self.text_color)
-                self._add_hover_tooltip(fig, ax, sc, "scatter", data)
-            else:
-                ax.text(0.5, 0.5, "Requires numeric data", ha='center', color=self.text_color)
+    def _plot_hist(self, fig, ax, data, column):
+        patches = self._hist_bars(ax, data, color=self.colors[0], edgecolor=self.text_color, alpha=0.7)
+        ax.set_title(f'Histogram of {column}', color=self.text_color)
+        self._add_hover_tooltip(fig, ax, patches, "bar", data)
 
-        elif viz_type == "Line Plot":
-            if is_numeric:
-                line, = ax.plot(data.index, data.values, color=self.colors[2], linewidth=1.5)
-                ax.set_title(f'Line Plot of {column}', color=self.text_color)
-                self._add_hover_tooltip(fig, ax, line, "line", data)
-            else:
-                ax.text(0.5, 0.5, "Requires numeric data", ha='center', color=self.text_color)
+    def _plot_box(self, fig, ax, data, column):
+        bp = ax.boxplot(data, patch_artist=True)
+        bp['boxes'][0].set_facecolor(self.colors[0])
+        ax.set_title(f'Box Plot of {column}', color=self.text_color)
 
-        elif viz_type in ["Bar Chart", "Pie Chart", "Donut Chart"]:
-            if is_numeric and data.nunique() > 20:
-                vc = pd.cut(data, bins=10).value_counts().sort_index()
-            else:
-                vc = data.value_counts()
-                if len(vc) > 15:
-                    vc = pd.concat([vc.head(14), pd.Series({'Others': vc.iloc[14:].sum()})])
-
-            if viz_type == "Bar Chart":
-                bars = ax.bar(range(len(vc)), vc.values, color=self.colors, alpha=0.8)
-                ax.set_xticks(range(len(vc)))
-                ax.set_xticklabels([str(x)[:10] for x in vc.index], rotation=45, ha='right')
-                ax.set_title(f'Bar Chart of {column}', color=self.text_color)
-                self._add_hover_tooltip(fig, ax, bars, "bar", vc)
-
-            elif viz_type in ["Pie Chart", "Donut Chart"]:
-                wedges, texts, autotexts = ax.pie(vc.values, labels=None, autopct='%1.1f%%', 
-                                                startangle=90, colors=self.colors,
-                                                wedgeprops=dict(width=0.5 if viz_type == "Donut Chart" else 1, edgecolor=self.bg_color))
-                ax.legend(wedges, vc.index, title="Categories", loc="center left", bbox_to_anchor=(1, 0, 0.5, 1))
-                ax.set_title(f'{viz_type} of {column}', color=self.text_color)
-                for t in texts + autotexts: t.set_color(self.text_color)
-                self._add_hover_tooltip(fig, ax, wedges, "pie", vc)
-
-        elif viz_type == "3D Scatter":
-            if is_numeric:
-                z = data.rolling(5).mean().fillna(method='bfill')
-                sc = ax.scatter(range(len(data)), data.values, z, c=data.values, cmap='viridis')
-                ax.set_xlabel('Index'); ax.set_ylabel('Value'); ax.set_zlabel('Rolling Mean')
-                ax.set_title(f'3D Scatter of {column}', color=self.text_color)
-            else:
-                ax.text(0.5, 0.5, "Requires numeric data", ha='center', color=self.text_color)
-
-        elif viz_type == "Violin Plot":
-            if is_numeric:
-                parts = ax.violinplot(data, showmeans=True)
-                for pc in parts['bodies']:
-                    pc.set_facecolor(self.colors[3])
-                    pc.set_alpha(0.6)
-                ax.set_title(f'Violin Plot of {column}', color=self.text_color)
-            else:
-                ax.text(0.5, 0.5, "Requires numeric data", ha='center', color=self.text_color)
-        
-        elif viz_type == "Hexbin Plot":
-            if is_numeric:
-                hb = ax.hexbin(data.index, data.values, gridsize=20, cmap='inferno')
-                fig.colorbar(hb, ax=ax)
-                ax.set_title(f'Hexbin Plot of {column}', color=self.text_color)
-            else:
-                ax.text(0.5, 0.5, "Requires numeric data", ha='center', color=self.text_color)
+    def _plot_scatter(self, fig, ax, data, column):
+        sc = ax.scatter(data.index, data.values, c=self.colors[1], alpha=0.6, s=30)
+        ax.set_title(f'Scatter Plot: Index vs {column}', color=self.text_color)
+        self._add_hover_tooltip(fig, ax, sc, "scatter", data)
+
+    def _plot_line(self, fig, ax, data, column):
+        line, = ax.plot(data.index, data.values, color=self.colors[2], linewidth=1.5)
+        ax.set_title(f'Line Plot of {column}', color=self.text_color)
+        self._add_hover_tooltip(fig, ax, line, "line", data)
+
+    def _category_counts(self, data):
+        if pd.api.types.is_numeric_dtype(data) and data.nunique() > 20:
+            return pd.cut(data, bins=10).value_counts().sort_index()
+        vc = data.value_counts()
+        if len(vc) > 15:
+            vc = pd.concat([vc.head(14), pd.Series({'Others': vc.iloc[14:].sum()})])
+        return vc
+
+    def _plot_bar(self, fig, ax, data, column):
+        vc = self._category_counts(data)
+        bars = ax.bar(range(len(vc)), vc.values, color=self.colors, alpha=0.8)
+        ax.set_xticks(range(len(vc)))
+        ax.set_xticklabels([str(x)[:10] for x in vc.index], rotation=45, ha='right')
+        ax.set_title(f'Bar Chart of {column}', color=self.text_color)
+        self._add_hover_tooltip(fig, ax, bars, "bar", vc)
+
+    def _plot_pie(self, fig, ax, data, column, donut=False):
+        vc = self._category_counts(data)
+        wedges, texts, autotexts = ax.pie(vc.values, labels=None, autopct='%1.1f%%', 
+                                        startangle=90, colors=self.colors,
+                                        wedgeprops=dict(width=0.5 if donut else 1, edgecolor=self.bg_color))
+        ax.legend(wedges, vc.index, title="Categories", loc="center left", bbox_to_anchor=(1, 0, 0.5, 1))
+        ax.set_title(f'{"Donut" if donut else "Pie"} Chart of {column}', color=self.text_color)
+        for t in texts + autotexts: t.set_color(self.text_color)
+        self._add_hover_tooltip(fig, ax, wedges, "pie", vc)
+
+    def _plot_donut(self, fig, ax, data, column):
+        self._plot_pie(fig, ax, data, column, donut=True)
+
+    @staticmethod
+    def _rolling_mean(data, size=5):
+        # Single C pass with edge padding; replaces rolling().mean() plus the
+        # deprecated fillna(method='bfill') for the leading window.
+        return uniform_filter1d(data.to_numpy(dtype=float, na_value=np.nan), size=size, mode='nearest')
+
+    def _plot_3d_scatter(self, fig, ax, data, column):
+        z = self._rolling_mean(data)
+        sc = ax.scatter(range(len(data)), data.values, z, c=data.values, cmap='viridis')
+        ax.set_xlabel('Index'); ax.set_ylabel('Value'); ax.set_zlabel('Rolling Mean')
+        ax.set_title(f'3D Scatter of {column}', color=self.text_color)
+
+    def _plot_violin(self, fig, ax, data, column):
+        parts = ax.violinplot(data, showmeans=True)
+        for pc in parts['bodies']:
+            pc.set_facecolor(self.colors[3])
+            pc.set_alpha(0.6)
+        ax.set_title(f'Violin Plot of {column}', color=self.text_color)
+
+    def _plot_hexbin(self, fig, ax, data, column):
+        hb = ax.hexbin(data.index, data.values, gridsize=20, cmap='inferno')
+        fig.colorbar(hb, ax=ax)
+        ax.set_title(f'Hexbin Plot of {column}', color=self.text_color)
+
+    _DISPATCH = {
+        "Histogram": _plot_hist,
+        "Box Plot": _plot_box,
+        "Scatter Plot": _plot_scatter,
+        "Line Plot": _plot_line,
+        "Bar Chart": _plot_bar,
+        "Pie Chart": _plot_pie,
+        "Donut Chart": _plot_donut,
+        "3D Scatter": _plot_3d_scatter,
+        "Violin Plot": _plot_violin,
+        "Hexbin Plot": _plot_hexbin,
+    }
 
     def _plot_smart(self, fig, data, column, is_numeric):
         if is_numeric:
             # 1. Histogram
             ax1 = fig.add_subplot(221)
             self.style_axis(ax1)
-            n, bins, patches = ax1.hist(data, bins=30, color=self.colors[0], alpha=0.7)
+            patches = self._hist_bars(ax1, data, color=self.colors[0], alpha=0.7)
             ax1.set_title('Histogram', color=self.text_color)
             self._add_hover_tooltip(fig, ax1, patches, "bar", data)
 
@@ -194,7 +217,7 @@ class Plotter:
             ax3 = fig.add_subplot(223, projection='3d')
             self.style_axis(ax3, is_3d=True)
             sample_3d = data.sample(min(500, len(data))).sort_index()
-            ax3.scatter(np.arange(len(sample_3d)), sample_3d.values, sample_3d.rolling(5).mean().fillna(0), c=sample_3d.values, cmap='plasma')
+            ax3.scatter(np.arange(len(sample_3d)), sample_3d.values, self._rolling_mean(sample_3d), c=sample_3d.values, cmap='plasma')
             ax3.set_title('3D Analysis', color=self.text_color)
 
             # 4. Violin
@@ -226,8 +249,23 @@ class Plotter:
     def _add_hover_tooltip(self, fig, ax, artist, type, data):
         annot = ax.annotate("", xy=(0,0), xytext=(20,20), textcoords="offset points",
                            bbox=dict(boxstyle="round", fc="w", alpha=0.8),
-                           arrowprops=dict(arrowstyle="->"))
+                           arrowprops=dict(arrowstyle="->"), animated=True)
         annot.set_visible(False)
+        background = None
+
+        def on_draw(event):
+            # Snapshot the rendered figure (without the animated annotation)
+            nonlocal background
+            background = fig.canvas.copy_from_bbox(fig.bbox)
+
+        def blit_annot():
+            if background is None:
+                fig.canvas.draw_idle()
+                return
+            fig.canvas.restore_region(background)
+            if annot.get_visible():
+                ax.draw_artist(annot)
+            fig.canvas.blit(fig.bbox)
 
         def update_annot(ind, artist_type):
             if artist_type == "scatter":
@@ -293,10 +331,11 @@ class Plotter:
                 if cont:
                     update_annot(ind, type)
                     annot.set_visible(True)
-                    fig.canvas.draw_idle()
+                    blit_annot()
                 else:
                     if vis:
                         annot.set_visible(False)
-                        fig.canvas.draw_idle()
+                        blit_annot()
 
+        fig.canvas.mpl_connect("draw_event", on_draw)
         fig.canvas.mpl_connect("motion_notify_event", hover)
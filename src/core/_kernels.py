@@ -0,0 +1,234 @@
+"""
+조합 분석용 쌍별 계산 커널
+
+범주형 쌍의 카이제곱/Cramér's V, 수치형-범주형 쌍의 ANOVA F/eta-squared를
+모든 쌍에 대해 한 번에 계산합니다. numba가 설치되어 있으면
+@njit(parallel=True) 커널로 쌍 단위 병렬 처리하고, 없으면 같은 인터페이스의
+NumPy(bincount) 구현을 사용합니다.
+
+배열 규약:
+    codes: (K, n) int32 범주 코드 (결측치는 -1), 행마다 연속 메모리
+    x:     (M, n) float32 수치 값 (결측치는 NaN), 행마다 연속 메모리
+    ncats: (K,) 범주 개수
+    centers: (M,) 수치형 컬럼별 중심값 (전체 평균, 제곱합 계산 시 수치 오차 방지용)
+    pi, pj: 계산할 쌍의 인덱스 배열 (같은 길이)
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+# 선택적 의존성
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def contingency_table(codes1: np.ndarray, n1: int, codes2: np.ndarray, n2: int) -> np.ndarray:
+    """정수 코드 쌍으로 교차표 생성 (해시 없이 bincount 한 번)"""
+    valid = (codes1 >= 0) & (codes2 >= 0)
+    flat = codes1[valid].astype(np.int64) * n2 + codes2[valid]
+    return np.bincount(flat, minlength=n1 * n2).reshape(n1, n2)
+
+
+def chi2_statistic(ct: np.ndarray) -> Tuple[float, int]:
+    """카이제곱 통계량과 자유도 (2x2 표는 chi2_contingency와 동일하게 Yates 보정)"""
+    row_sums = ct.sum(axis=1, keepdims=True)
+    col_sums = ct.sum(axis=0, keepdims=True)
+    expected = row_sums * col_sums / ct.sum()
+    observed = ct.astype(np.float64)
+    dof = (ct.shape[0] - 1) * (ct.shape[1] - 1)
+    if dof == 1:
+        diff = expected - observed
+        observed = observed + np.minimum(0.5, np.abs(diff)) * np.sign(diff)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        terms = np.where(expected > 0, (observed - expected) ** 2 / expected, 0.0)
+    return float(terms.sum()), dof
+
+
+def group_sums(x: np.ndarray, codes: np.ndarray, ncats: int,
+               center: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+    """그룹별 개수, 중심화된 합, 제곱합 (결측 행 제외) 및 중심값"""
+    valid = (codes >= 0) & ~np.isnan(x)
+    c = codes[valid]
+    xv = x[valid].astype(np.float64)
+    if center is None:
+        center = float(xv.mean()) if xv.size else 0.0
+    xv -= center  # 중심화로 제곱합 계산 시 수치 오차 방지
+
+    cnt = np.bincount(c, minlength=ncats)
+    sx = np.bincount(c, weights=xv, minlength=ncats)
+    sx2 = np.bincount(c, weights=xv * xv, minlength=ncats)
+    return cnt, sx, sx2, center
+
+
+def _cat_pairs_numpy(codes, ncats, pi, pj):
+    size = pi.size
+    chi2 = np.zeros(size)
+    dof = np.zeros(size, dtype=np.int64)
+    cramers_v = np.zeros(size)
+    nobs = np.zeros(size, dtype=np.int64)
+
+    for p in range(size):
+        ct = contingency_table(codes[pi[p]], ncats[pi[p]], codes[pj[p]], ncats[pj[p]])
+        ct = ct[ct.sum(axis=1) > 0][:, ct.sum(axis=0) > 0]
+        if ct.size == 0:
+            continue
+        chi2[p], dof[p] = chi2_statistic(ct)
+        nobs[p] = ct.sum()
+        min_dim = min(ct.shape) - 1
+        cramers_v[p] = np.sqrt(chi2[p] / (nobs[p] * min_dim)) if min_dim > 0 else 0.0
+
+    return chi2, dof, cramers_v, nobs
+
+
+def _mixed_pairs_numpy(x, codes, ncats, centers, pi, pj):
+    size = pi.size
+    f_stat = np.zeros(size)
+    eta_squared = np.zeros(size)
+    ngroups = np.zeros(size, dtype=np.int64)
+    nobs = np.zeros(size, dtype=np.int64)
+    min_count = np.zeros(size, dtype=np.int64)
+
+    for p in range(size):
+        cnt, sx, sx2, _ = group_sums(x[pi[p]], codes[pj[p]], ncats[pj[p]], centers[pi[p]])
+        present = cnt > 0
+        cnt, sx, sx2 = cnt[present], sx[present], sx2[present]
+        k, n = cnt.size, int(cnt.sum())
+        ngroups[p], nobs[p] = k, n
+        if k < 2 or n <= k:
+            continue
+        min_count[p] = cnt.min()
+
+        ss_total = sx2.sum() - sx.sum() ** 2 / n
+        ss_between = (sx * sx / cnt).sum() - sx.sum() ** 2 / n
+        with np.errstate(divide='ignore', invalid='ignore'):
+            f_stat[p] = (ss_between / (k - 1)) / ((ss_total - ss_between) / (n - k))
+        eta_squared[p] = ss_between / ss_total if ss_total > 0 else 0.0
+
+    return f_stat, eta_squared, ngroups, nobs, min_count
+
+
+if HAS_NUMBA:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _cat_pairs_numba(codes, ncats, pi, pj):
+        size = pi.size
+        n = codes.shape[1]
+        chi2 = np.zeros(size)
+        dof = np.zeros(size, dtype=np.int64)
+        cramers_v = np.zeros(size)
+        nobs = np.zeros(size, dtype=np.int64)
+
+        for p in prange(size):
+            a, b = codes[pi[p]], codes[pj[p]]
+            n1, n2 = ncats[pi[p]], ncats[pj[p]]
+            ct = np.zeros((n1, n2), dtype=np.int64)
+            for r in range(n):
+                if a[r] >= 0 and b[r] >= 0:
+                    ct[a[r], b[r]] += 1
+
+            row_sums = ct.sum(axis=1)
+            col_sums = ct.sum(axis=0)
+            total = row_sums.sum()
+            if total == 0:
+                continue
+            rows = np.count_nonzero(row_sums)
+            cols = np.count_nonzero(col_sums)
+            df_ = (rows - 1) * (cols - 1)
+
+            # 관측되지 않은 행/열은 건너뜀 (교차표 축소와 동일)
+            stat = 0.0
+            for i in range(n1):
+                if row_sums[i] == 0:
+                    continue
+                for j in range(n2):
+                    if col_sums[j] == 0:
+                        continue
+                    expected = row_sums[i] * col_sums[j] / total
+                    observed = float(ct[i, j])
+                    if df_ == 1:
+                        diff = expected - observed
+                        observed += min(0.5, abs(diff)) * np.sign(diff)
+                    stat += (observed - expected) ** 2 / expected
+
+            chi2[p] = stat
+            dof[p] = df_
+            nobs[p] = total
+            min_dim = min(rows, cols) - 1
+            if min_dim > 0:
+                cramers_v[p] = np.sqrt(stat / (total * min_dim))
+
+        return chi2, dof, cramers_v, nobs
+
+    # NaN 검사가 필요하므로 fastmath는 사용하지 않음
+    @njit(parallel=True, cache=True, error_model='numpy')
+    def _mixed_pairs_numba(x, codes, ncats, centers, pi, pj):
+        size = pi.size
+        n = x.shape[1]
+        f_stat = np.zeros(size)
+        eta_squared = np.zeros(size)
+        ngroups = np.zeros(size, dtype=np.int64)
+        nobs = np.zeros(size, dtype=np.int64)
+        min_count = np.zeros(size, dtype=np.int64)
+
+        for p in prange(size):
+            xv, c, g = x[pi[p]], codes[pj[p]], ncats[pj[p]]
+            center = centers[pi[p]]
+
+            # 중심값을 미리 받으므로 행 배열은 한 번만 순회
+            m = 0
+            cnt = np.zeros(g, dtype=np.int64)
+            sx = np.zeros(g)
+            sx2 = np.zeros(g)
+            for r in range(n):
+                if c[r] >= 0 and not np.isnan(xv[r]):
+                    m += 1
+                    d = xv[r] - center
+                    cnt[c[r]] += 1
+                    sx[c[r]] += d
+                    sx2[c[r]] += d * d
+
+            k = 0
+            smallest = m
+            sum_x = 0.0
+            sum_x2 = 0.0
+            between = 0.0
+            for i in range(g):
+                if cnt[i] > 0:
+                    k += 1
+                    smallest = min(smallest, cnt[i])
+                    sum_x += sx[i]
+                    sum_x2 += sx2[i]
+                    between += sx[i] * sx[i] / cnt[i]
+            ngroups[p] = k
+            nobs[p] = m
+            if k < 2 or m <= k:
+                continue
+            min_count[p] = smallest
+
+            ss_total = sum_x2 - sum_x * sum_x / m
+            ss_between = between - sum_x * sum_x / m
+            f_stat[p] = (ss_between / (k - 1)) / ((ss_total - ss_between) / (m - k))
+            if ss_total > 0:
+                eta_squared[p] = ss_between / ss_total
+
+        return f_stat, eta_squared, ngroups, nobs, min_count
+
+    _cat_pairs_impl = _cat_pairs_numba
+    _mixed_pairs_impl = _mixed_pairs_numba
+else:
+    _cat_pairs_impl = _cat_pairs_numpy
+    _mixed_pairs_impl = _mixed_pairs_numpy
+
+
+def cat_pairs(codes: np.ndarray, ncats: np.ndarray, pi: np.ndarray, pj: np.ndarray):
+    """범주형 쌍별 (chi2, dof, cramers_v, nobs) 배열 계산 (nobs == 0이면 유효한 관측 없음)"""
+    return _cat_pairs_impl(codes, ncats, pi, pj)
+
+
+def mixed_pairs(x: np.ndarray, codes: np.ndarray, ncats: np.ndarray, centers: np.ndarray,
+                pi: np.ndarray, pj: np.ndarray):
+    """수치형-범주형 쌍별 (f_statistic, eta_squared, ngroups, nobs, min_count) 배열 계산"""
+    return _mixed_pairs_impl(x, codes, ncats, centers, pi, pj)
@@ -21,17 +21,24 @@
 """
 
 import argparse
+import atexit
+import gzip
 import hashlib
 import json
 import logging
+import logging.handlers
+import os
+import pickle
 import sys
 import time
+import warnings
+import weakref
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from contextlib import contextmanager
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -44,11 +51,53 @@ except ImportError:
     HAS_PSUTIL = False
 
 try:
-    from scipy.stats import chi2_contingency, f_oneway
+    from scipy.stats import chi2 as chi2_dist, f as f_dist
     HAS_SCIPY = True
 except ImportError:
     HAS_SCIPY = False
 
+try:
+    from joblib import Parallel, delayed
+    HAS_JOBLIB = True
+except ImportError:
+    HAS_JOBLIB = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+try:
+    import zstandard as zstd
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+try:
+    import python_calamine  # noqa: F401 - pandas read_excel(engine="calamine") 백엔드
+    HAS_CALAMINE = True
+except ImportError:
+    HAS_CALAMINE = False
+
+try:
+    from ._kernels import HAS_NUMBA, cat_pairs, chi2_statistic, contingency_table, group_sums, mixed_pairs
+except ImportError:  # 스크립트로 직접 실행하는 경우
+    from _kernels import HAS_NUMBA, cat_pairs, chi2_statistic, contingency_table, group_sums, mixed_pairs
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
@@ -67,7 +116,8 @@ class AnalysisConfig:
     max_workers: int = 4
     enable_caching: bool = True
     cache_dir: str = ".analysis_cache"
-    memory_optimization: bool = True
+    # True: 항상 최적화, False: 사용 안 함, 'auto': Arrow 기반 프레임은 건너뜀
+    memory_optimization: Union[bool, str] = 'auto'
 
 @dataclass
 class PerformanceMetrics:
@@ -83,23 +133,44 @@ class PerformanceMetrics:
     def duration(self) -> float:
         return (self.end_time - self.start_time) if self.end_time else 0
 
+@dataclass
+class _ColSchema:
+    """한 번의 분석 동안 공유되는 컬럼 분류 및 변환 결과"""
+    numerical: List[str]
+    categorical: List[str]  # max_cardinality 이하만 포함
+    codes: Dict[str, np.ndarray]  # int32 범주 코드 (결측치는 -1)
+    ncats: Dict[str, int]
+    categories: Dict[str, np.ndarray]
+    code_array: np.ndarray  # (범주형 컬럼 수, 행 수) int32, categorical 순서
+    ncat_array: np.ndarray  # (범주형 컬럼 수,) int64
+    num_array: np.ndarray  # 수치형 컬럼의 float32 행렬 (열 우선 배치)
+
 class PerformanceMonitor:
     """성능 모니터링 클래스"""
 
     def __init__(self):
         self.metrics_history: List[PerformanceMetrics] = []
+        self._process = psutil.Process() if HAS_PSUTIL else None
+
+    def _snapshot(self) -> Tuple[float, int]:
+        """현재 프로세스의 누적 CPU 시간(초)과 RSS (블로킹 없는 조회)"""
+        if self._process is None:
+            return 0.0, 0
+        cpu = self._process.cpu_times()
+        return cpu.user + cpu.system, self._process.memory_info().rss
 
     @contextmanager
     def track_operation(self, operation_name: str):
         """작업 수행 시간 추적"""
         start_time = time.time()
-        start_memory = psutil.virtual_memory().used if HAS_PSUTIL else 0
+        start_cpu, start_memory = self._snapshot()
 
         try:
             yield
         finally:
             end_time = time.time()
-            end_memory = psutil.virtual_memory().used if HAS_PSUTIL else 0
+            end_cpu, end_memory = self._snapshot()
+            elapsed = end_time - start_time
 
             metrics = PerformanceMetrics(
                 start_time=start_time,
@@ -108,8 +179,9 @@ class PerformanceMonitor:
                     'start': start_memory,
                     'end': end_memory,
                     'delta': end_memory - start_memory
-                } if HAS_PSUTIL else {'start': 0, 'end': 0, 'delta': 0},
-                cpu_usage=psutil.cpu_percent(interval=0.1) if HAS_PSUTIL else 0
+                },
+                # 구간 동안 사용한 CPU 시간 비율 (멀티코어면 100%를 넘을 수 있음)
+                cpu_usage=(end_cpu - start_cpu) / elapsed * 100 if elapsed > 0 else 0
             )
 
             self.metrics_history.append(metrics)
@@ -136,42 +208,35 @@ class MemoryOptimizer:
 
     @staticmethod
     def optimize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
-        """데이터프레임 메모리 최적화"""
-        optimized_df = df.copy()
+        """데이터프레임 메모리 최적화 (원본 복사 없이 컬럼 단위로 한 번씩 변환)"""
+        columns = {}
 
-        for col in optimized_df.columns:
-            col_type = optimized_df[col].dtype
+        for col in df.columns:
+            s = df[col]
+            col_type = s.dtype
 
             try:
                 if col_type == 'object':
                     # 범주형 데이터로 변환 가능한지 확인
-                    if optimized_df[col].nunique() / len(optimized_df) < 0.5:
-                        optimized_df[col] = optimized_df[col].astype('category')
+                    if s.nunique() / len(s) < 0.5:
+                        s = s.astype('category')
                 elif col_type == 'int64':
-                    # 정수 타입 다운캐스팅
-                    col_min, col_max = optimized_df[col].min(), optimized_df[col].max()
+                    # 정수 타입 다운캐스팅 (pandas 단일 패스 C 루틴)
+                    col_min, col_max = s.agg(['min', 'max'])
                     if col_min >= 0:
-                        if col_max < 256:
-                            optimized_df[col] = optimized_df[col].astype('uint8')
-                        elif col_max < 65536:
-                            optimized_df[col] = optimized_df[col].astype('uint16')
-                        elif col_max < 4294967296:
-                            optimized_df[col] = optimized_df[col].astype('uint32')
+                        if col_max < 4294967296:
+                            s = pd.to_numeric(s, downcast='unsigned')
                     else:
-                        if col_min > -129 and col_max < 128:
-                            optimized_df[col] = optimized_df[col].astype('int8')
-                        elif col_min > -32769 and col_max < 32768:
-                            optimized_df[col] = optimized_df[col].astype('int16')
-                        elif col_min > -2147483649 and col_max < 2147483648:
-                            optimized_df[col] = optimized_df[col].astype('int32')
+                        s = pd.to_numeric(s, downcast='integer')
                 elif col_type == 'float64':
                     # 실수 타입 다운캐스팅
-                    optimized_df[col] = optimized_df[col].astype('float32')
+                    s = pd.to_numeric(s, downcast='float')
             except Exception as e:
                 logger.warning(f"컬럼 {col} 최적화 실패: {e}")
-                continue
 
-        return optimized_df
+            columns[col] = s
+
+        return pd.DataFrame(columns, index=df.index, copy=False)
 
     @staticmethod
     def get_memory_usage_info(df: pd.DataFrame) -> Dict[str, Any]:
@@ -183,14 +248,40 @@ class MemoryOptimizer:
             "total_memory_mb": total_memory / 1024 / 1024,
             "memory_per_column": {col: usage / 1024 / 1024 for col, usage in memory_usage.items()},
             "largest_column": memory_usage.idxmax(),
-            "optimization_potential": MemoryOptimizer._calculate_optimization_potential(df)
+            "optimization_potential": MemoryOptimizer._calculate_optimization_potential(df, total_memory)
         }
 
+    # id(df) -> (weakref, 결과): 같은 객체에 대해 최적화를 반복 수행하지 않도록 캐시
+    _potential_cache: Dict[int, Tuple[Any, str]] = {}
+
+    # 이보다 큰 데이터프레임은 표본으로 절감률을 추정
+    _potential_sample_rows = 10_000
+
     @staticmethod
-    def _calculate_optimization_potential(df: pd.DataFrame) -> str:
+    def _calculate_optimization_potential(df: pd.DataFrame, original_memory: Optional[int] = None) -> str:
         """최적화 잠재력 계산"""
+        cached = MemoryOptimizer._potential_cache.get(id(df))
+        if cached is not None and cached[0]() is df:
+            return cached[1]
+
+        potential = MemoryOptimizer._compute_optimization_potential(df, original_memory)
         try:
-            original_memory = df.memory_usage(deep=True).sum()
+            key = id(df)
+            ref = weakref.ref(df, lambda _, key=key: MemoryOptimizer._potential_cache.pop(key, None))
+            MemoryOptimizer._potential_cache[key] = (ref, potential)
+        except TypeError:
+            pass
+        return potential
+
+    @staticmethod
+    def _compute_optimization_potential(df: pd.DataFrame, original_memory: Optional[int] = None) -> str:
+        """최적화 전후 메모리 사용량 비교 (큰 데이터는 표본 기준 추정)"""
+        try:
+            if len(df) > MemoryOptimizer._potential_sample_rows:
+                df = df.sample(n=MemoryOptimizer._potential_sample_rows, random_state=42)
+                original_memory = None
+            if original_memory is None:
+                original_memory = df.memory_usage(deep=True).sum()
             optimized_df = MemoryOptimizer.optimize_dataframe(df)
             optimized_memory = optimized_df.memory_usage(deep=True).sum()
 
@@ -206,7 +297,9 @@ class MemoryOptimizer:
             return "unknown"
 
 class AnalysisCache:
-    """분석 결과 캐시 클래스"""
+    """분석 결과 캐시 클래스 (pickle + zstd 압축, zstandard가 없으면 gzip)"""
+
+    suffix = ".pkl.zst" if HAS_ZSTD else ".pkl.gz"
 
     def __init__(self, cache_dir: str = ".analysis_cache", max_age_hours: int = 24):
         self.cache_dir = Path(cache_dir)
@@ -216,12 +309,24 @@ class AnalysisCache:
     def get_cache_key(self, df_hash: str, analysis_type: str, params: Dict[str, Any]) -> str:
         """캐시 키 생성"""
         params_str = json.dumps(params, sort_keys=True)
-        key = hashlib.md5(f"{df_hash}_{analysis_type}_{params_str}".encode()).hexdigest()
+        key = hashlib.blake2b(f"{df_hash}_{analysis_type}_{params_str}".encode(), digest_size=16).hexdigest()
         return key
 
+    @staticmethod
+    def _compress(blob: bytes) -> bytes:
+        if HAS_ZSTD:
+            return zstd.ZstdCompressor(level=3).compress(blob)
+        return gzip.compress(blob, compresslevel=3)
+
+    @staticmethod
+    def _decompress(blob: bytes) -> bytes:
+        if HAS_ZSTD:
+            return zstd.ZstdDecompressor().decompress(blob)
+        return gzip.decompress(blob)
+
     def get(self, key: str) -> Optional[Any]:
         """캐시에서 데이터 가져오기"""
-        cache_file = self.cache_dir / f"{key}.json"
+        cache_file = self.cache_dir / f"{key}{self.suffix}"
 
         if not cache_file.exists():
             return None
@@ -233,27 +338,121 @@ class AnalysisCache:
             return None
 
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return pickle.loads(self._decompress(cache_file.read_bytes()))
         except Exception:
             return None
 
     def set(self, key: str, data: Any):
         """데이터를 캐시에 저장"""
-        cache_file = self.cache_dir / f"{key}.json"
+        cache_file = self.cache_dir / f"{key}{self.suffix}"
         try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, default=str)
+            cache_file.write_bytes(self._compress(pickle.dumps(data, protocol=5)))
         except Exception as e:
             logger.warning(f"캐시 저장 실패: {e}")
 
     def clear_expired(self):
         """만료된 캐시 파일들 정리"""
-        current_time = time.time()
-        for cache_file in self.cache_dir.glob("*.json"):
-            file_age_hours = (current_time - cache_file.stat().st_mtime) / 3600
-            if file_age_hours > self.max_age_hours:
-                cache_file.unlink()
+        cutoff = time.time() - self.max_age_hours * 3600
+        # 이름으로 먼저 거르고 DirEntry의 stat만 사용 (Path 객체 생성 없음, Windows는 추가 시스템 호출 없음)
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(self.suffix) and entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                    os.unlink(entry.path)
+
+# 연관성 강도 / 효과 크기 구간 (경계값 이상이면 다음 구간)
+_STRENGTH_EDGES = np.array([0.1, 0.3, 0.5])
+_STRENGTH_LABELS = np.array(["약함", "보통", "강함", "매우 강함"])
+_EFFECT_EDGES = np.array([0.01, 0.06, 0.14])
+_EFFECT_LABELS = np.array(["효과 없음", "작은 효과", "중간 효과", "큰 효과"])
+
+
+def _has_arrow_dtypes(df: pd.DataFrame) -> bool:
+    """PyArrow 기반 dtype 컬럼이 하나라도 있는지 확인"""
+    return any(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+
+
+def _select_dsl_columns(columns, dsl_tokens: List[str]) -> List[str]:
+    """DSL 토큰을 이름에 포함하는 컬럼 목록"""
+    return [col for col in columns if any(token in col for token in dsl_tokens)]
+
+
+def _arrow_factorize(series: pd.Series) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Arrow dictionary_encode로 (int32 코드, 범주) 생성, 변환할 수 없는 컬럼은 None"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return None  # 이미 코드가 있으므로 pandas 경로가 더 저렴
+    try:
+        encoded = pa.array(series, from_pandas=True).dictionary_encode()
+    except (pa.ArrowException, TypeError, ValueError):
+        return None  # 타입이 섞인 object 컬럼 등
+    codes = pc.fill_null(encoded.indices, -1).to_numpy(zero_copy_only=False)
+    return codes.astype(np.int32, copy=False), encoded.dictionary.to_numpy(zero_copy_only=False)
+
+def _factorize_columns(df: pd.DataFrame, columns: List[str]) -> Dict[str, Tuple[np.ndarray, int, np.ndarray]]:
+    """범주형 컬럼을 한 번만 정수 코드로 변환 (결측치는 -1, PyArrow가 없으면 pd.factorize)"""
+    factorized = {}
+    for col in columns:
+        encoded = _arrow_factorize(df[col]) if HAS_PYARROW else None
+        if encoded is None:
+            codes, categories = pd.factorize(df[col], sort=False)
+            encoded = codes.astype(np.int32, copy=False), np.asarray(categories)
+        factorized[col] = (encoded[0], len(encoded[1]), encoded[1])
+    return factorized
+
+def _masked_corrcoef(arr: np.ndarray) -> np.ndarray:
+    """결측치가 있는 (행, 컬럼) 행렬의 상관계수 행렬 (DataFrame.corr의 쌍별 결측 제거와 동일)
+
+    유효 마스크 M과 결측을 0으로 채운 X로 쌍별 개수/합/제곱합/곱의 합을
+    행렬곱 네 번으로 구하므로 컬럼 쌍마다 pandas를 호출하지 않습니다.
+    """
+    mask = ~np.isnan(arr)
+    m = mask.astype(np.float64)
+    count = m.sum(axis=0)
+    # 컬럼 평균으로 중심화해 제곱합 계산 시 수치 오차 방지 (상관계수는 이동에 불변)
+    mean = np.nansum(arr, axis=0, dtype=np.float64) / np.maximum(count, 1)
+    x = np.where(mask, arr - mean, 0.0)
+
+    n = m.T @ m              # n[i, j]: 두 컬럼 모두 유효한 행 수
+    sx = x.T @ m             # sx[i, j]: 컬럼 j가 유효한 행에서 컬럼 i의 합
+    sxx = (x * x).T @ m
+    sxy = x.T @ x
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = sxy - sx * sx.T / n
+        var = sxx - sx * sx / n
+        corr = cov / np.sqrt(var * var.T)
+    return np.clip(corr, -1.0, 1.0)
+
+def _anova_from_codes(x: np.ndarray, codes: np.ndarray, ncats: int,
+                      min_sample_size: int) -> Optional[Dict[str, Any]]:
+    """그룹별 합계(bincount)만으로 일원 ANOVA F, p, eta-squared 및 그룹 통계 계산"""
+    cnt, sx, sx2, center = group_sums(x, codes, ncats)
+
+    present = cnt > 0
+    cnt, sx, sx2 = cnt[present], sx[present], sx2[present]
+    k = cnt.size
+    n = int(cnt.sum())
+
+    # 최소 샘플 크기 확인
+    if k < 2 or n <= k or (cnt < min_sample_size).any():
+        return None
+
+    ss_total = float(sx2.sum() - sx.sum() ** 2 / n)
+    ss_between = float((sx * sx / cnt).sum() - sx.sum() ** 2 / n)
+    ss_within = ss_total - ss_between
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        f_stat = (ss_between / (k - 1)) / (ss_within / (n - k))
+        group_var = (sx2 - sx * sx / cnt) / (cnt - 1)
+    p_value = float(f_dist.sf(f_stat, k - 1, n - k)) if HAS_SCIPY else 1.0
+
+    return {
+        "f_statistic": float(f_stat),
+        "p_value": p_value,
+        "eta_squared": ss_between / ss_total if ss_total > 0 else 0.0,
+        "present": present,
+        "count": cnt,
+        "mean": sx / cnt + center,
+        "std": np.sqrt(np.maximum(group_var, 0.0))
+    }
 
 class AdvancedCombinationsAnalyzer:
     """통합 고급 조합 분석기 - 모든 분석 기능을 포함한 메인 클래스"""
@@ -270,10 +469,12 @@ class AdvancedCombinationsAnalyzer:
         logger.info(f"  - 캐싱: {self.config.enable_caching}")
 
     def _get_dataframe_hash(self, df: pd.DataFrame) -> str:
-        """데이터프레임 해시 생성"""
+        """데이터프레임 해시 생성 (스키마와 내용 모두 반영)"""
         try:
-            info_str = f"{df.shape}_{list(df.columns)}_{df.dtypes.to_dict()}"
-            return hashlib.md5(info_str.encode()).hexdigest()[:16]
+            hasher = hashlib.blake2b(digest_size=8)
+            hasher.update(f"{df.shape}_{list(df.columns)}_{df.dtypes.to_dict()}".encode())
+            hasher.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+            return hasher.hexdigest()
         except Exception:
             return str(hash(str(df.shape)))
 
@@ -282,31 +483,38 @@ class AdvancedCombinationsAnalyzer:
         if not self.config.memory_optimization:
             return df
 
+        # Arrow 기반 dtype은 이미 압축된 형태라 다운캐스팅이 오히려 손해
+        if self.config.memory_optimization == 'auto' and _has_arrow_dtypes(df):
+            return df
+
         with self.performance_monitor.track_operation("dataframe_optimization"):
             return self.memory_optimizer.optimize_dataframe(df)
 
-    def _sample_dataframe_if_needed(self, df: pd.DataFrame) -> pd.DataFrame:
-        """큰 데이터셋 샘플링"""
-        if len(df) <= self.config.sample_cap:
+    def _sample_dataframe_if_needed(self, df: pd.DataFrame, sampled: bool = False) -> pd.DataFrame:
+        """큰 데이터셋 샘플링 (읽는 단계에서 이미 표본을 뽑았다면 그대로 사용)"""
+        if sampled or len(df) <= self.config.sample_cap:
             return df
 
         logger.info(f"데이터셋이 너무 큽니다 ({len(df):,}행). {self.config.sample_cap:,}행으로 샘플링합니다.")
         return df.sample(n=self.config.sample_cap, random_state=42)
 
-    def analyze_all_combinations(self, df: pd.DataFrame, dsl_tokens: List[str] = None) -> Dict[str, Any]:
-        """모든 조합 분석 수행"""
+    def analyze_all_combinations(self, df: pd.DataFrame, dsl_tokens: List[str] = None,
+                                 sampled: bool = False) -> Dict[str, Any]:
+        """모든 조합 분석 수행 (sampled=True면 이미 표본 추출된 데이터로 간주)"""
         with self.performance_monitor.track_operation("full_analysis"):
             # 데이터프레임 전처리
             df = self._optimize_dataframe_if_needed(df)
-            df = self._sample_dataframe_if_needed(df)
+            df = self._sample_dataframe_if_needed(df, sampled)
 
             # DSL 토큰이 제공된 경우 해당 컬럼만 분석
             if dsl_tokens:
-                available_columns = [col for col in df.columns if any(token in col for token in dsl_tokens)]
+                available_columns = _select_dsl_columns(df.columns, dsl_tokens)
                 if available_columns:
                     df = df[available_columns]
                     logger.info(f"DSL 토큰 기반 컬럼 필터링: {len(available_columns)}개 컬럼")
 
+            schema = self._build_schema(df)
+
             results = {
                 "metadata": {
                     "total_rows": len(df),
@@ -314,9 +522,9 @@ class AdvancedCombinationsAnalyzer:
                     "analysis_timestamp": datetime.now().isoformat(),
                     "config": asdict(self.config)
                 },
-                "numerical_combinations": self._analyze_numerical_combinations(df),
-                "categorical_combinations": self._analyze_categorical_combinations(df),
-                "mixed_combinations": self._analyze_mixed_combinations(df)
+                "numerical_combinations": self._analyze_numerical_combinations(df, schema=schema),
+                "categorical_combinations": self._analyze_categorical_combinations(df, schema=schema),
+                "mixed_combinations": self._analyze_mixed_combinations(df, schema=schema)
             }
 
             # 성능 정보 추가
@@ -324,9 +532,35 @@ class AdvancedCombinationsAnalyzer:
 
             return results
 
-    def _analyze_numerical_combinations(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _build_schema(self, df: pd.DataFrame) -> _ColSchema:
+        """dtype 분류, 카디널리티 확인, 범주 코드 변환을 한 번에 수행"""
+        numerical = df.select_dtypes(include=[np.number]).columns.tolist()
+        object_like = [
+            col for col, dtype in df.dtypes.items()
+            if col not in numerical and not pd.api.types.is_bool_dtype(dtype)
+            and (isinstance(dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(dtype))
+        ]
+
+        factorized = _factorize_columns(df, object_like)
+        categorical = [col for col in object_like if factorized[col][1] <= self.config.max_cardinality]
+
+        return _ColSchema(
+            numerical=numerical,
+            categorical=categorical,
+            codes={col: factorized[col][0] for col in categorical},
+            ncats={col: factorized[col][1] for col in categorical},
+            categories={col: factorized[col][2] for col in categorical},
+            code_array=np.stack([factorized[col][0] for col in categorical]) if categorical
+            else np.empty((0, len(df)), dtype=np.int32),
+            ncat_array=np.array([factorized[col][1] for col in categorical], dtype=np.int64),
+            # 열 우선(Fortran) 배열: num_array.T가 (컬럼, 행) 연속 메모리가 되어 쌍별 커널에 그대로 전달
+            num_array=np.asfortranarray(df[numerical].to_numpy(dtype=np.float32, na_value=np.nan))
+        )
+
+    def _analyze_numerical_combinations(self, df: pd.DataFrame, schema: Optional[_ColSchema] = None) -> Dict[str, Any]:
         """수치형 컬럼 간 조합 분석"""
-        numerical_columns = df.select_dtypes(include=[np.number]).columns.tolist()
+        schema = schema or self._build_schema(df)
+        numerical_columns = schema.numerical
         
         if len(numerical_columns) < 2:
             return {"error": "수치형 컬럼이 2개 미만입니다"}
@@ -342,35 +576,52 @@ class AdvancedCombinationsAnalyzer:
                     logger.info("수치형 분석 캐시 결과 사용")
                     return cached_result
 
-            # 상관관계 분석
-            correlation_matrix = df[numerical_columns].corr()
+            # 상관관계 분석 (연속 float32 배열에서 한 번에 계산)
+            arr = schema.num_array
+            if np.isnan(arr).any():
+                # 결측치가 있으면 쌍별(pairwise) 결측 제거 방식을 행렬곱으로 계산
+                corr = _masked_corrcoef(arr)
+            else:
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    corr = np.corrcoef(arr, rowvar=False)
             
-            # 강한 상관관계 찾기
-            strong_correlations = []
-            for i in range(len(numerical_columns)):
-                for j in range(i+1, len(numerical_columns)):
-                    corr_value = correlation_matrix.iloc[i, j]
-                    if abs(corr_value) >= self.config.correlation_threshold:
-                        strong_correlations.append({
-                            "column1": numerical_columns[i],
-                            "column2": numerical_columns[j],
-                            "correlation": float(corr_value),
-                            "strength": "강함" if abs(corr_value) >= 0.7 else "보통",
-                            "direction": "양의 상관관계" if corr_value > 0 else "음의 상관관계"
-                        })
-
-            # 상관관계 순으로 정렬
-            strong_correlations.sort(key=lambda x: abs(x["correlation"]), reverse=True)
+            # 강한 상관관계 찾기 (상삼각 성분만, 대각선 제외)
+            iu = np.triu_indices(len(numerical_columns), k=1)
+            vals = corr[iu]
+            abs_vals = np.abs(vals)
+            strong_idx = np.nonzero(abs_vals >= self.config.correlation_threshold)[0]
+            strong_idx = strong_idx[np.argsort(-abs_vals[strong_idx], kind='stable')]
+            top = strong_idx[:self.config.top_k]
+
+            # 상위 K개 쌍의 라벨을 한 번에 계산
+            strengths = np.where(abs_vals[top] >= 0.7, "강함", "보통").tolist()
+            directions = np.where(vals[top] > 0, "양의 상관관계", "음의 상관관계").tolist()
+            strong_correlations = [
+                {
+                    "column1": numerical_columns[i],
+                    "column2": numerical_columns[j],
+                    "correlation": value,
+                    "strength": strength,
+                    "direction": direction
+                }
+                for i, j, value, strength, direction in zip(
+                    iu[0][top], iu[1][top], vals[top].tolist(), strengths, directions
+                )
+            ]
+            valid_abs = abs_vals[~np.isnan(abs_vals)]
 
             result = {
                 "total_combinations": len(numerical_columns) * (len(numerical_columns) - 1) // 2,
-                "strong_correlations_count": len(strong_correlations),
-                "strong_correlations": strong_correlations[:self.config.top_k],
-                "correlation_matrix": correlation_matrix.round(3).to_dict(),
+                "strong_correlations_count": int(strong_idx.size),
+                "strong_correlations": strong_correlations,
+                "correlation_matrix": {
+                    "columns": numerical_columns,
+                    "values": np.round(corr, 3).tolist()
+                },
                 "summary": {
-                    "max_correlation": float(correlation_matrix.abs().max().max()) if len(strong_correlations) > 0 else 0,
-                    "avg_correlation": float(correlation_matrix.abs().mean().mean()),
-                    "highly_correlated_pairs": len([c for c in strong_correlations if abs(c["correlation"]) >= 0.7])
+                    "max_correlation": float(valid_abs.max()) if valid_abs.size else 0,
+                    "avg_correlation": float(valid_abs.mean()) if valid_abs.size else 0,
+                    "highly_correlated_pairs": int(np.count_nonzero(abs_vals >= 0.7))
                 }
             }
 
@@ -380,15 +631,11 @@ class AdvancedCombinationsAnalyzer:
 
             return result
 
-    def _analyze_categorical_combinations(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_categorical_combinations(self, df: pd.DataFrame, schema: Optional[_ColSchema] = None) -> Dict[str, Any]:
         """범주형 컬럼 간 조합 분석"""
-        categorical_columns = df.select_dtypes(include=['object', 'category']).columns.tolist()
-        
-        # 카디널리티가 너무 높은 컬럼 제외
-        categorical_columns = [
-            col for col in categorical_columns 
-            if df[col].nunique() <= self.config.max_cardinality
-        ]
+        schema = schema or self._build_schema(df)
+        # 카디널리티가 너무 높은 컬럼은 스키마에서 이미 제외됨
+        categorical_columns = schema.categorical
         
         if len(categorical_columns) < 2:
             return {"error": "적절한 범주형 컬럼이 2개 미만입니다"}
@@ -404,57 +651,35 @@ class AdvancedCombinationsAnalyzer:
                     logger.info("범주형 분석 캐시 결과 사용")
                     return cached_result
 
-            associations = []
-            
-            for i in range(len(categorical_columns)):
-                for j in range(i+1, len(categorical_columns)):
-                    col1, col2 = categorical_columns[i], categorical_columns[j]
-                    
-                    try:
-                        # 교차표 생성
-                        crosstab = pd.crosstab(df[col1], df[col2])
-                        
-                        # 카이제곱 검정 (scipy가 있는 경우만)
-                        if HAS_SCIPY:
-                            chi2, p_value, dof, expected = chi2_contingency(crosstab)
-                            
-                            # Cramér's V 계산
-                            n = crosstab.sum().sum()
-                            cramers_v = np.sqrt(chi2 / (n * (min(crosstab.shape) - 1)))
-                        else:
-                            chi2, p_value, cramers_v = 0, 1, 0
-                        
-                        # 연관 규칙 계산
-                        rules = self._calculate_association_rules(crosstab)
-                        
-                        association = {
-                            "column1": col1,
-                            "column2": col2,
-                            "chi2_statistic": float(chi2),
-                            "p_value": float(p_value),
-                            "cramers_v": float(cramers_v),
-                            "association_strength": self._get_association_strength(cramers_v),
-                            "significant": p_value < 0.05,
-                            "top_rules": rules[:5]
-                        }
-                        
-                        associations.append(association)
-                        
-                    except Exception as e:
-                        logger.warning(f"범주형 분석 오류 ({col1} vs {col2}): {e}")
-                        continue
-
-            # 강도순으로 정렬
-            associations.sort(key=lambda x: x["cramers_v"], reverse=True)
+            # 모든 쌍의 카이제곱/Cramér's V를 커널로 한 번에 계산
+            pi, pj = np.triu_indices(len(categorical_columns), k=1)
+            chi2, dof, cramers_v, nobs = self._run_kernel(
+                cat_pairs, (schema.code_array, schema.ncat_array), pi, pj
+            )
+            valid = np.nonzero(nobs > 0)[0]
+            cramers_v = cramers_v[valid]
+            if HAS_SCIPY:
+                p_values = np.where(dof[valid] > 0, chi2_dist.sf(chi2[valid], np.maximum(dof[valid], 1)), 1.0)
+            else:
+                p_values = np.ones(valid.size)
+
+            # 강도순으로 정렬 후 상위 K개 쌍만 연관 규칙까지 상세 계산
+            top = np.argsort(-cramers_v, kind='stable')[:self.config.top_k]
+            strengths = self._get_association_strength(cramers_v[top]).tolist()
+            pairs = [
+                (categorical_columns[pi[k]], categorical_columns[pj[k]], strength)
+                for k, strength in zip(valid[top], strengths)
+            ]
+            associations = self._run_pairs(self._categorical_pair, schema, pairs)
 
             result = {
                 "total_combinations": len(categorical_columns) * (len(categorical_columns) - 1) // 2,
-                "significant_associations_count": len([a for a in associations if a["significant"]]),
-                "associations": associations[:self.config.top_k],
+                "significant_associations_count": int(np.count_nonzero(p_values < 0.05)),
+                "associations": associations,
                 "summary": {
-                    "max_cramers_v": float(max([a["cramers_v"] for a in associations])) if associations else 0,
-                    "avg_cramers_v": float(np.mean([a["cramers_v"] for a in associations])) if associations else 0,
-                    "strong_associations": len([a for a in associations if a["cramers_v"] >= 0.3])
+                    "max_cramers_v": float(cramers_v.max()) if valid.size else 0,
+                    "avg_cramers_v": float(cramers_v.mean()) if valid.size else 0,
+                    "strong_associations": int(np.count_nonzero(cramers_v >= 0.3))
                 }
             }
 
@@ -464,16 +689,13 @@ class AdvancedCombinationsAnalyzer:
 
             return result
 
-    def _analyze_mixed_combinations(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_mixed_combinations(self, df: pd.DataFrame, schema: Optional[_ColSchema] = None) -> Dict[str, Any]:
         """수치형-범주형 간 조합 분석 (ANOVA)"""
-        numerical_columns = df.select_dtypes(include=[np.number]).columns.tolist()
-        categorical_columns = df.select_dtypes(include=['object', 'category']).columns.tolist()
+        schema = schema or self._build_schema(df)
+        numerical_columns = schema.numerical
         
-        # 카디널리티 제한
-        categorical_columns = [
-            col for col in categorical_columns 
-            if 2 <= df[col].nunique() <= self.config.max_cardinality
-        ]
+        # 카디널리티 제한 (상한은 스키마에서 적용됨)
+        categorical_columns = [col for col in schema.categorical if schema.ncats[col] >= 2]
         
         if not numerical_columns or not categorical_columns:
             return {"error": "수치형 또는 범주형 컬럼이 부족합니다"}
@@ -492,55 +714,43 @@ class AdvancedCombinationsAnalyzer:
                     logger.info("혼합형 분석 캐시 결과 사용")
                     return cached_result
 
-            anova_results = []
-            
-            for num_col in numerical_columns:
-                for cat_col in categorical_columns:
-                    try:
-                        # 각 그룹별 데이터 준비
-                        groups = df.groupby(cat_col)[num_col].apply(list)
-                        
-                        # 최소 샘플 크기 확인
-                        if all(len(group) >= self.config.min_sample_size for group in groups):
-                            if HAS_SCIPY:
-                                f_stat, p_value = f_oneway(*groups)
-                            else:
-                                f_stat, p_value = 0, 1
-                            
-                            # 효과 크기 (eta-squared) 계산
-                            eta_squared = self._calculate_eta_squared(df, num_col, cat_col)
-                            
-                            # 그룹별 통계
-                            group_stats = df.groupby(cat_col)[num_col].agg(['mean', 'std', 'count']).round(3)
-                            
-                            anova_result = {
-                                "numerical_column": num_col,
-                                "categorical_column": cat_col,
-                                "f_statistic": float(f_stat),
-                                "p_value": float(p_value),
-                                "eta_squared": float(eta_squared),
-                                "effect_size": self._get_effect_size(eta_squared),
-                                "significant": p_value < 0.05,
-                                "group_stats": group_stats.to_dict()
-                            }
-                            
-                            anova_results.append(anova_result)
-                            
-                    except Exception as e:
-                        logger.warning(f"ANOVA 분석 오류 ({num_col} vs {cat_col}): {e}")
-                        continue
-
-            # 효과 크기순으로 정렬
-            anova_results.sort(key=lambda x: x["eta_squared"], reverse=True)
+            # 모든 쌍의 F/eta-squared를 커널로 한 번에 계산 (수치형 컬럼 우선 순서)
+            cat_index = np.array([schema.categorical.index(col) for col in categorical_columns])
+            pi = np.repeat(np.arange(len(numerical_columns)), len(categorical_columns))
+            pj = np.tile(cat_index, len(numerical_columns))
+            # 수치형 컬럼별 중심값은 범주형 컬럼과 무관하므로 한 번만 계산
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                centers = np.nan_to_num(np.nanmean(schema.num_array, axis=0, dtype=np.float64))
+            f_stat, eta_squared, ngroups, nobs, min_count = self._run_kernel(
+                mixed_pairs, (schema.num_array.T, schema.code_array, schema.ncat_array, centers), pi, pj
+            )
+            valid = np.nonzero(
+                (ngroups >= 2) & (nobs > ngroups) & (min_count >= self.config.min_sample_size)
+            )[0]
+            eta_squared = eta_squared[valid]
+            if HAS_SCIPY:
+                p_values = f_dist.sf(f_stat[valid], ngroups[valid] - 1, nobs[valid] - ngroups[valid])
+            else:
+                p_values = np.ones(valid.size)
+
+            # 효과 크기순으로 정렬 후 상위 K개 쌍만 그룹 통계까지 상세 계산
+            top = np.argsort(-eta_squared, kind='stable')[:self.config.top_k]
+            effect_sizes = self._get_effect_size(eta_squared[top]).tolist()
+            pairs = [
+                (numerical_columns[pi[k]], schema.categorical[pj[k]], effect_size)
+                for k, effect_size in zip(valid[top], effect_sizes)
+            ]
+            anova_results = self._run_pairs(self._mixed_pair, schema, pairs)
 
             result = {
                 "total_combinations": len(numerical_columns) * len(categorical_columns),
-                "significant_results_count": len([r for r in anova_results if r["significant"]]),
-                "anova_results": anova_results[:self.config.top_k],
+                "significant_results_count": int(np.count_nonzero(p_values < 0.05)),
+                "anova_results": anova_results,
                 "summary": {
-                    "max_eta_squared": float(max([r["eta_squared"] for r in anova_results])) if anova_results else 0,
-                    "avg_eta_squared": float(np.mean([r["eta_squared"] for r in anova_results])) if anova_results else 0,
-                    "large_effects": len([r for r in anova_results if r["eta_squared"] >= 0.14])
+                    "max_eta_squared": float(eta_squared.max()) if valid.size else 0,
+                    "avg_eta_squared": float(eta_squared.mean()) if valid.size else 0,
+                    "large_effects": int(np.count_nonzero(eta_squared >= 0.14))
                 }
             }
 
@@ -550,71 +760,136 @@ class AdvancedCombinationsAnalyzer:
 
             return result
 
-    def _calculate_association_rules(self, crosstab: pd.DataFrame) -> List[Dict[str, Any]]:
-        """연관 규칙 계산"""
-        rules = []
-        total = crosstab.sum().sum()
-        
-        for row_idx, row_name in enumerate(crosstab.index):
-            for col_idx, col_name in enumerate(crosstab.columns):
-                # 지지도 (Support)
-                support = crosstab.iloc[row_idx, col_idx] / total
-                
-                # 신뢰도 (Confidence)
-                confidence = crosstab.iloc[row_idx, col_idx] / crosstab.iloc[row_idx, :].sum()
-                
-                # 향상도 (Lift)
-                expected = (crosstab.iloc[row_idx, :].sum() * crosstab.iloc[:, col_idx].sum()) / total
-                lift = (crosstab.iloc[row_idx, col_idx] / expected) if expected > 0 else 0
-                
-                if lift >= self.config.lift_threshold:
-                    rules.append({
-                        "antecedent": str(row_name),
-                        "consequent": str(col_name),
-                        "support": float(support),
-                        "confidence": float(confidence),
-                        "lift": float(lift)
-                    })
-        
-        return sorted(rules, key=lambda x: x["lift"], reverse=True)
-
-    def _get_association_strength(self, cramers_v: float) -> str:
-        """연관성 강도 분류"""
-        if cramers_v >= 0.5:
-            return "매우 강함"
-        elif cramers_v >= 0.3:
-            return "강함"
-        elif cramers_v >= 0.1:
-            return "보통"
+    def _run_kernel(self, kernel, arrays: Tuple[np.ndarray, ...], pi: np.ndarray, pj: np.ndarray):
+        """쌍별 커널 실행 (numba 커널은 자체 병렬, NumPy 대체 구현은 쌍을 나눠 스레드 병렬)"""
+        pi, pj = pi.astype(np.int64), pj.astype(np.int64)
+        if HAS_NUMBA or not (self.config.parallel_processing and HAS_JOBLIB and pi.size > 1):
+            return kernel(*arrays, pi, pj)
+
+        chunks = np.array_split(np.arange(pi.size), min(self.config.max_workers, pi.size))
+        outputs = Parallel(n_jobs=self.config.max_workers, prefer='threads')(
+            delayed(kernel)(*arrays, pi[chunk], pj[chunk]) for chunk in chunks
+        )
+        return tuple(np.concatenate(parts) for parts in zip(*outputs))
+
+    def _run_pairs(self, pair_func, schema: _ColSchema, pairs: List[Tuple[str, str, str]]) -> List[Dict[str, Any]]:
+        """컬럼 쌍 분석 실행 (가능하면 스레드 병렬, 실패/제외된 쌍은 버림)"""
+        if self.config.parallel_processing and HAS_JOBLIB and len(pairs) > 1:
+            # 쌍별 커널은 NumPy C 루틴 위주라 스레드로도 병렬 효과가 있고 피클링 비용이 없음
+            outputs = Parallel(n_jobs=self.config.max_workers, prefer='threads', batch_size='auto')(
+                delayed(pair_func)(schema, *pair) for pair in pairs
+            )
         else:
-            return "약함"
+            outputs = [pair_func(schema, *pair) for pair in pairs]
+        return [output for output in outputs if output is not None]
 
-    def _calculate_eta_squared(self, df: pd.DataFrame, num_col: str, cat_col: str) -> float:
-        """효과 크기 (eta-squared) 계산"""
+    def _categorical_pair(self, schema: _ColSchema, col1: str, col2: str,
+                          strength: str) -> Optional[Dict[str, Any]]:
+        """범주형 컬럼 한 쌍의 연관성 분석"""
         try:
-            groups = df.groupby(cat_col)[num_col]
-            overall_mean = df[num_col].mean()
+            # 교차표 생성 (관측되지 않은 범주 행/열 제거)
+            n1, n2 = schema.ncats[col1], schema.ncats[col2]
+            labels1, labels2 = schema.categories[col1], schema.categories[col2]
+            ct = contingency_table(schema.codes[col1], n1, schema.codes[col2], n2)
+            row_mask = ct.sum(axis=1) > 0
+            col_mask = ct.sum(axis=0) > 0
+            ct = ct[row_mask][:, col_mask]
+            if ct.size == 0:
+                return None
             
-            # 그룹 간 제곱합 (SSB)
-            ssb = sum(len(group) * (group.mean() - overall_mean) ** 2 for _, group in groups)
+            # 카이제곱 검정 및 Cramér's V 계산
+            chi2, dof = chi2_statistic(ct)
+            n = ct.sum()
+            min_dim = min(ct.shape) - 1
+            cramers_v = np.sqrt(chi2 / (n * min_dim)) if min_dim > 0 else 0.0
+            p_value = float(chi2_dist.sf(chi2, dof)) if HAS_SCIPY and dof > 0 else 1.0
             
-            # 총 제곱합 (SST)
-            sst = sum((df[num_col] - overall_mean) ** 2)
+            # 연관 규칙 계산
+            rules = self._calculate_association_rules(ct, labels1[row_mask], labels2[col_mask])
             
-            return ssb / sst if sst > 0 else 0
-        except Exception:
-            return 0
-
-    def _get_effect_size(self, eta_squared: float) -> str:
-        """효과 크기 분류"""
-        if eta_squared >= 0.14:
-            return "큰 효과"
-        elif eta_squared >= 0.06:
-            return "중간 효과"
-        elif eta_squared >= 0.01:
-            return "작은 효과"
-        else:
-            return "효과 없음"
+            return {
+                "column1": col1,
+                "column2": col2,
+                "chi2_statistic": float(chi2),
+                "p_value": float(p_value),
+                "cramers_v": float(cramers_v),
+                "association_strength": strength,
+                "significant": p_value < 0.05,
+                "top_rules": rules[:5]
+            }
+            
+        except Exception as e:
+            logger.warning(f"범주형 분석 오류 ({col1} vs {col2}): {e}")
+            return None
+
+    def _mixed_pair(self, schema: _ColSchema, num_col: str, cat_col: str,
+                    effect_size: str) -> Optional[Dict[str, Any]]:
+        """수치형-범주형 컬럼 한 쌍의 ANOVA 분석"""
+        try:
+            x = schema.num_array[:, schema.numerical.index(num_col)]
+            stats = _anova_from_codes(x, schema.codes[cat_col], schema.ncats[cat_col], self.config.min_sample_size)
+            if stats is None:
+                return None
+
+            # 그룹별 통계
+            labels = [str(label) for label in schema.categories[cat_col][stats["present"]]]
+            group_stats = {
+                "mean": dict(zip(labels, np.round(stats["mean"], 3).tolist())),
+                "std": dict(zip(labels, np.round(stats["std"], 3).tolist())),
+                "count": dict(zip(labels, stats["count"].tolist()))
+            }
+            
+            return {
+                "numerical_column": num_col,
+                "categorical_column": cat_col,
+                "f_statistic": stats["f_statistic"],
+                "p_value": stats["p_value"],
+                "eta_squared": float(stats["eta_squared"]),
+                "effect_size": effect_size,
+                "significant": stats["p_value"] < 0.05,
+                "group_stats": group_stats
+            }
+                
+        except Exception as e:
+            logger.warning(f"ANOVA 분석 오류 ({num_col} vs {cat_col}): {e}")
+            return None
+
+    def _calculate_association_rules(self, ct: np.ndarray, row_labels: np.ndarray,
+                                     col_labels: np.ndarray) -> List[Dict[str, Any]]:
+        """연관 규칙 계산 (교차표 전체를 한 번에 벡터 연산)"""
+        total = ct.sum()
+        row_sums = ct.sum(axis=1, keepdims=True)
+        col_sums = ct.sum(axis=0, keepdims=True)
+        expected = row_sums * col_sums / total
+
+        # 지지도 (Support), 신뢰도 (Confidence), 향상도 (Lift)
+        support = ct / total
+        with np.errstate(divide='ignore', invalid='ignore'):
+            confidence = ct / row_sums
+            lift = np.where(expected > 0, ct / expected, 0.0)
+
+        rows, cols = np.nonzero(lift >= self.config.lift_threshold)
+        order = np.argsort(-lift[rows, cols], kind='stable')
+        rows, cols = rows[order], cols[order]
+
+        return [
+            {
+                "antecedent": str(row_labels[r]),
+                "consequent": str(col_labels[c]),
+                "support": float(support[r, c]),
+                "confidence": float(confidence[r, c]),
+                "lift": float(lift[r, c])
+            }
+            for r, c in zip(rows, cols)
+        ]
+
+    def _get_association_strength(self, cramers_v):
+        """연관성 강도 분류 (배열이면 구간 탐색 한 번으로 일괄 분류)"""
+        return _STRENGTH_LABELS[np.searchsorted(_STRENGTH_EDGES, cramers_v, side='right')]
+
+    def _get_effect_size(self, eta_squared):
+        """효과 크기 분류 (배열이면 구간 탐색 한 번으로 일괄 분류)"""
+        return _EFFECT_LABELS[np.searchsorted(_EFFECT_EDGES, eta_squared, side='right')]
 
     def get_analysis_summary(self, results: Dict[str, Any]) -> str:
         """분석 결과 요약 생성"""
@@ -686,11 +961,72 @@ def parse_arguments():
     
     return parser.parse_args()
 
+# 이보다 큰 CSV는 청크 단위로 읽으며 표본만 유지
+STREAM_SAMPLE_BYTES = 256 * 1024 * 1024
+
+def reservoir_sample_csv(path: str, sample_cap: int, usecols: Optional[List[str]] = None,
+                         chunksize: int = 50_000, **read_kwargs) -> pd.DataFrame:
+    """CSV를 청크 단위로 읽으며 최대 sample_cap행의 균등 무작위 표본 유지
+
+    각 행에 난수 키를 붙이고 키가 가장 작은 sample_cap개만 남기는 방식이라
+    전체 파일을 메모리에 올리지 않습니다. 저장소가 찬 뒤에는 현재 최대 키보다
+    작은 행만 후보가 되므로 청크 대부분이 바로 버려집니다.
+    """
+    rng = np.random.default_rng(42)
+    reservoir = None
+    keys = np.empty(0)
+
+    for chunk in pd.read_csv(path, usecols=usecols, chunksize=chunksize, **read_kwargs):
+        chunk_keys = rng.random(len(chunk))
+        if reservoir is not None and len(reservoir) >= sample_cap:
+            candidates = chunk_keys < keys.max()
+            chunk, chunk_keys = chunk[candidates], chunk_keys[candidates]
+            if not len(chunk):
+                continue
+
+        if reservoir is None:
+            reservoir, keys = chunk, chunk_keys
+        else:
+            reservoir = pd.concat([reservoir, chunk], ignore_index=True)
+            keys = np.concatenate([keys, chunk_keys])
+
+        if len(reservoir) > sample_cap:
+            keep = np.sort(np.argpartition(keys, sample_cap)[:sample_cap])
+            reservoir, keys = reservoir.iloc[keep].reset_index(drop=True), keys[keep]
+
+    return reservoir if reservoir is not None else pd.read_csv(path, usecols=usecols, nrows=0)
+
+def read_csv_columns(path: str, dsl_tokens: Optional[List[str]] = None,
+                     sample_cap: Optional[int] = None) -> pd.DataFrame:
+    """헤더만 먼저 읽어 DSL 토큰에 해당하는 컬럼만 로드 (가능하면 PyArrow 엔진 사용)
+
+    sample_cap이 주어지고 파일이 STREAM_SAMPLE_BYTES보다 크면 청크 단위 표본 추출로 읽고
+    결과의 attrs["sampled"]를 True로 설정합니다.
+    """
+    usecols = None
+    if dsl_tokens:
+        header = pd.read_csv(path, nrows=0).columns
+        usecols = _select_dsl_columns(header, dsl_tokens) or None
+
+    if sample_cap and os.path.getsize(path) > STREAM_SAMPLE_BYTES:
+        # PyArrow 엔진은 chunksize를 지원하지 않으므로 C 엔진으로 읽되 Arrow dtype은 유지
+        read_kwargs = {'dtype_backend': 'pyarrow'} if HAS_PYARROW else {}
+        df = reservoir_sample_csv(path, sample_cap, usecols=usecols, **read_kwargs)
+        df.attrs["sampled"] = True
+        return df
+
+    if HAS_PYARROW:
+        return pd.read_csv(path, usecols=usecols, engine='pyarrow', dtype_backend='pyarrow')
+    return pd.read_csv(path, usecols=usecols)
+
 def load_config_from_file(config_path: str) -> AnalysisConfig:
     """설정 파일에서 설정 로드"""
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config_data = json.load(f)
+        raw = Path(config_path).read_bytes()
+        if HAS_MSGSPEC:
+            # 파싱과 타입 검증을 한 번에 수행하여 데이터클래스로 바로 디코딩
+            return msgspec.json.decode(raw, type=AnalysisConfig)
+        config_data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
         return AnalysisConfig(**config_data)
     except Exception as e:
         logger.error(f"설정 파일 로드 실패: {e}")
@@ -699,12 +1035,23 @@ def load_config_from_file(config_path: str) -> AnalysisConfig:
 def setup_logging(verbose: bool = False):
     """로깅 설정"""
     level = logging.DEBUG if verbose else logging.INFO
+    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    # 파일 기록은 버퍼에 모아 한 번에 기록 (ERROR 이상이거나 버퍼가 차면 즉시 기록)
+    file_handler = logging.FileHandler('combinations_analysis.log', encoding='utf-8', delay=True)
+    # MemoryHandler는 레코드만 넘기므로 포맷은 실제로 기록하는 핸들러에 지정
+    file_handler.setFormatter(logging.Formatter(log_format))
+    buffered_handler = logging.handlers.MemoryHandler(
+        1024, flushLevel=logging.ERROR, target=file_handler
+    )
+    atexit.register(buffered_handler.flush)
+    # 모듈 임포트 시 basicConfig가 이미 핸들러를 붙였으므로 force로 교체 (없으면 아무 일도 하지 않음)
     logging.basicConfig(
+        force=True,
         level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        format=log_format,
         handlers=[
             logging.StreamHandler(),
-            logging.FileHandler('combinations_analysis.log', encoding='utf-8')
+            buffered_handler
         ]
     )
 
@@ -725,32 +1072,41 @@ def main():
                 parallel_processing=not args.no_parallel
             )
         
-        # 데이터 로드
-        logger.info(f"데이터 파일 로드: {args.file}")
-        if args.file.endswith('.csv'):
-            df = pd.read_csv(args.file)
-        elif args.file.endswith('.xlsx'):
-            df = pd.read_excel(args.file)
-        else:
-            raise ValueError("지원되지 않는 파일 형식 (CSV, XLSX만 지원)")
-        
         # DSL 토큰 파싱
         dsl_tokens = None
         if args.dsl_tokens:
             dsl_tokens = [token.strip() for token in args.dsl_tokens.split(',')]
             logger.info(f"DSL 토큰: {dsl_tokens}")
         
+        # 데이터 로드 (CSV는 필요한 컬럼만)
+        logger.info(f"데이터 파일 로드: {args.file}")
+        if args.file.endswith('.csv'):
+            df = read_csv_columns(args.file, dsl_tokens, sample_cap=config.sample_cap)
+        elif args.file.endswith('.xlsx'):
+            # Rust 기반 calamine 리더가 있으면 사용 (기본 openpyxl은 순수 파이썬)
+            excel_kwargs = {"dtype_backend": "pyarrow"} if HAS_PYARROW else {}
+            if HAS_CALAMINE:
+                df = pd.read_excel(args.file, engine="calamine", **excel_kwargs)
+            else:
+                df = pd.read_excel(args.file, **excel_kwargs)
+        else:
+            raise ValueError("지원되지 않는 파일 형식 (CSV, XLSX만 지원)")
+        
         # 분석 실행
         analyzer = AdvancedCombinationsAnalyzer(config)
-        results = analyzer.analyze_all_combinations(df, dsl_tokens)
+        results = analyzer.analyze_all_combinations(df, dsl_tokens, sampled=df.attrs.get("sampled", False))
         
         # 결과 출력
         print(analyzer.get_analysis_summary(results))
         
         # 결과 저장
         if args.output:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False, default=str)
+            if HAS_ORJSON:
+                options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                Path(args.output).write_bytes(orjson.dumps(results, option=options, default=str))
+            else:
+                with open(args.output, 'w', encoding='utf-8') as f:
+                    json.dump(results, f, indent=2, ensure_ascii=False, default=str)
             logger.info(f"결과 저장 완료: {args.output}")
         
         return 0
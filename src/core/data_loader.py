@@ -2,11 +2,35 @@
 from __future__ import annotations
 from typing import Optional, Dict, Any
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 import logging
+import os
+import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
 
 from src.utils import AppState
 
+# pyarrow CSV 리더의 파싱 오류 (pandas 파싱 오류와 동일하게 처리)
+_ARROW_PARSE_ERRORS = (pa.ArrowInvalid,) if HAS_PYARROW else ()
+
+# pd.read_csv 기본 결측 표기 (Arrow 리더도 같은 값을 결측으로 읽도록)
+NA_VALUES = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+             '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null']
+
+# 대용량 파일에서 읽을 최대 행 수 / 메모리 부족 시 프리뷰 행 수
+MAX_ROWS_LARGE_FILE = 1_000_000
+PREVIEW_ROWS = 50000
+
 def _infer_engine() -> str:
     # Try pyarrow if installed; fallback to c engine
     try:
@@ -15,29 +39,136 @@ def _infer_engine() -> str:
     except Exception:
         return "c"
 
+# 설치 여부는 실행 중 바뀌지 않으므로 임포트 시 한 번만 판단
+_ENGINE = _infer_engine()
+
+def _arrow_column_types(dtype_map: Optional[Dict[str, str]]) -> Optional[Dict[str, Any]]:
+    """pandas dtype 지정을 Arrow 컬럼 타입으로 변환 (변환할 수 없는 항목은 제외)"""
+    if not dtype_map:
+        return None
+    column_types = {}
+    for col, dtype in dtype_map.items():
+        if dtype in ("str", "string", "object", "category"):
+            column_types[col] = pa.string()
+            continue
+        try:
+            column_types[col] = pa.from_numpy_dtype(np.dtype(dtype))
+        except (TypeError, pa.ArrowNotImplementedError):
+            pass
+    return column_types
+
+def _read_csv_arrow(p: Path, dtype_map: Optional[Dict[str, str]] = None,
+                    max_rows: Optional[int] = None) -> pd.DataFrame:
+    """pyarrow 멀티스레드 CSV 리더로 로드 (max_rows가 있으면 배치 단위로 필요한 만큼만 읽음)"""
+    column_types = _arrow_column_types(dtype_map)
+    read_options = pacsv.ReadOptions(use_threads=True, block_size=8 << 20)
+    # Arrow는 기본적으로 문자열 컬럼에 결측 표기를 적용하지 않으므로 pandas와 같이 결측으로 읽도록 지정
+    convert_options = pacsv.ConvertOptions(column_types=column_types, null_values=NA_VALUES,
+                                           strings_can_be_null=True)
+
+    if max_rows is None:
+        table = pacsv.read_csv(p, read_options=read_options, convert_options=convert_options)
+    else:
+        # 메모리 맵 + 스트리밍 리더: 필요한 블록까지만 파싱하고 멈춤
+        try:
+            with pa.memory_map(str(p), "r") as source:
+                reader = pacsv.open_csv(source, read_options=read_options, convert_options=convert_options)
+                batches, rows = [], 0
+                for batch in reader:
+                    batches.append(batch)
+                    rows += batch.num_rows
+                    if rows >= max_rows:
+                        break
+                table = pa.Table.from_batches(batches, schema=reader.schema).slice(0, max_rows)
+        except pa.ArrowInvalid:
+            # 스트리밍 리더는 첫 블록으로 타입을 고정하므로, 뒤 블록의 타입이 다르면 C 엔진으로 다시 읽음
+            # (low_memory=False: 청크마다 타입을 따로 추론해 int와 str이 섞인 컬럼이 되지 않도록)
+            return pd.read_csv(p, dtype=dtype_map, nrows=max_rows, engine="c",
+                               dtype_backend="pyarrow", low_memory=False)
+
+    df = table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True, split_blocks=True)
+    if dtype_map:
+        # category 및 Arrow 타입으로 옮길 수 없는 지정은 pandas에서 적용
+        df = df.astype({
+            col: dtype for col, dtype in dtype_map.items()
+            if col in df and (dtype == "category" or col not in column_types)
+        })
+    return df
+
+def _load_preview(p: Path, dtype_map: Optional[Dict[str, str]] = None,
+                  nrows: int = PREVIEW_ROWS) -> pd.DataFrame:
+    """앞부분 nrows행만 읽은 최적화된 프리뷰"""
+    if HAS_PYARROW:
+        try:
+            return _read_csv_arrow(p, dtype_map, nrows)
+        except _ARROW_PARSE_ERRORS:
+            pass  # 앞쪽 블록에 Arrow가 처리하지 못하는 행이 있으면 pandas C 엔진으로 재시도
+    # pyarrow가 있으면 C 엔진으로 파싱하되 결과는 Arrow 기반 컬럼으로 받음
+    backend_kwargs = {"dtype_backend": "pyarrow"} if HAS_PYARROW else {}
+    df = pd.read_csv(p, dtype=dtype_map, nrows=nrows, engine="c", **backend_kwargs)
+    return _optimize_if_untyped(df, HAS_PYARROW, dtype_map)
+
 def load_csv(state: AppState, path: str | Path, dtype_map: Optional[Dict[str, str]] = None, nrows: Optional[int] = None) -> AppState:
     """최적화된 CSV 로딩 함수"""
     return load_csv_optimized(state, path, dtype_map, nrows, chunk_size=50000)
 
+# 문자열 컬럼 카디널리티는 이 행 수 이하의 표본으로 추정
+CARDINALITY_SAMPLE_ROWS = 50_000
+
 def optimize_dtypes(df: pd.DataFrame) -> pd.DataFrame:
     """데이터 타입을 메모리 효율적으로 최적화"""
+    n = len(df)
     for col in df.columns:
-        if df[col].dtype == 'object':
-            # 문자열 컬럼 최적화
-            num_unique = df[col].nunique()
-            num_total = len(df[col])
-            
-            if num_unique / num_total < 0.5:  # 50% 미만 고유값
+        dtype = df[col].dtype
+        if isinstance(dtype, pd.ArrowDtype):
+            continue  # Arrow 기반 컬럼은 이미 연속 버퍼 + 최소 타입
+        if dtype == 'object':
+            # 문자열 컬럼 최적화 (큰 데이터는 표본의 고유값 비율로 판단)
+            sample = df[col] if n <= CARDINALITY_SAMPLE_ROWS else df[col].sample(CARDINALITY_SAMPLE_ROWS, random_state=0)
+            if len(sample) and sample.nunique() / len(sample) < 0.5:  # 50% 미만 고유값
                 df[col] = df[col].astype('category')
-        elif df[col].dtype == 'int64':
+        elif dtype == 'int64':
             # 정수 타입 다운캐스팅
             df[col] = pd.to_numeric(df[col], downcast='integer')
-        elif df[col].dtype == 'float64':
+        elif dtype == 'float64':
             # 실수 타입 다운캐스팅
             df[col] = pd.to_numeric(df[col], downcast='float')
     
     return df
 
+def _optimize_if_untyped(df: pd.DataFrame, arrow_loaded: bool,
+                         dtype_map: Optional[Dict[str, str]]) -> pd.DataFrame:
+    """타입이 이미 정해진 경우(Arrow 로드, dtype_map 지정) 카디널리티 추론을 생략"""
+    if arrow_loaded or dtype_map:
+        logging.debug("Skipping dtype optimization (types from %s)",
+                      "pyarrow" if arrow_loaded else "dtype_map")
+        return df
+    return optimize_dtypes(df)
+
+def _concat_optimized_chunks(chunks: list) -> pd.DataFrame:
+    """청크별로 최적화된 프레임 결합 (한 청크라도 범주형이면 범주를 합집합으로 통일)"""
+    df = pd.concat(chunks, ignore_index=True)
+    for col in df.columns:
+        parts = [chunk[col] for chunk in chunks]
+        if any(isinstance(part.dtype, pd.CategoricalDtype) for part in parts) and \
+                not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = union_categoricals([part.astype("category") for part in parts])
+    return df
+
+def _read_csv_chunks(p: Path, dtype_map: Optional[Dict[str, str]],
+                     chunk_size: int, engine: str) -> pd.DataFrame:
+    """최대 행 수까지 청크 단위로 읽고, 청크마다 스레드 풀에서 타입 최적화"""
+    with pd.read_csv(p, chunksize=chunk_size, dtype=dtype_map, engine=engine) as reader:
+        # 최대 행 수를 처음 넘는 청크까지 읽음
+        chunks = islice(reader, MAX_ROWS_LARGE_FILE // chunk_size + 1)
+        if dtype_map:
+            logging.debug("Skipping dtype optimization (types from dtype_map)")
+            return pd.concat(list(chunks), ignore_index=True)
+        # 다운캐스팅/고유값 계산은 pandas C 코드에서 GIL을 놓으므로 다음 청크 파싱과 겹쳐 실행됨
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            optimized = list(executor.map(optimize_dtypes, chunks))
+    return _concat_optimized_chunks(optimized)
+
 def load_csv_optimized(state: AppState, path: str | Path, 
                       dtype_map: Optional[Dict[str, str]] = None, 
                       nrows: Optional[int] = None,
@@ -47,37 +178,36 @@ def load_csv_optimized(state: AppState, path: str | Path,
     if not p.exists() or p.suffix.lower() != ".csv":
         raise ValueError("Please select a valid .csv file")
     
-    engine = _infer_engine()
+    engine = _ENGINE
     state.preview_only = False
     state.file_size = p.stat().st_size
     
+    # 대용량 파일은 최대 행 수까지만 로드
+    large_file = bool(chunk_size) and state.file_size > 100 * 1024 * 1024  # 100MB 이상
+    max_rows = MAX_ROWS_LARGE_FILE if large_file else nrows
+
     try:
-        # 대용량 파일은 청크 단위로 로드
-        if chunk_size and p.stat().st_size > 100 * 1024 * 1024:  # 100MB 이상
-            chunks = []
-            for chunk in pd.read_csv(p, chunksize=chunk_size, dtype=dtype_map, engine=engine):
-                chunks.append(chunk)
-                # 메모리 사용량 모니터링
-                if len(chunks) * chunk_size > 1000000:  # 100만 행 이상
-                    break
-            df = pd.concat(chunks, ignore_index=True)
+        if HAS_PYARROW:
+            # 블록(block_size) 단위 병렬 파싱, 청크 리스트 없이 Arrow 테이블에서 바로 변환
+            df = _read_csv_arrow(p, dtype_map, max_rows)
+            df = _optimize_if_untyped(df, True, dtype_map)
+        elif large_file:
+            # 청크별 타입 최적화가 읽기와 함께 진행되므로 전체 프레임 재순회 없음
+            df = _read_csv_chunks(p, dtype_map, chunk_size, engine)
         else:
             df = pd.read_csv(p, dtype=dtype_map, nrows=nrows, engine=engine)
-        
-        # 데이터 타입 최적화 적용
-        df = optimize_dtypes(df)
+            # 데이터 타입 최적화 적용
+            df = _optimize_if_untyped(df, False, dtype_map)
         
     except MemoryError:
         # 메모리 부족 시 프리뷰 모드로 전환
-        df = pd.read_csv(p, dtype=dtype_map, nrows=50000, engine=engine)
-        df = optimize_dtypes(df)
+        df = _load_preview(p, dtype_map)
         state.preview_only = True
         
-    except (pd.errors.ParserError, pd.errors.EmptyDataError, UnicodeDecodeError) as err:
+    except (pd.errors.ParserError, pd.errors.EmptyDataError, UnicodeDecodeError, *_ARROW_PARSE_ERRORS) as err:
         # 파싱 오류 시에도 프리뷰 모드
         if state.file_size > 200 * 1024 * 1024 and nrows is None:
-            df = pd.read_csv(p, dtype=dtype_map, nrows=50000, engine=engine)
-            df = optimize_dtypes(df)
+            df = _load_preview(p, dtype_map)
             state.preview_only = True
             logging.warning("Failed to read full CSV (%s); loaded optimized preview instead.", err)
         else:
@@ -90,25 +220,53 @@ def load_csv_optimized(state: AppState, path: str | Path,
     state.numeric_cols = df.select_dtypes(include=["number"]).columns.tolist()
     return state
 
+def _arrow_filter_mask(s: pd.Series, condition: str, value: str) -> Optional[np.ndarray]:
+    """Arrow 기반 컬럼은 pyarrow.compute 커널로 필터 마스크 계산 (해당 없으면 None)"""
+    if not HAS_PYARROW or not isinstance(s.dtype, pd.ArrowDtype):
+        return None
+    arr = s.array.__arrow_array__()
+    arrow_type = s.dtype.pyarrow_dtype
+    is_string = pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type)
+    is_numeric = pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type)
+
+    if condition == "Contains" and is_string:
+        mask = pc.match_substring_regex(arr, value, ignore_case=True)
+    elif condition == "Equals" and is_string:
+        mask = pc.equal(arr, value)
+    elif condition in ("Greater Than", "Less Than") and is_numeric:
+        compare = pc.greater if condition == "Greater Than" else pc.less
+        mask = compare(pc.cast(arr, pa.float64()), float(value))
+    else:
+        return None
+    return pc.fill_null(mask, False).to_numpy(zero_copy_only=False)
+
+def _pandas_filter_mask(df: pd.DataFrame, column: str, condition: str, value: str) -> pd.Series | np.ndarray:
+    """pandas 연산으로 필터 마스크 계산 (object 등 Arrow 외 컬럼)"""
+    if condition == "Equals":
+        return df[column].astype(str) == value
+    elif condition == "Greater Than":
+        return pd.to_numeric(df[column], errors="coerce") > float(value)
+    elif condition == "Less Than":
+        return pd.to_numeric(df[column], errors="coerce") < float(value)
+    elif condition == "Contains":
+        return df[column].astype(str).str.contains(value, case=False, na=False)
+    return np.ones(len(df), dtype=bool)
+
 def apply_filter(state: AppState, column: str, condition: str, value: str) -> AppState:
     if state.df is None:
         return state
     df = state.df
     try:
-        if condition == "Equals":
-            mask = df[column].astype(str) == value
-        elif condition == "Greater Than":
-            mask = pd.to_numeric(df[column], errors="coerce") > float(value)
-        elif condition == "Less Than":
-            mask = pd.to_numeric(df[column], errors="coerce") < float(value)
-        elif condition == "Contains":
-            mask = df[column].astype(str).str.contains(value, case=False, na=False)
-        else:
-            mask = pd.Series([True] * len(df), index=df.index)
-        state.filtered_df = df[mask].copy()
+        # Arrow 문자열/숫자 컬럼은 C++ 커널로, 그 외는 기존 pandas 경로로 처리
+        mask = _arrow_filter_mask(df[column], condition, value)
+        if mask is None:
+            mask = _pandas_filter_mask(df, column, condition, value)
+        # 불리언 인덱싱 결과는 이미 새 프레임이므로 추가 복사 없이 보관
+        # (filtered_df는 읽기 전용으로 사용 - 수정이 필요하면 호출 측에서 복사)
+        state.filtered_df = df.loc[np.asarray(mask, dtype=bool)]
     except Exception:
         # On any error, keep no filter rather than crashing
-        state.filtered_df = df.copy()
+        state.filtered_df = df
     state.page_index = 0
     return state
 
@@ -0,0 +1,57 @@
+"""
+DSL 시퀀스 예측용 LSTM 인코더-디코더 모델 정의
+
+torch 로딩 비용이 크므로 inference_dsl에서 모델이 처음 필요할 때만 임포트합니다.
+"""
+import torch
+import torch.nn as nn
+
+from .inference_dsl import PAD_IDX, SOS_IDX, EOS_IDX
+
+class LSTMEncoderDecoder(nn.Module):
+    # TorchScript는 모듈 전역 변수를 읽지 못하므로 특수 토큰 인덱스는 상수 속성으로 보관
+    __constants__ = ['sos_idx', 'eos_idx']
+
+    def __init__(self, vocab_size, embed_dim=64, hidden_dim=128):
+        super().__init__()
+        self.sos_idx = SOS_IDX
+        self.eos_idx = EOS_IDX
+        self.embed = nn.Embedding(vocab_size, embed_dim, padding_idx=PAD_IDX)
+        self.encoder = nn.LSTM(embed_dim, hidden_dim, batch_first=True)
+        self.decoder = nn.LSTM(embed_dim, hidden_dim, batch_first=True)
+        self.fc_out = nn.Linear(hidden_dim, vocab_size)
+
+    def forward(self, x):
+        emb = self.embed(x)
+        _, (h, c) = self.encoder(emb)
+        dec_input = torch.full((x.size(0), 1), self.sos_idx, dtype=torch.long, device=x.device)
+        outputs = []
+
+        for _ in range(x.size(1)):
+            dec_emb = self.embed(dec_input)
+            out, (h, c) = self.decoder(dec_emb, (h, c))
+            logits = self.fc_out(out)
+            outputs.append(logits)
+            dec_input = logits.argmax(dim=-1)
+
+        return torch.cat(outputs, dim=1)
+
+    @torch.jit.export
+    def generate(self, x: torch.Tensor, max_len: int = 10) -> torch.Tensor:
+        # 호출 측에서 eval 모드 + torch.inference_mode() 안에서 실행 (TorchScript 호환 유지)
+        emb = self.embed(x)
+        _, (h, c) = self.encoder(emb)
+        # SOS 임베딩은 한 번만 계산하고, 예측 결과는 미리 할당한 텐서에 바로 기록
+        sos = torch.full((x.size(0), 1), self.sos_idx, dtype=torch.long, device=x.device)
+        dec_emb = self.embed(sos)
+        preds = torch.empty((x.size(0), max_len), dtype=torch.long, device=x.device)
+
+        for t in range(max_len):
+            out, (h, c) = self.decoder(dec_emb, (h, c))
+            pred = self.fc_out(out).argmax(dim=-1)
+            preds[:, t] = pred.squeeze(1)
+            if bool((pred == self.eos_idx).all()):
+                return preds[:, :t + 1]
+            dec_emb = self.embed(pred)
+
+        return preds
@@ -2,7 +2,12 @@
 # dsl2code.py
 # Convert DSL token sequence (e.g., ["C1", "C2", "C6"]) to executable Python code
 
-token_code_map = {
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+
+# 읽기 전용 매핑 (렌더링 결과를 캐시하므로 런타임 변경을 막음)
+token_code_map = MappingProxyType({
     "C1": "df.describe()",
     "C2": "df.info()",
     "C3": "df.isnull().sum()",
@@ -61,8 +66,96 @@ token_code_map = {
     "SAVE": "save_results",  # 결과 저장 트리거
     "EXPORT": "df.to_csv('analyzed_data.csv', index=False)",  # CSV 내보내기
     "PROFILE": "df.profile_report() if 'profile_report' in dir(df) else print('pandas_profiling not available')",  # 프로파일링
+})
+
+# 토큰 설명 (모듈 로드 시 한 번만 생성)
+_TOKEN_DESCRIPTIONS = {
+    "C1": "기술통계 요약",
+    "C2": "데이터 정보",
+    "C3": "결측치 개수",
+    "C4": "데이터 타입",
+    "C5": "고유값 개수",
+    "C6": "상위 5행",
+    "C7": "하위 5행",
+    "C8": "상관관계 행렬",
+    "C9": "컬럼 목록",
+    "C10": "메모리 사용량",
+    "C11": "결측치 비율",
+    "C12": "상관관계 히트맵",
+    "C13": "첫 번째 컬럼 값 분포",
+    "C14": "전체 기술통계",
+    "C15": "데이터 크기",
+    "C16": "중복행 개수",
+    "C17": "랜덤 샘플 10개",
+    "C18": "각 컬럼별 고유값",
+    "C19": "데이터 전치",
+    "C20": "인덱스 정보",
+    "C21": "결측치 포함 행",
+    "C22": "각 컬럼별 최빈값",
+    "C23": "수치형 히스토그램",
+    "C24": "범주형 값 분포",
+    "C25": "상관계수 상위 5개",
+    "C26": "첫 컬럼 기준 그룹별 평균",
+    "C27": "엑셀 파일로 저장",
+    "C28": "JSON 파일로 저장",
+    "C29": "표준편차",
+    "C30": "최대/최소값",
+    "C31": "모든 값이 0인 행",
+    "C32": "중복 행 개수",
+    "C33": "유효값 개수",
+    "C34": "고유 인덱스 개수",
+    "C35": "수치형 변수 간 관계도",
+    "C36": "오름차순 정렬",
+    "C37": "내림차순 정렬",
+    "C38": "메모리 사용량(MB)",
+    "C39": "컬럼 정보 요약",
+    "C40": "음수값 행 개수",
+    "C41": "왜도 분석",
+    "C42": "첨도 분석",
+    "C43": "사분위수",
+    "C44": "수치형 최빈값",
+    "C45": "고유값 비율",
+    "C46": "컬럼별 중복값",
+    "C47": "박스플롯 시각화",
+    "C48": "결측치 컬럼 목록",
+    "C49": "교차표 분석",
+    "C50": "조합 분석",
+    "SAVE": "결과 저장",
+    "EXPORT": "CSV 내보내기",
+    "PROFILE": "데이터 프로파일링"
+}
+
+# 분석 템플릿 (수정되지 않도록 튜플로 보관)
+_ANALYSIS_TEMPLATES = {
+    "basic": ("C2", "C15", "C6", "C3", "C1"),
+    "statistical": ("C1", "C14", "C29", "C41", "C42", "C43"),
+    "visualization": ("C12", "C23", "C35", "C47"),
+    "missing_data": ("C3", "C11", "C21", "C48"),
+    "correlation": ("C8", "C12", "C25", "C50"),
+    "comprehensive": ("C2", "C15", "C3", "C1", "C8", "C12", "C23", "C50"),
 }
 
+# 토큰 하나에 대한 분석 코드 블록 (마지막 줄바꿈은 블록 사이 빈 줄)
+_TOKEN_TEMPLATE = (
+    "# {i}. 분석: {token}\n"
+    "print('\\n=== {token}: {desc} ===')\n"
+    "try:\n"
+    "    result_{i} = {code}\n"
+    "    print(result_{i})\n"
+    "except Exception as e:\n"
+    "    print(f' {token} 분석 중 오류: {{e}}')\n"
+)
+
+@lru_cache(maxsize=512)
+def _render_token(i, token):
+    """i번째 토큰의 코드 블록 (없는 토큰은 None)"""
+    code_line = token_code_map.get(token)
+    if code_line is None:
+        return None
+    return _TOKEN_TEMPLATE.format(
+        i=i, token=token, desc=_TOKEN_DESCRIPTIONS.get(token, "알 수 없는 분석"), code=code_line
+    )
+
 def dsl_to_code(dsl_sequence, csv_path="your_file.csv"):
     """Convert a sequence of DSL tokens into executable Python code.
 
@@ -99,18 +192,9 @@ def dsl_to_code(dsl_sequence, csv_path="your_file.csv"):
     
     # 각 토큰에 대한 코드 생성
     for i, token in enumerate(dsl_sequence, 1):
-        code_line = token_code_map.get(token)
-        if code_line:
-            lines.extend([
-                f"# {i}. 분석: {token}",
-                f"print('\\n=== {token}: {_get_token_description(token)} ===')",
-                "try:",
-                f"    result_{i} = {code_line}",
-                f"    print(result_{i})",
-                "except Exception as e:",
-                f"    print(f' {token} 분석 중 오류: {{e}}')",
-                ""
-            ])
+        block = _render_token(i, token)
+        if block:
+            lines.append(block)
     
     # 푸터 추가
     lines.extend([
@@ -122,79 +206,11 @@ def dsl_to_code(dsl_sequence, csv_path="your_file.csv"):
 
 def _get_timestamp():
     """현재 시간 반환"""
-    from datetime import datetime
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-def _get_token_description(token):
-    """토큰 설명 반환"""
-    descriptions = {
-        "C1": "기술통계 요약",
-        "C2": "데이터 정보",
-        "C3": "결측치 개수",
-        "C4": "데이터 타입",
-        "C5": "고유값 개수",
-        "C6": "상위 5행",
-        "C7": "하위 5행",
-        "C8": "상관관계 행렬",
-        "C9": "컬럼 목록",
-        "C10": "메모리 사용량",
-        "C11": "결측치 비율",
-        "C12": "상관관계 히트맵",
-        "C13": "첫 번째 컬럼 값 분포",
-        "C14": "전체 기술통계",
-        "C15": "데이터 크기",
-        "C16": "중복행 개수",
-        "C17": "랜덤 샘플 10개",
-        "C18": "각 컬럼별 고유값",
-        "C19": "데이터 전치",
-        "C20": "인덱스 정보",
-        "C21": "결측치 포함 행",
-        "C22": "각 컬럼별 최빈값",
-        "C23": "수치형 히스토그램",
-        "C24": "범주형 값 분포",
-        "C25": "상관계수 상위 5개",
-        "C26": "첫 컬럼 기준 그룹별 평균",
-        "C27": "엑셀 파일로 저장",
-        "C28": "JSON 파일로 저장",
-        "C29": "표준편차",
-        "C30": "최대/최소값",
-        "C31": "모든 값이 0인 행",
-        "C32": "중복 행 개수",
-        "C33": "유효값 개수",
-        "C34": "고유 인덱스 개수",
-        "C35": "수치형 변수 간 관계도",
-        "C36": "오름차순 정렬",
-        "C37": "내림차순 정렬",
-        "C38": "메모리 사용량(MB)",
-        "C39": "컬럼 정보 요약",
-        "C40": "음수값 행 개수",
-        "C41": "왜도 분석",
-        "C42": "첨도 분석",
-        "C43": "사분위수",
-        "C44": "수치형 최빈값",
-        "C45": "고유값 비율",
-        "C46": "컬럼별 중복값",
-        "C47": "박스플롯 시각화",
-        "C48": "결측치 컬럼 목록",
-        "C49": "교차표 분석",
-        "C50": "조합 분석",
-        "SAVE": "결과 저장",
-        "EXPORT": "CSV 내보내기",
-        "PROFILE": "데이터 프로파일링"
-    }
-    return descriptions.get(token, "알 수 없는 분석")
-
 def generate_analysis_template(analysis_type="basic"):
     """분석 템플릿 생성"""
-    templates = {
-        "basic": ["C2", "C15", "C6", "C3", "C1"],
-        "statistical": ["C1", "C14", "C29", "C41", "C42", "C43"],
-        "visualization": ["C12", "C23", "C35", "C47"],
-        "missing_data": ["C3", "C11", "C21", "C48"],
-        "correlation": ["C8", "C12", "C25", "C50"],
-        "comprehensive": ["C2", "C15", "C3", "C1", "C8", "C12", "C23", "C50"]
-    }
-    return templates.get(analysis_type, templates["basic"])
+    return _ANALYSIS_TEMPLATES.get(analysis_type, _ANALYSIS_TEMPLATES["basic"])
 
 # 사용 예시:
 # basic_analysis = generate_analysis_template("basic")
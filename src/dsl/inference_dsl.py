@@ -1,9 +1,10 @@
 
-import torch
-import torch.nn as nn
 import json
+import threading
 from pathlib import Path
 
+import numpy as np
+
 # Load tokenizer - support both old and new paths
 tokenizer_path = Path(__file__).parent / "dsl_tokenizer.json"
 if not tokenizer_path.exists():
@@ -22,90 +23,74 @@ EOS_IDX = 2
 # 모델이 15개 토큰으로 학습된 것으로 보임 (VOCAB_SIZE=15)
 SUPPORTED_TOKENS = ['C1', 'C2', 'C3', 'C4', 'C5', 'C6', 'C7', 'C8', 'C9', 'C10', 'C11', 'C12']
 VOCAB_SIZE = 15  # 모델이 학습된 어휘 크기
+TOKEN_OFFSET = 3  # PAD/SOS/EOS 다음부터 토큰 ID 시작
 
-class LSTMEncoderDecoder(nn.Module):
-    def __init__(self, vocab_size, embed_dim=64, hidden_dim=128):
-        super().__init__()
-        self.embed = nn.Embedding(vocab_size, embed_dim, padding_idx=PAD_IDX)
-        self.encoder = nn.LSTM(embed_dim, hidden_dim, batch_first=True)
-        self.decoder = nn.LSTM(embed_dim, hidden_dim, batch_first=True)
-        self.fc_out = nn.Linear(hidden_dim, vocab_size)
-
-    def forward(self, x):
-        emb = self.embed(x)
-        _, (h, c) = self.encoder(emb)
-        dec_input = torch.full((x.size(0), 1), SOS_IDX, dtype=torch.long, device=x.device)
-        outputs = []
-
-        for _ in range(x.size(1)):
-            dec_emb = self.embed(dec_input)
-            out, (h, c) = self.decoder(dec_emb, (h, c))
-            logits = self.fc_out(out)
-            outputs.append(logits)
-            dec_input = logits.argmax(dim=-1)
+# 토큰 <-> 인덱스 변환 테이블 (예측 시 일괄 인코딩/디코딩용)
+_TOKEN_MAP = {token: idx for idx, token in enumerate(SUPPORTED_TOKENS)}
+_TOKEN_ARR = np.array(SUPPORTED_TOKENS, dtype=object)
 
-        return torch.cat(outputs, dim=1)
+# 모델은 처음 예측할 때 로드 (torch 임포트 비용을 dsl_to_code만 쓰는 경우에는 치르지 않음)
+_MODEL = None
+_MODEL_LOADED = False
+_MODEL_LOCK = threading.Lock()
 
-    def generate(self, x, max_len=10):
-        self.eval()
-        with torch.no_grad():
-            emb = self.embed(x)
-            _, (h, c) = self.encoder(emb)
-            dec_input = torch.full((x.size(0), 1), SOS_IDX, dtype=torch.long, device=x.device)
-            outputs = []
+def _get_model():
+    """학습된 모델 반환 (로드 실패 시 None, 결과는 한 번만 계산해 재사용)"""
+    global _MODEL, _MODEL_LOADED
+    with _MODEL_LOCK:
+        if _MODEL_LOADED:
+            return _MODEL
+        _MODEL_LOADED = True
+        try:
+            import torch
+            from ._lstm_model import LSTMEncoderDecoder
 
-            for _ in range(max_len):
-                dec_emb = self.embed(dec_input)
-                out, (h, c) = self.decoder(dec_emb, (h, c))
-                logits = self.fc_out(out)
-                pred = logits.argmax(dim=-1)
-                outputs.append(pred)
-                dec_input = pred
-                if (pred == EOS_IDX).all():
-                    break
-
-        return torch.cat(outputs, dim=1)
-
-# 모델 로드 - support both old and new paths
-try:
-    model = LSTMEncoderDecoder(VOCAB_SIZE)
-    model_path = Path(__file__).parent / "model.pt"
-    if not model_path.exists():
-        model_path = Path("model.pt")
-    model.load_state_dict(torch.load(model_path, map_location="cpu"))
-    model.eval()
-    MODEL_AVAILABLE = True
-except Exception as e:
-    print(f"  ML 모델 로드 실패: {e}")
-    print("기본 시퀀스를 사용합니다.")
-    MODEL_AVAILABLE = False
+            model = LSTMEncoderDecoder(VOCAB_SIZE)
+            # support both old and new paths
+            model_path = Path(__file__).parent / "model.pt"
+            if not model_path.exists():
+                model_path = Path("model.pt")
+            model.load_state_dict(torch.load(model_path, map_location="cpu"))
+            model.eval()
+            # 추론 전용이므로 TorchScript로 변환해 단계별 파이썬 디스패치 비용 제거 (실패 시 eager 유지)
+            try:
+                model = torch.jit.script(model)
+            except Exception as e:
+                print(f"  TorchScript 변환 실패, eager 모드 사용: {e}")
+            _MODEL = model
+        except Exception as e:
+            print(f"  ML 모델 로드 실패: {e}")
+            print("기본 시퀀스를 사용합니다.")
+        return _MODEL
 
 def predict_dsl(input_tokens):
     """DSL 토큰 예측"""
     # 지원되지 않는 토큰 필터링
-    supported_tokens = [token for token in input_tokens if token in SUPPORTED_TOKENS]
+    supported_tokens = [token for token in input_tokens if token in _TOKEN_MAP]
     
     if not supported_tokens:
         print("  지원되는 토큰이 없습니다. 기본 시퀀스를 사용합니다.")
         return input_tokens
     
     # 모델이 사용 가능한 경우만 예측 시도
-    if not MODEL_AVAILABLE:
+    model = _get_model()
+    if model is None:
         return input_tokens
     
     try:
-        # 지원되는 토큰만 사용해서 예측
-        token_mapping = {token: idx for idx, token in enumerate(SUPPORTED_TOKENS)}
-        input_ids = [token_mapping.get(token, 0) + 3 for token in supported_tokens]
-        input_tensor = torch.tensor([input_ids])
-        output_ids = model.generate(input_tensor)[0]
+        import torch  # _get_model()에서 이미 로드됨
+
+        # 지원되는 토큰만 사용해서 예측 (한 번에 인코딩)
+        input_ids = np.fromiter(
+            (_TOKEN_MAP[token] + TOKEN_OFFSET for token in supported_tokens),
+            dtype=np.int64, count=len(supported_tokens)
+        )
+        with torch.inference_mode():
+            output_ids = model.generate(torch.from_numpy(input_ids).unsqueeze(0))[0].cpu().numpy() - TOKEN_OFFSET
         
-        # 예측 결과를 토큰으로 변환
-        predicted_tokens = []
-        for i in output_ids:
-            idx = i.item() - 3
-            if 0 <= idx < len(SUPPORTED_TOKENS):
-                predicted_tokens.append(SUPPORTED_TOKENS[idx])
+        # 예측 결과를 토큰으로 변환 (특수 토큰 등 범위 밖 ID는 제외)
+        valid = (output_ids >= 0) & (output_ids < len(SUPPORTED_TOKENS))
+        predicted_tokens = _TOKEN_ARR[output_ids[valid]].tolist()
         
         return predicted_tokens if predicted_tokens else input_tokens
         
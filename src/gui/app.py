@@ -1,43 +1,238 @@
 
 from __future__ import annotations
 from pathlib import Path
+import hashlib
+import logging
+import os
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import pandas as pd
-import threading
 import time
 from tkinter import font
+import base64
+import io
+import matplotlib
+matplotlib.use("Agg")  # pyplot은 렌더링만 담당, 화면 표시는 FigureCanvasTkAgg가 처리
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
 import matplotlib.patches as mpatches
 import numpy as np
 
 # Import from modular structure
-from src.gui.state import AppState
+from src.gui.state import AppState, LazySlice
 from src.gui.components.toast import ToastWindow
 from src.gui.components.cache import DataCache
-from src.gui.threads import BackgroundTaskManager
+from src.gui.components.virtual_table import VirtualTable
+from src.gui.threads import BackgroundTaskManager, TaskResult
+from src.gui.kernels import histogram
+from src.core.data_loader import CARDINALITY_SAMPLE_ROWS, _read_csv_arrow
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
 
-def format_bytes(size: int) -> str:
-    power = 1024; n = 0; power_labels = {0: '', 1: 'K', 2: 'M', 3: 'G', 4: 'T'}
-    while size > power and n < len(power_labels): size /= power; n += 1
-    return f"{size:.2f} {power_labels[n]}B"
+logger = logging.getLogger(__name__)
+
+# 파싱한 CSV의 Parquet 디스크 캐시 (전체 크기가 상한을 넘으면 오래된 파일부터 삭제)
+PARQUET_CACHE_DIR = Path.home() / ".cache" / "csv_analyzer"
+PARQUET_CACHE_MAX_BYTES = 2 * 1024 ** 3
 
-def load_csv(state: AppState, file_path: str):
-    state.df = pd.read_csv(file_path)
-    state.numeric_cols = state.df.select_dtypes(include='number').columns.tolist()
+
+_POWER_LABELS = ('', 'K', 'M', 'G', 'T')
+
+def format_bytes(size: int) -> str:
+    # 1024 단위 지수는 비트 길이로 바로 계산 (0..4로 제한)
+    n = min(max(int(size).bit_length() - 1, 0) // 10, len(_POWER_LABELS) - 1)
+    return f"{size / 1024 ** n:.2f} {_POWER_LABELS[n]}B"
+
+def _read_csv(file_path: str, nrows: int | None = None) -> pd.DataFrame:
+    if HAS_PYARROW:
+        if nrows is None:
+            return pd.read_csv(file_path, engine="pyarrow", dtype_backend="pyarrow")
+        # 앞 nrows행만 스트리밍으로 읽음 (CLI 로더와 같은 결측 처리 및 C 엔진 재시도 경로)
+        return _read_csv_arrow(Path(file_path), max_rows=nrows)
+    return pd.read_csv(file_path, engine="c", low_memory=False, nrows=nrows)
+
+def shrink_dtypes(df: pd.DataFrame) -> dict[str, tuple[str, str, int]]:
+    """정수/실수 다운캐스트, 고유값 비율 50% 미만 문자열은 category로 변환 (제자리 수정)
+
+    변경된 컬럼별 (이전 타입, 이후 타입, 절약한 바이트)를 반환합니다.
+    NumPy/Arrow 백엔드 모두 같은 규칙을 적용합니다.
+    """
+    n = len(df)
+    report = {}
+    for col in df.columns:
+        s = df[col]
+        dtype = s.dtype
+        if pd.api.types.is_bool_dtype(dtype):
+            continue
+        if pd.api.types.is_integer_dtype(dtype):
+            new = pd.to_numeric(s, downcast='integer')
+        elif pd.api.types.is_float_dtype(dtype):
+            new = pd.to_numeric(s, downcast='float')
+        elif pd.api.types.is_string_dtype(dtype):
+            # 큰 데이터는 표본의 고유값 비율로 판단
+            sample = s if n <= CARDINALITY_SAMPLE_ROWS else s.sample(CARDINALITY_SAMPLE_ROWS, random_state=0)
+            if not len(sample) or sample.nunique(dropna=False) / len(sample) >= 0.5:
+                continue
+            new = s.astype('category')
+        else:
+            continue
+        if new.dtype != dtype:
+            saved = int(s.memory_usage(deep=True, index=False) - new.memory_usage(deep=True, index=False))
+            df[col] = new
+            report[col] = (str(dtype), str(new.dtype), saved)
+    return report
+
+def _parquet_cache_path(path: str, stat: os.stat_result, nrows: int | None) -> Path:
+    key = hashlib.blake2b(f"{path}|{stat.st_mtime_ns}|{stat.st_size}|{nrows}".encode(),
+                          digest_size=16).hexdigest()
+    return PARQUET_CACHE_DIR / f"{key}.parquet"
+
+def _arrow_types(arrow_type):
+    # 사전(dictionary) 타입은 pandas 기본 변환으로 category 복원, 나머지는 Arrow 타입 유지
+    return None if pa.types.is_dictionary(arrow_type) else pd.ArrowDtype(arrow_type)
+
+def _read_parquet_cache(cache_path: Path):
+    """디스크 캐시에서 (DataFrame, 타입 축소 보고서) 읽기 (없거나 손상되면 None)"""
+    try:
+        df = pq.read_table(cache_path).to_pandas(types_mapper=_arrow_types)
+    except (OSError, pa.ArrowException):
+        return None
+    os.utime(cache_path)  # 최근 사용 파일이 나중에 삭제되도록 수정 시각 갱신
+    report = df.attrs.pop("dtype_report", {})
+    return df, {col: tuple(entry) for col, entry in report.items()}
+
+def _write_parquet_cache(cache_path: Path, df: pd.DataFrame, dtype_report: dict):
+    """디스크 캐시에 저장 후 상한을 넘으면 오래된 파일 삭제 (실패해도 로드는 계속)"""
+    try:
+        PARQUET_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        df.attrs["dtype_report"] = dtype_report
+        tmp_path = cache_path.with_suffix(".tmp")
+        df.to_parquet(tmp_path, engine="pyarrow", compression="zstd")
+        os.replace(tmp_path, cache_path)  # 읽는 쪽이 쓰다 만 파일을 보지 않도록
+    except (OSError, ValueError, pa.ArrowException) as e:
+        logger.warning(f"Parquet 캐시 저장 실패: {e}")
+        return
+    finally:
+        df.attrs.pop("dtype_report", None)
+
+    with os.scandir(PARQUET_CACHE_DIR) as entries:
+        files = sorted((st.st_mtime, st.st_size, entry.path)
+                       for entry in entries if entry.name.endswith(".parquet")
+                       for st in (entry.stat(),))
+    total = sum(size for _, size, _ in files)
+    for _, size, path in files:
+        if total <= PARQUET_CACHE_MAX_BYTES:
+            break
+        if path != str(cache_path):  # 방금 저장한 파일은 유지
+            os.unlink(path)
+            total -= size
+
+def load_frame(file_path: str, cache: DataCache | None = None, nrows: int | None = None):
+    """(DataFrame, 수치형 컬럼 목록, 메모리 사용량, 타입 축소 보고서) 반환
+
+    같은 파일은 경로/수정 시각/크기가 같으면 메모리 캐시, 그다음 Parquet 디스크 캐시에서 재사용합니다.
+    """
+    path = str(Path(file_path).resolve())
+    stat = os.stat(path)
+    key = ("csv", path, stat.st_mtime_ns, stat.st_size, nrows)
+    cached = cache.get(key) if cache is not None else None
+    if cached is None:
+        cache_path = _parquet_cache_path(path, stat, nrows) if HAS_PYARROW else None
+        from_disk = _read_parquet_cache(cache_path) if cache_path and cache_path.exists() else None
+        if from_disk is not None:
+            df, dtype_report = from_disk
+        else:
+            df = _read_csv(file_path, nrows)
+            dtype_report = shrink_dtypes(df)
+            if cache_path is not None:
+                _write_parquet_cache(cache_path, df, dtype_report)
+        # deep=True는 문자열을 모두 훑으므로 로드 시 한 번만 계산
+        cached = (df, df.select_dtypes(include=np.number).columns.tolist(),
+                  int(df.memory_usage(deep=True).sum()), dtype_report)
+        if cache is not None:
+            cache.set(key, cached)
+    return cached
+
+def load_csv(state: AppState, file_path: str, cache: DataCache | None = None, nrows: int | None = None):
+    state.df, state.numeric_cols, state.memory_bytes, state.dtype_report = load_frame(file_path, cache, nrows)
+
+def write_csv(frame: pd.DataFrame, file_path: str):
+    """인덱스 포함 CSV 저장 (pyarrow가 있으면 C++ 작성기, 없으면 청크 단위 to_csv)"""
+    if HAS_PYARROW:
+        try:
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            # to_csv(index=True)와 같이 인덱스를 첫 컬럼으로
+            table = table.add_column(0, str(frame.index.name or ""), pa.array(frame.index))
+            pacsv.write_csv(table, file_path)
+            return
+        except (pa.ArrowException, ValueError):
+            pass  # 타입이 섞인 object 컬럼, 중복 컬럼명 등 Arrow로 옮길 수 없는 프레임은 pandas로 저장
+    frame.to_csv(file_path, index=True, chunksize=100_000)
+
+def _format_float_cell(val) -> str:
+    # NaN은 자기 자신과 같지 않음 (pd.isna보다 가벼운 결측 검사)
+    return "" if val is pd.NA or val != val else f"{val:.2f}"
+
+def _format_cell(val) -> str:
+    return "" if val is None or val is pd.NA or val != val else str(val)
+
+def truncate_cells(cells, width: int) -> list:
+    """셀(DataFrame 또는 2차원 배열)을 문자열로 바꾸고 width자를 넘으면 잘라서 '...' 표시 (배열 연산으로 한 번에)"""
+    # width+1자 고정 폭으로 변환하면 긴 값이 있어도 메모리가 늘지 않고, 길이가 width+1이면 잘린 값
+    text = np.asarray(cells, dtype=object).astype(f"<U{width + 1}")
+    long = np.char.str_len(text) > width
+    if long.any():
+        text[long] = np.char.add(text[long].astype(f"<U{width - 3}"), "...")
+    return text.tolist()
+
+def column_positions(positions) -> slice | list[int]:
+    """컬럼 위치 목록을 iloc 인덱서로 변환 (연속 구간이면 slice로 블록 복사를 피함)"""
+    positions = list(positions)
+    if positions and positions == list(range(positions[0], positions[-1] + 1)):
+        return slice(positions[0], positions[-1] + 1)
+    return positions
 
 def column_profile(df: pd.DataFrame, column: str) -> dict:
-    return {
-        "Type": str(df[column].dtype), 
-        "Unique": len(df[column].unique()), 
-        "Missing": f"{df[column].isnull().sum()}",
-        "Non-null": f"{df[column].notna().sum()}",
-        "Min": str(df[column].min()) if df[column].dtype in ['int64', 'float64'] else "N/A",
-        "Max": str(df[column].max()) if df[column].dtype in ['int64', 'float64'] else "N/A",
-        "Mean": f"{df[column].mean():.2f}" if df[column].dtype in ['int64', 'float64'] else "N/A"
+    s = df[column]
+    # 결측/비결측 수는 count() 한 번으로 계산
+    non_null = int(s.count())
+    missing = len(s) - non_null
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        # 로드 시 만든 범주형은 관측된 범주만 가지므로 범주 수(+결측)로 바로 계산
+        unique = len(s.cat.categories) + (missing > 0)
+    else:
+        unique = int(s.nunique(dropna=False))
+    profile = {
+        "Type": str(s.dtype),
+        "Unique": unique,
+        "Missing": f"{missing}",
+        "Non-null": f"{non_null}",
+        "Min": "N/A",
+        "Max": "N/A",
+        "Mean": "N/A",
     }
+    # 수치형 통계는 describe() 한 번으로 계산 (bool은 describe가 범주형 요약을 반환하므로 제외)
+    if pd.api.types.is_numeric_dtype(s) and not pd.api.types.is_bool_dtype(s) and non_null:
+        desc = s.describe()
+        # min/max는 원래 타입으로 되돌려 정수 컬럼이 1.0처럼 표시되지 않게 함
+        lo, hi = desc[["min", "max"]].astype(s.dtype)
+        profile.update(Min=str(lo), Max=str(hi), Mean=f"{desc['mean']:.2f}")
+    return profile
+
+
+# 역할별로 위젯 옵션에 적용할 테마 색상 키
+_THEME_ROLES = {
+    "button": {"bg": "button_bg", "fg": "button_fg"},
+    "text": {"bg": "tree_bg", "fg": "text_color", "insertbackground": "text_color"},
+    "listbox": {"bg": "entry_bg", "fg": "text_color", "selectbackground": "accent"},
+}
 
 
 class CSVAnalyzerApp:
@@ -46,13 +241,26 @@ class CSVAnalyzerApp:
         self.state = AppState()
         self.toast = None
         self.busy_after_id = None
+        # 마지막 로드 요청 번호 (먼저 시작된 로드가 늦게 끝나도 결과를 덮어쓰지 않도록)
+        self._load_request_id = 0
         
         # 캐싱 시스템 추가
         self.data_cache = DataCache()
+        # 로드한 DataFrame 캐시 (메모리를 많이 쓰므로 최근 파일 몇 개만 유지)
+        self.frame_cache = DataCache(max_size=2)
+        # 색상 이름 -> winfo_rgb 결과 (버튼 호버 색상 계산용)
+        self._rgb_cache: dict[str, tuple] = {}
+        # 예약된 테마 적용 콜백 (after_idle id)
+        self._theme_after_id = None
+        # 예약된 슬라이싱 콜백 (행 범위 입력 디바운스용 after id)
+        self._slice_after_id = None
         
         # Background task manager 추가
         self.task_manager = BackgroundTaskManager(root)
         
+        # 테마 적용 대상 위젯 (역할별 목록, 생성 시 등록)
+        self._themed = {role: [] for role in _THEME_ROLES}
+
         # 다크모드 설정
         self.is_dark_mode = False
         self.setup_themes()
@@ -89,63 +297,26 @@ class CSVAnalyzerApp:
                 'hover': '#094771'
             }
         }
-        
-    def update_widget_theme_optimized(self, widget, theme, visited=None, max_depth=10):
-        """최적화된 테마 업데이트 (재귀 호출 제한 및 캐싱)"""
-        if visited is None:
-            visited = set()
-        
-        widget_id = id(widget)
-        if widget_id in visited:
-            return
-        visited.add(widget_id)
-        
-        # 최대 방문 제한 및 깊이 제한
-        if len(visited) > 1000 or max_depth <= 0:
-            return
-        
-        try:
-            widget_class = widget.winfo_class()
-            
-            # 자주 사용되는 위젯 타입 우선 처리
-            if widget_class in ['Frame', 'Toplevel']:
-                if widget_class == 'Frame':
-                    widget.configure(bg=theme['panel_bg'])
-            elif widget_class == 'Label':
-                # 라벨 배경색이 테마 색상이면 업데이트
-                current_bg = str(widget.cget('bg'))
-                if current_bg in ['white', '#FFFFFF', '#2D2D30', '#FAFAFA', '#383838', '#2B2B2B']:
-                    widget.configure(bg=theme['panel_bg'], fg=theme['text_color'])
-            elif widget_class == 'Button':
-                # 일반 버튼만 업데이트 (특정 버튼 제외)
-                current_text = str(widget.cget('text'))
-                if current_text not in ['🌙', '☀️', 'Toggle Dark Mode']:
-                    current_bg = str(widget.cget('bg'))
-                    if current_bg in ['#F0F0F0', '#FAFAFA', '#E1E1E1', '#D4D4D4', '#2B2B2B', '#383838', 'SystemButtonFace']:
-                        widget.configure(bg=theme['button_bg'], fg=theme['button_fg'])
-            elif widget_class == 'Text':
-                widget.configure(bg=theme['tree_bg'], fg=theme['text_color'], insertbackground=theme['text_color'])
-            elif widget_class == 'Entry':
-                widget.configure(
-                    bg=theme['entry_bg'], 
-                    fg=theme['text_color'], 
-                    insertbackground=theme['text_color'],
-                    relief='flat',
-                    bd=1
-                )
-            
-            # 자식 위젯들에 제한된 깊이로 재귀 적용
-            for child in widget.winfo_children():
-                self.update_widget_theme_optimized(child, theme, visited, max_depth - 1)
-                
-        except tk.TclError:
-            # 일부 위젯은 특정 속성을 지원하지 않을 수 있음
-            pass
+        self.current_theme = self.themes['light']
+
+    def setup_styles(self):
         """스타일 설정"""
         style = ttk.Style()
         style.theme_use('clam')
         self.apply_theme_styles()
 
+    def _register(self, widget, role: str):
+        """테마 전환 시 색상을 바꿀 위젯 등록 (파괴되면 목록에서 제거)"""
+        widgets = self._themed[role]
+        widgets.append(widget)
+
+        def unregister(event):
+            if widget in widgets:
+                widgets.remove(widget)
+
+        widget.bind('<Destroy>', unregister, add='+')
+        return widget
+
     def apply_theme_styles(self):
         """현재 테마에 맞는 스타일 적용"""
         style = ttk.Style()
@@ -163,149 +334,49 @@ class CSVAnalyzerApp:
         
         # Frame 스타일
         style.configure('TFrame', background=theme['panel_bg'])
+        style.configure('Background.TFrame', background=theme['bg'])
         style.configure('TLabelFrame', background=theme['panel_bg'], foreground=theme['text_color'])
+
+        # Label/Entry/Checkbutton 스타일 (스타일 하나만 바꾸면 같은 스타일의 모든 위젯이 갱신됨)
+        style.configure('TLabel', background=theme['panel_bg'], foreground=theme['text_color'])
+        style.configure('Secondary.TLabel', foreground=theme['secondary_text'])
+        style.configure('Accent.TLabel', foreground=theme['accent'])
+        style.configure('TEntry', fieldbackground=theme['entry_bg'], foreground=theme['text_color'],
+                        insertcolor=theme['text_color'])
+        style.configure('TCheckbutton', background=theme['panel_bg'], foreground=theme['text_color'],
+                        indicatorbackground=theme['entry_bg'], font=('Arial', 8))
+        style.map('TCheckbutton', background=[('active', theme['panel_bg'])])
         
         # Treeview 스타일
         style.configure('Treeview', background=theme['tree_bg'], foreground=theme['text_color'], fieldbackground=theme['tree_bg'])
         style.configure('Treeview.Heading', background=theme['button_bg'], foreground=theme['button_fg'])
 
     def toggle_dark_mode(self):
-        """다크모드 토글 (부드러운 전환 효과)"""
+        """다크모드 토글"""
         self.is_dark_mode = not self.is_dark_mode
         self.current_theme = self.themes['dark'] if self.is_dark_mode else self.themes['light']
-        
-        # 부드러운 전환을 위한 단계별 적용
-        self.apply_theme_transition()
-        
-        # 통계 컨테이너 스타일 업데이트
-        self.root.after(100, self.update_stats_container_style)
-        
-        # 통계 라벨 강제 업데이트
-        self.root.after(200, lambda: self.force_update_stat_labels(self.current_theme))
 
-    def apply_theme_transition(self):
-        """부드러운 테마 전환"""
-        # 스타일 먼저 적용
-        self.apply_theme_styles()
-        
-        # 위젯들에 순차적으로 적용 (애니메이션 효과)
-        self.transition_step = 0
-        self.transition_widgets()
-
-    def transition_widgets(self):
-        """위젯 전환 애니메이션"""
-        if self.transition_step == 0:
-            # 1단계: 메인 배경
-            self.root.configure(bg=self.current_theme['bg'])
-            self.transition_step += 1
-            self.root.after(50, self.transition_widgets)
-        elif self.transition_step == 1:
-            # 2단계: 패널들
-            self.apply_theme_to_panels()
-            self.transition_step += 1
-            self.root.after(50, self.transition_widgets)
-        elif self.transition_step == 2:
-            # 3단계: 텍스트 요소들
-            self.apply_theme_to_text_elements()
-            self.transition_step += 1
-            self.root.after(50, self.transition_widgets)
-        elif self.transition_step == 3:
-            # 4단계: 마무리 및 버튼 업데이트
-            self.finalize_theme_transition()
-
-    def apply_theme_to_panels(self):
-        """패널 위젯들에 테마 적용"""
-        theme = self.current_theme
-        
-        # 메인 컨테이너들 찾아서 업데이트
-        for widget in self.root.winfo_children():
-            if isinstance(widget, tk.Frame):
-                self.update_frame_theme(widget, theme)
-
-    def apply_theme_to_text_elements(self):
-        """텍스트 요소들에 테마 적용"""
-        theme = self.current_theme
-        
-        # 분석 텍스트 영역
-        if hasattr(self, 'analysis_text'):
-            self.analysis_text.configure(
-                bg=theme['tree_bg'], 
-                fg=theme['text_color'], 
-                insertbackground=theme['text_color']
-            )
-        
-        # 통계 라벨들 색상 업데이트
-        if hasattr(self, 'rows_label') and self.rows_label.winfo_exists():
-            current_text = self.rows_label.cget('text')
-            self.rows_label.config(bg=theme['panel_bg'], fg=theme['text_color'])
-        
-        if hasattr(self, 'cols_label') and self.cols_label.winfo_exists():
-            current_text = self.cols_label.cget('text')
-            self.cols_label.config(bg=theme['panel_bg'], fg=theme['text_color'])
-        
-        if hasattr(self, 'memory_label') and self.memory_label.winfo_exists():
-            current_text = self.memory_label.cget('text')
-            self.memory_label.config(bg=theme['panel_bg'], fg=theme['text_color'])
+        # 연속 토글은 하나로 합쳐 유휴 시점에 한 번만 적용 (화면도 한 번만 다시 그림)
+        if self._theme_after_id is None:
+            self._theme_after_id = self.root.after_idle(self._apply_theme_now)
 
-    def finalize_theme_transition(self):
-        """테마 전환 마무리"""
-        # 전체 위젯 업데이트
+    def _apply_theme_now(self):
+        """현재 테마를 스타일/위젯/통계 컨테이너/토글 버튼에 한 번에 적용"""
+        self._theme_after_id = None
+        self.apply_theme_styles()
         self.apply_theme_to_widgets()
-        
-        # 토글 버튼 업데이트 (부드러운 효과)
-        self.animate_toggle_button()
+        self.update_stats_container_style()
+        self.update_toggle_button()
 
-    def animate_toggle_button(self):
-        """토글 버튼 애니메이션"""
+    def update_toggle_button(self):
+        """토글 버튼 색상/텍스트 갱신"""
         theme = self.current_theme
-        
-        # 버튼 색상 전환
         self.theme_toggle_btn.configure(
             text="🌙 Dark" if not self.is_dark_mode else "☀️ Light",
             bg=theme['accent'],
             fg=theme['button_fg'],
             activebackground=theme['hover']
         )
-        
-        # 버튼 크기 애니메이션 (약간의 펄스 효과)
-        original_font = self.theme_toggle_btn.cget('font')
-        self.theme_toggle_btn.configure(font=('Arial', 9, 'bold'))
-        self.root.after(100, lambda: self.theme_toggle_btn.configure(font=('Arial', 8)))
-
-    def update_frame_theme(self, frame, theme):
-        """프레임과 자식 위젯들 테마 업데이트"""
-        try:
-            frame.configure(bg=theme['panel_bg'])
-            
-            for child in frame.winfo_children():
-                widget_class = child.winfo_class()
-                
-                if widget_class == 'Frame':
-                    self.update_frame_theme(child, theme)
-                elif widget_class == 'Label':
-                    # 라벨 배경색이 패널 색상이면 업데이트
-                    current_bg = str(child.cget('bg'))
-                    if current_bg in ['white', '#FFFFFF', '#2D2D30', '#FAFAFA', '#383838', '#2B2B2B']:
-                        child.configure(bg=theme['panel_bg'], fg=theme['text_color'])
-                elif widget_class == 'LabelFrame':
-                    child.configure(bg=theme['panel_bg'], fg=theme['text_color'])
-                elif widget_class == 'Entry':
-                    child.configure(
-                        bg=theme['entry_bg'], 
-                        fg=theme['text_color'], 
-                        insertbackground=theme['text_color'],
-                        selectbackground=theme['accent']
-                    )
-                elif widget_class == 'Checkbutton':
-                    child.configure(
-                        bg=theme['panel_bg'], 
-                        fg=theme['text_color'], 
-                        selectcolor=theme['entry_bg'],
-                        activebackground=theme['hover']
-                    )
-                    
-        except tk.TclError:
-            pass
 
     def bind_hover_effects(self, button):
         """버튼 호버 효과 바인딩"""
@@ -330,12 +401,14 @@ class CSVAnalyzerApp:
                        command=command,
                        cursor='hand2')
         
+        # 호버 색상(약간 어둡게)은 생성 시 한 번만 계산 (winfo_rgb는 Tcl 왕복 호출)
+        if bg_color not in self._rgb_cache:
+            self._rgb_cache[bg_color] = btn.winfo_rgb(bg_color)
+        r, g, b = self._rgb_cache[bg_color]
+        hover_color = f"#{int(r/256*0.8):02x}{int(g/256*0.8):02x}{int(b/256*0.8):02x}"
+
         # 호버 효과
         def on_enter(e):
-            # 색상을 약간 어둡게
-            r, g, b = btn.winfo_rgb(bg_color)
-            r, g, b = int(r/256*0.8), int(g/256*0.8), int(b/256*0.8)
-            hover_color = f"#{r:02x}{g:02x}{b:02x}"
             btn.configure(bg=hover_color)
         
         def on_leave(e):
@@ -347,112 +420,25 @@ class CSVAnalyzerApp:
         return btn
 
     def apply_theme_to_widgets(self):
-        """모든 위젯에 테마 적용"""
+        """ttk 스타일로 바꿀 수 없는 classic tk 위젯(버튼/Text/Canvas)에만 테마 색상 적용"""
         theme = self.current_theme
-        
-        # 루트 윈도우
         self.root.configure(bg=theme['bg'])
-        
-        # 재귀적으로 모든 위젯 업데이트
-        self.update_widget_theme(self.root, theme)
 
-    def update_widget_theme(self, widget, theme):
-        """위젯과 자식 위젯들에 테마 적용"""
-        try:
-            widget_class = widget.winfo_class()
-            
-            if widget_class in ['Frame', 'Toplevel']:
-                widget.configure(bg=theme['panel_bg'])
-            elif widget_class == 'Label':
-                # 라벨의 현재 색상 확인
-                current_bg = str(widget.cget('bg'))
-                current_fg = str(widget.cget('fg'))
-                
-                # 더 포괄적인 조건으로 라벨 업데이트
-                should_update_bg = current_bg in ['white', '#FFFFFF', '#F0F0F0', '#FAFAFA', '#383838', '#2B2B2B', '#2D2D30', 'SystemButtonFace']
-                should_update_fg = current_fg in ['black', '#000000', 'white', '#FFFFFF', '#E8E8E8', '#CCCCCC', 'SystemWindowText', 'SystemButtonText']
-                
-                if should_update_bg or should_update_fg:
-                    widget.configure(bg=theme['panel_bg'], fg=theme['text_color'])
-            elif widget_class == 'Button':
-                # 테마 토글 버튼과 일반 버튼 구분
-                current_text = str(widget.cget('text'))
-                
-                # 테마 토글 버튼은 제외
-                if current_text not in ['🌙', '☀️']:
-                    current_bg = str(widget.cget('bg'))
-                    current_fg = str(widget.cget('fg'))
-                    
-                    # 일반적인 버튼 배경색을 가진 경우
-                    if current_bg in ['#F0F0F0', '#FAFAFA', '#E1E1E1', '#D4D4D4', '#2B2B2B', '#383838', 'SystemButtonFace']:
-                        widget.configure(bg=theme['button_bg'], fg=theme['button_fg'])
-                    # 텍스트가 기본 색상인 경우 텍스트만 변경
-                    elif current_fg in ['black', '#000000', 'white', '#FFFFFF', 'SystemButtonText']:
-                        widget.configure(fg=theme['button_fg'])
-            elif widget_class == 'Text':
-                widget.configure(bg=theme['tree_bg'], fg=theme['text_color'], insertbackground=theme['text_color'])
-            elif widget_class == 'Entry':
-                # Entry 위젯은 항상 테마 색상으로 업데이트
-                widget.configure(
-                    bg=theme['entry_bg'], 
-                    fg=theme['text_color'], 
-                    insertbackground=theme['text_color'],
-                    relief='flat',
-                    bd=1
-                )
-            elif widget_class == 'Checkbutton':
-                widget.configure(bg=theme['panel_bg'], fg=theme['text_color'], selectcolor=theme['entry_bg'])
-            elif widget_class == 'LabelFrame':
-                widget.configure(
-                    bg=theme['panel_bg'], 
-                    fg=theme['text_color'],
-                    relief='flat',
-                    bd=1,
-                    highlightthickness=0
-                )
-            
-            # 자식 위젯들에 재귀 적용
-            for child in widget.winfo_children():
-                self.update_widget_theme(child, theme)
-                
-        except tk.TclError:
-            # 일부 위젯은 특정 속성을 지원하지 않을 수 있음
-            pass
-        
-        # 특정 라벨들을 강제로 업데이트 (테마 변경 시)
-        if widget == self.root:  # 루트 위젯 처리 시에만 실행
-            self.force_update_stat_labels(theme)
-    
+        for role, widgets in self._themed.items():
+            options = {opt: theme[key] for opt, key in _THEME_ROLES[role].items()}
+            for widget in widgets:
+                widget.configure(**options)
+
     def update_stats_container_style(self):
         """통계 컨테이너 스타일 업데이트"""
         if hasattr(self, 'stats_container') and self.stats_container.winfo_exists():
             if self.is_dark_mode:
                 # 다크모드에서는 테두리 없이 배경 색상만으로 구분
-                self.stats_container.configure(
-                    bg=self.current_theme['panel_bg'],
-                    relief='flat', 
-                    bd=0
-                )
+                self.stats_container.configure(relief='flat', borderwidth=0)
             else:
                 # 라이트모드에서는 얇은 테두리로 구분
-                self.stats_container.configure(
-                    bg=self.current_theme['panel_bg'],
-                    relief='solid', 
-                    bd=1
-                )
+                self.stats_container.configure(relief='solid', borderwidth=1)
     
-    def force_update_stat_labels(self, theme):
-        """통계 라벨들을 강제로 업데이트"""
-        try:
-            if hasattr(self, 'rows_label') and self.rows_label.winfo_exists():
-                self.rows_label.configure(bg=theme['panel_bg'], fg=theme['text_color'])
-            if hasattr(self, 'cols_label') and self.cols_label.winfo_exists():
-                self.cols_label.configure(bg=theme['panel_bg'], fg=theme['text_color'])
-            if hasattr(self, 'memory_label') and self.memory_label.winfo_exists():
-                self.memory_label.configure(bg=theme['panel_bg'], fg=theme['text_color'])
-        except tk.TclError:
-            pass
-
     def setup_ui(self):
         """UI 설정 - 원래 dearpygui 디자인 복원"""
         self.root.title("CSV Analyzer (Compatible)")
@@ -469,7 +455,7 @@ class CSVAnalyzerApp:
         theme_menu.add_command(label="Toggle Dark Mode", command=self.toggle_dark_mode)
 
         # 메인 컨테이너 (수평 레이아웃)
-        main_container = tk.Frame(self.root, bg=self.current_theme['bg'])
+        main_container = ttk.Frame(self.root, style='Background.TFrame')
         main_container.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
         # 왼쪽 패널 (300px 고정)
@@ -480,17 +466,16 @@ class CSVAnalyzerApp:
 
     def build_left_panel(self, parent):
         """왼쪽 패널 구성"""
-        left_frame = tk.Frame(parent, bg=self.current_theme['panel_bg'], relief='solid', bd=1, width=300)
+        left_frame = ttk.Frame(parent, relief='solid', borderwidth=1, width=300)
         left_frame.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 5))
         left_frame.pack_propagate(False)  # 크기 고정
 
         # 제목과 테마 토글 버튼
-        header_frame = tk.Frame(left_frame, bg=self.current_theme['panel_bg'])
+        header_frame = ttk.Frame(left_frame)
         header_frame.pack(fill='x', pady=(15, 5))
 
-        title_label = tk.Label(header_frame, text="CSV ANALYZER", 
-                              font=('Arial', 14, 'bold'), 
-                              fg=self.current_theme['accent'], bg=self.current_theme['panel_bg'])
+        title_label = ttk.Label(header_frame, text="CSV ANALYZER", font=('Arial', 14, 'bold'),
+                                style='Accent.TLabel')
         title_label.pack(side='left')
 
         # 다크모드 토글 버튼 (호버 효과 추가)
@@ -530,53 +515,43 @@ class CSVAnalyzerApp:
         self.load_btn.bind('<Leave>', load_btn_hover_leave)
 
         # 드래그 앤 드롭 안내
-        drag_label = tk.Label(left_frame, text="or drag and drop CSV file anywhere",
-                             font=('Arial', 9), fg=self.current_theme['secondary_text'], 
-                             bg=self.current_theme['panel_bg'])
+        drag_label = ttk.Label(left_frame, text="or drag and drop CSV file anywhere", font=('Arial', 9),
+                               style='Secondary.TLabel')
         drag_label.pack(pady=(5, 15))
 
         # 통계 섹션
         # Statistics 섹션 (일반 Frame으로 변경)
-        stats_section = tk.Frame(left_frame, bg=self.current_theme['panel_bg'])
+        stats_section = ttk.Frame(left_frame)
         stats_section.pack(fill='x', padx=15, pady=10)
         
         # Statistics 제목
-        stats_title = tk.Label(stats_section, text="Statistics", 
-                              font=('Arial', 10, 'bold'),
-                              bg=self.current_theme['panel_bg'], 
-                              fg=self.current_theme['text_color'])
+        stats_title = ttk.Label(stats_section, text="Statistics", font=('Arial', 10, 'bold'))
         stats_title.pack(anchor='w', pady=(0, 5))
         
         # 통계 테이블
-        self.stats_container = tk.Frame(stats_section, bg=self.current_theme['panel_bg'])
+        self.stats_container = ttk.Frame(stats_section)
         self.update_stats_container_style()
         self.stats_container.pack(fill='x', padx=5, pady=5)
 
         # Rows
-        row1 = tk.Frame(self.stats_container, bg=self.current_theme['panel_bg'])
+        row1 = ttk.Frame(self.stats_container)
         row1.pack(fill='x', pady=2)
-        tk.Label(row1, text="Rows:", font=('Arial', 9), 
-                bg=self.current_theme['panel_bg'], fg=self.current_theme['text_color'], anchor='w').pack(side='left')
-        self.rows_label = tk.Label(row1, text="0", font=('Arial', 9), 
-                                  bg=self.current_theme['panel_bg'], fg=self.current_theme['text_color'], anchor='e')
+        ttk.Label(row1, text="Rows:", font=('Arial', 9), anchor='w').pack(side='left')
+        self.rows_label = ttk.Label(row1, text="0", font=('Arial', 9), anchor='e')
         self.rows_label.pack(side='right')
 
         # Columns
-        row2 = tk.Frame(self.stats_container, bg=self.current_theme['panel_bg'])
+        row2 = ttk.Frame(self.stats_container)
         row2.pack(fill='x', pady=2)
-        tk.Label(row2, text="Columns:", font=('Arial', 9), 
-                bg=self.current_theme['panel_bg'], fg=self.current_theme['text_color'], anchor='w').pack(side='left')
-        self.cols_label = tk.Label(row2, text="0", font=('Arial', 9), 
-                                  bg=self.current_theme['panel_bg'], fg=self.current_theme['text_color'], anchor='e')
+        ttk.Label(row2, text="Columns:", font=('Arial', 9), anchor='w').pack(side='left')
+        self.cols_label = ttk.Label(row2, text="0", font=('Arial', 9), anchor='e')
         self.cols_label.pack(side='right')
 
         # Memory
-        row3 = tk.Frame(self.stats_container, bg=self.current_theme['panel_bg'])
+        row3 = ttk.Frame(self.stats_container)
         row3.pack(fill='x', pady=2)
-        tk.Label(row3, text="Memory:", font=('Arial', 9), 
-                bg=self.current_theme['panel_bg'], fg=self.current_theme['text_color'], anchor='w').pack(side='left')
-        self.memory_label = tk.Label(row3, text="0 MB", font=('Arial', 9), 
-                                    bg=self.current_theme['panel_bg'], fg=self.current_theme['text_color'], anchor='e')
+        ttk.Label(row3, text="Memory:", font=('Arial', 9), anchor='w').pack(side='left')
+        self.memory_label = ttk.Label(row3, text="0 MB", font=('Arial', 9), anchor='e')
         self.memory_label.pack(side='right')
 
         # 구분선
@@ -584,24 +559,21 @@ class CSVAnalyzerApp:
         sep2.pack(fill='x', padx=10, pady=15)
 
         # 상태 표시
-        status_container = tk.Frame(left_frame, bg=self.current_theme['panel_bg'])
+        status_container = ttk.Frame(left_frame)
         status_container.pack(fill='x', padx=15, pady=(0, 15))
 
         # 로딩 스피너 (간단한 점 애니메이션)
-        self.spinner_label = tk.Label(status_container, text="", 
-                                     font=('Arial', 12), fg=self.current_theme['accent'], 
-                                     bg=self.current_theme['panel_bg'])
+        self.spinner_label = ttk.Label(status_container, text="", font=('Arial', 12), style='Accent.TLabel')
         self.spinner_label.pack(side='left')
 
         # 상태 텍스트
-        self.status_label = tk.Label(status_container, text="Ready", 
-                                    font=('Arial', 9), fg=self.current_theme['secondary_text'], 
-                                    bg=self.current_theme['panel_bg'])
+        self.status_label = ttk.Label(status_container, text="Ready", font=('Arial', 9),
+                                      style='Secondary.TLabel')
         self.status_label.pack(side='left', padx=(5, 0))
 
     def build_right_panel(self, parent):
         """오른쪽 패널 구성"""
-        right_frame = tk.Frame(parent, bg=self.current_theme['panel_bg'], relief='solid', bd=1)
+        right_frame = ttk.Frame(parent, relief='solid', borderwidth=1)
         right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
 
         # 탭 노트북
@@ -620,269 +592,21 @@ class CSVAnalyzerApp:
         # Combinations Analysis 탭
         self.build_combinations_tab()
 
-    def build_slicer_tab(self):
-        """CSV 슬라이싱 탭 - 대용량 데이터 지원"""
-        slicer_frame = ttk.Frame(self.notebook)
-        self.notebook.add(slicer_frame, text="CSV Slicer")
-
-        # 컨트롤 영역
-        control_frame = tk.Frame(slicer_frame, bg=self.current_theme['panel_bg'])
-        control_frame.pack(fill='x', padx=10, pady=10)
-
-        # 행 범위 선택
-        range_frame = tk.Frame(control_frame, bg=self.current_theme['panel_bg'])
-        range_frame.pack(fill='x', pady=(0, 10))
-
-        tk.Label(range_frame, text="Row Range:", font=('Arial', 10, 'bold'),
-                bg=self.current_theme['panel_bg'], fg=self.current_theme['text_color']).pack(side='left')
-
-        # 시작 행
-        tk.Label(range_frame, text="Start:", bg=self.current_theme['panel_bg'], 
-                fg=self.current_theme['text_color']).pack(side='left', padx=(10, 5))
-        self.start_row_var = tk.StringVar(value="0")
-        self.start_row_entry = tk.Entry(range_frame, textvariable=self.start_row_var, width=10,
-                                       bg=self.current_theme['entry_bg'], fg=self.current_theme['text_color'])
-        self.start_row_entry.pack(side='left', padx=(0, 10))
-
-        # 끝 행
-        tk.Label(range_frame, text="End:", bg=self.current_theme['panel_bg'], 
-                fg=self.current_theme['text_color']).pack(side='left', padx=(0, 5))
-        self.end_row_var = tk.StringVar(value="1000")
-        self.end_row_entry = tk.Entry(range_frame, textvariable=self.end_row_var, width=10,
-                                     bg=self.current_theme['entry_bg'], fg=self.current_theme['text_color'])
-        self.end_row_entry.pack(side='left', padx=(0, 10))
-
-        # 컬럼 선택
-        column_frame = tk.Frame(control_frame, bg=self.current_theme['panel_bg'])
-        column_frame.pack(fill='x', pady=(0, 10))
-
-        tk.Label(column_frame, text="Columns:", font=('Arial', 10, 'bold'),
-                bg=self.current_theme['panel_bg'], fg=self.current_theme['text_color']).pack(side='left')
-
-        # 컬럼 선택 체크박스들
-        self.column_checkboxes = {}
-        self.column_vars = {}
-        
-        # 컬럼 선택을 위한 스크롤 가능한 프레임
-        column_scroll_frame = tk.Frame(column_frame, bg=self.current_theme['panel_bg'])
-        column_scroll_frame.pack(side='left', fill='x', expand=True, padx=(10, 0))
-        
-        self.column_canvas = tk.Canvas(column_scroll_frame, height=60, bg=self.current_theme['panel_bg'])
-        scrollbar = ttk.Scrollbar(column_scroll_frame, orient="horizontal", command=self.column_canvas.xview)
-        self.column_canvas.configure(xscrollcommand=scrollbar.set)
-        
-        self.column_canvas.pack(side='top', fill='x', expand=True)
-        scrollbar.pack(side='bottom', fill='x')
-        
-        self.column_inner_frame = tk.Frame(self.column_canvas, bg=self.current_theme['panel_bg'])
-        self.column_canvas.create_window((0, 0), window=self.column_inner_frame, anchor='nw')
-        
-        # Select All / Clear All 버튼들
-        button_frame = tk.Frame(control_frame, bg=self.current_theme['panel_bg'])
-        button_frame.pack(fill='x', pady=(0, 10))
-        
-        self.select_all_btn = self.create_styled_button(button_frame, "Select All", 
-                                                       self.select_all_columns, '#27AE60')
-        self.select_all_btn.pack(side='left', padx=(0, 5))
-        
-        self.clear_all_btn = self.create_styled_button(button_frame, "Clear All", 
-                                                      self.clear_all_columns, '#E74C3C')
-        self.clear_all_btn.pack(side='left', padx=(0, 5))
-
-        # 슬라이스 및 내보내기 버튼
-        self.slice_btn = self.create_styled_button(control_frame, "Slice Data", 
-                                                  self.slice_data, '#3498DB')
-        self.slice_btn.pack(side='left', padx=(0, 5))
-
-        self.export_slice_btn = self.create_styled_button(control_frame, "Export Sliced Data", 
-                                                         self.export_sliced_data, '#9B59B6')
-        self.export_slice_btn.pack(side='left')
-
-        # 슬라이스된 데이터 표시 영역
-        result_frame = tk.Frame(slicer_frame, bg=self.current_theme['panel_bg'])
-        result_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
-
-        # 결과 정보
-        info_frame = tk.Frame(result_frame, bg=self.current_theme['panel_bg'])
-        info_frame.pack(fill='x', pady=(0, 5))
-        
-        self.slice_info_label = tk.Label(info_frame, text="No data sliced yet", 
-                                        font=('Arial', 9), fg=self.current_theme['secondary_text'],
-                                        bg=self.current_theme['panel_bg'])
-        self.slice_info_label.pack(side='left')
-
-        # 슬라이스된 데이터 Treeview
-        tree_container = tk.Frame(result_frame, bg=self.current_theme['panel_bg'])
-        tree_container.pack(fill=tk.BOTH, expand=True)
-
-        self.slicer_tree = ttk.Treeview(tree_container, show='tree headings', height=20)
-        
-        # 스크롤바
-        v_scrollbar = ttk.Scrollbar(tree_container, orient=tk.VERTICAL, command=self.slicer_tree.yview)
-        h_scrollbar = ttk.Scrollbar(tree_container, orient=tk.HORIZONTAL, command=self.slicer_tree.xview)
-        
-        self.slicer_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
-        
-        # 그리드 배치
-        self.slicer_tree.grid(row=0, column=0, sticky='nsew')
-        v_scrollbar.grid(row=0, column=1, sticky='ns')
-        h_scrollbar.grid(row=1, column=0, sticky='ew')
-        
-        tree_container.grid_rowconfigure(0, weight=1)
-        tree_container.grid_columnconfigure(0, weight=1)
-
-        # 초기 상태
-        self.current_sliced_data = None
-        self.update_column_checkboxes()
-
-    def update_column_checkboxes(self):
-        """컬럼 체크박스 업데이트"""
-        # 기존 체크박스 제거
-        for widget in self.column_inner_frame.winfo_children():
-            widget.destroy()
-        
-        if self.state.df is None:
-            return
-        
-        # 컬럼별 체크박스 생성
-        for i, col in enumerate(self.state.df.columns):
-            var = tk.BooleanVar(value=True)  # 기본적으로 모두 선택
-            self.column_vars[col] = var
-            
-            cb = tk.Checkbutton(self.column_inner_frame, text=col, variable=var,
-                               bg=self.current_theme['panel_bg'], fg=self.current_theme['text_color'],
-                               selectcolor=self.current_theme['entry_bg'])
-            cb.pack(side='left', padx=5)
-        
-        # 캔버스 크기 업데이트
-        self.column_inner_frame.update_idletasks()
-        self.column_canvas.configure(scrollregion=self.column_canvas.bbox('all'))
-
-    def select_all_columns(self):
-        """모든 컬럼 선택"""
-        for var in self.column_vars.values():
-            var.set(True)
-
-    def clear_all_columns(self):
-        """모든 컬럼 선택 해제"""
-        for var in self.column_vars.values():
-            var.set(False)
-
-    def slice_data(self):
-        """데이터 슬라이싱 실행"""
-        if self.state.df is None:
-            self.show_toast("No data loaded", "error")
-            return
-        
-        try:
-            # 행 범위 파싱
-            start_row = int(self.start_row_var.get())
-            end_row = int(self.end_row_var.get())
-            
-            # 유효성 검사
-            if start_row < 0:
-                start_row = 0
-            if end_row > len(self.state.df):
-                end_row = len(self.state.df)
-            if start_row >= end_row:
-                self.show_toast("Invalid row range", "error")
-                return
-            
-            # 선택된 컬럼들
-            selected_columns = [col for col, var in self.column_vars.items() if var.get()]
-            if not selected_columns:
-                self.show_toast("No columns selected", "error")
-                return
-            
-            # 데이터 슬라이싱 (최적화된 방식)
-            self.current_sliced_data = self.state.df.iloc[start_row:end_row][selected_columns].copy()
-            
-            # 결과 표시
-            self.display_sliced_data()
-            
-            # 정보 업데이트
-            info_text = f"Sliced {len(self.current_sliced_data):,} rows, {len(selected_columns)} columns"
-            self.slice_info_label.config(text=info_text)
-            
-            self.show_toast(f"Data sliced successfully: {len(self.current_sliced_data)} rows", "ok")
-            
-        except ValueError as e:
-            self.show_toast(f"Invalid input: {e}", "error")
-        except Exception as e:
-            self.show_toast(f"Slicing failed: {e}", "error")
-
-    def display_sliced_data(self):
-        """슬라이스된 데이터 표시 (페이지네이션 지원)"""
-        if self.current_sliced_data is None or self.current_sliced_data.empty:
-            return
-        
-        # Treeview 초기화
-        for item in self.slicer_tree.get_children():
-            self.slicer_tree.delete(item)
-        
-        # 컬럼 헤더 설정
-        self.slicer_tree['columns'] = list(self.current_sliced_data.columns)
-        for col in self.current_sliced_data.columns:
-            self.slicer_tree.heading(col, text=col)
-            self.slicer_tree.column(col, width=min(120, len(str(col)) * 8))
-        
-        # 데이터 표시 (최대 10000행까지 표시 제한 해제 - 페이지네이션으로 처리)
-        max_display_rows = min(5000, len(self.current_sliced_data))  # 성능을 위해 5000행으로 제한
-        
-        for idx, row in self.current_sliced_data.head(max_display_rows).iterrows():
-            values = []
-            for val in row:
-                if isinstance(val, float):
-                    values.append(f"{val:.2f}")
-                elif pd.isna(val):
-                    values.append("")
-                else:
-                    values.append(str(val))
-            self.slicer_tree.insert('', 'end', values=values)
-        
-        # 대용량 데이터 안내
-        if len(self.current_sliced_data) > max_display_rows:
-            self.show_toast(f"Showing first {max_display_rows:,} rows of {len(self.current_sliced_data):,} total rows", "info")
-
-    def export_sliced_data(self):
-        """슬라이스된 데이터 내보내기"""
-        if self.current_sliced_data is None:
-            self.show_toast("No sliced data to export", "error")
-            return
-        
-        try:
-            from tkinter import filedialog
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".csv",
-                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
-                title="Save sliced data"
-            )
-            
-            if file_path:
-                self.current_sliced_data.to_csv(file_path, index=True)
-                self.show_toast(f"Exported to {file_path}", "success")
-                
-        except Exception as e:
-            self.show_toast(f"Export failed: {e}", "error")
-
     def build_combinations_tab(self):
         """조합 분석 탭"""
         combinations_frame = ttk.Frame(self.notebook)
         self.notebook.add(combinations_frame, text="Combinations Analysis")
 
         # 메인 컨테이너
-        main_container = tk.Frame(combinations_frame, bg=self.current_theme['panel_bg'])
+        main_container = ttk.Frame(combinations_frame)
         main_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         # 상단 컨트롤 영역
-        control_frame = tk.Frame(main_container, bg=self.current_theme['panel_bg'])
+        control_frame = ttk.Frame(main_container)
         control_frame.pack(fill='x', pady=(0, 10))
 
         # 제목
-        title_label = tk.Label(control_frame, text="데이터 관계 분석", 
-                              font=('Arial', 12, 'bold'),
-                              bg=self.current_theme['panel_bg'], 
-                              fg=self.current_theme['text_color'])
+        title_label = ttk.Label(control_frame, text="데이터 관계 분석", font=('Arial', 12, 'bold'))
         title_label.pack(side='left')
 
         # 분석 실행 버튼
@@ -892,39 +616,30 @@ class CSVAnalyzerApp:
                                             fg=self.current_theme['button_fg'],
                                             font=('Arial', 10, 'bold'),
                                             relief='flat', bd=0, padx=20, pady=8)
+        self._register(self.run_combinations_btn, 'button')
         self.run_combinations_btn.pack(side='right')
 
         # 설정 영역
-        settings_frame = tk.Frame(main_container, bg=self.current_theme['panel_bg'])
+        settings_frame = ttk.Frame(main_container)
         settings_frame.pack(fill='x', pady=(0, 10))
 
         # DSL 토큰 입력
-        dsl_label = tk.Label(settings_frame, text="DSL 토큰 (선택사항):",
-                           bg=self.current_theme['panel_bg'], 
-                           fg=self.current_theme['text_color'])
+        dsl_label = ttk.Label(settings_frame, text="DSL 토큰 (선택사항):")
         dsl_label.pack(side='left', padx=(0, 10))
 
-        self.dsl_tokens_entry = tk.Entry(settings_frame, width=30,
-                                       bg=self.current_theme['entry_bg'],
-                                       fg=self.current_theme['text_color'],
-                                       insertbackground=self.current_theme['text_color'])
+        self.dsl_tokens_entry = ttk.Entry(settings_frame, width=30)
         self.dsl_tokens_entry.pack(side='left', padx=(0, 20))
 
         # 상위 K개 결과 설정
-        topk_label = tk.Label(settings_frame, text="상위 결과 수:",
-                            bg=self.current_theme['panel_bg'], 
-                            fg=self.current_theme['text_color'])
+        topk_label = ttk.Label(settings_frame, text="상위 결과 수:")
         topk_label.pack(side='left', padx=(0, 5))
 
         self.topk_var = tk.StringVar(value="10")
-        topk_entry = tk.Entry(settings_frame, textvariable=self.topk_var, width=5,
-                            bg=self.current_theme['entry_bg'],
-                            fg=self.current_theme['text_color'],
-                            insertbackground=self.current_theme['text_color'])
+        topk_entry = ttk.Entry(settings_frame, textvariable=self.topk_var, width=5)
         topk_entry.pack(side='left')
 
         # 결과 표시 영역
-        result_frame = tk.Frame(main_container, bg=self.current_theme['panel_bg'])
+        result_frame = ttk.Frame(main_container)
         result_frame.pack(fill=tk.BOTH, expand=True)
 
         # 결과 텍스트 위젯 (스크롤 포함)
@@ -937,6 +652,7 @@ class CSVAnalyzerApp:
                                               insertbackground=self.current_theme['text_color'],
                                               font=('Consolas', 9),
                                               wrap=tk.WORD)
+        self._register(self.combinations_result_text, 'text')
         
         # 스크롤바
         scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=self.combinations_result_text.yview)
@@ -998,6 +714,9 @@ class CSVAnalyzerApp:
         except ValueError:
             top_k = 10
 
+        # 같은 데이터/설정으로 다시 실행하면 이전 결과 재사용 (데이터 로드 시 캐시 초기화)
+        cache_key = ("combinations", id(self.state.df), len(self.state.df), top_k, tuple(dsl_tokens or ()))
+
         # 백그라운드 스레드에서 실행될 함수
         def run_analysis():
             from src.core.combinations import AdvancedCombinationsAnalyzer, AnalysisConfig
@@ -1023,6 +742,7 @@ class CSVAnalyzerApp:
             try:
                 if result.success:
                     summary, detailed = result.data
+                    self.data_cache.set(cache_key, result.data)
                     # 텍스트 위젯에 결과 표시
                     self.combinations_result_text.config(state=tk.NORMAL)
                     self.combinations_result_text.delete(1.0, tk.END)
@@ -1040,6 +760,12 @@ class CSVAnalyzerApp:
                 # 버튼 상태 복원
                 self.run_combinations_btn.config(text="분석 실행", state="normal")
         
+        cached = self.data_cache.get(cache_key)
+        if cached is not None:
+            # DataCache는 스레드 안전하지 않으므로 메인 스레드에서만 조회/저장
+            on_complete(TaskResult(success=True, data=cached))
+            return
+
         # 백그라운드 태스크 실행
         self.task_manager.run_task(run_analysis, on_complete)
 
@@ -1098,21 +824,17 @@ class CSVAnalyzerApp:
         self.notebook.add(preview_frame, text="Data Preview")
 
         # 미리보기 라벨과 행 수 정보
-        header_frame = tk.Frame(preview_frame, bg=self.current_theme['panel_bg'])
+        header_frame = ttk.Frame(preview_frame)
         header_frame.pack(fill='x', padx=10, pady=(10, 5))
         
-        preview_label = tk.Label(header_frame, text="Preview", 
-                                font=('Arial', 11, 'bold'),
-                                bg=self.current_theme['panel_bg'], fg=self.current_theme['text_color'])
+        preview_label = ttk.Label(header_frame, text="Preview", font=('Arial', 11, 'bold'))
         preview_label.pack(side='left')
         
-        self.row_count_label = tk.Label(header_frame, text="", 
-                                       font=('Arial', 9),
-                                       bg=self.current_theme['panel_bg'], fg=self.current_theme['secondary_text'])
+        self.row_count_label = ttk.Label(header_frame, text="", font=('Arial', 9), style='Secondary.TLabel')
         self.row_count_label.pack(side='right')
 
         # 테이블 프레임
-        table_frame = tk.Frame(preview_frame, bg=self.current_theme['panel_bg'])
+        table_frame = ttk.Frame(preview_frame)
         table_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
 
         # Treeview with scrollbars
@@ -1126,7 +848,10 @@ class CSVAnalyzerApp:
         v_scrollbar = ttk.Scrollbar(tree_container, orient=tk.VERTICAL, command=self.preview_tree.yview)
         h_scrollbar = ttk.Scrollbar(tree_container, orient=tk.HORIZONTAL, command=self.preview_tree.xview)
         
-        self.preview_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.preview_tree.configure(xscrollcommand=h_scrollbar.set)
+        # 세로 스크롤은 보이는 행만 채우는 가상 테이블이 담당
+        self.preview_table = VirtualTable(self.root, self.preview_tree, v_scrollbar,
+                                          formatter=self._format_preview_rows)
         
         # 그리드 배치
         self.preview_tree.grid(row=0, column=0, sticky='nsew')
@@ -1142,7 +867,7 @@ class CSVAnalyzerApp:
         self.notebook.add(analysis_frame, text="Analysis")
 
         # 컨트롤 영역
-        control_frame = tk.Frame(analysis_frame, bg=self.current_theme['panel_bg'])
+        control_frame = ttk.Frame(analysis_frame)
         control_frame.pack(fill='x', padx=10, pady=10)
 
         # 컬럼 선택
@@ -1166,22 +891,22 @@ class CSVAnalyzerApp:
         main_paned.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
 
         # 왼쪽: 분석 결과 텍스트
-        left_frame = tk.Frame(main_paned, bg=self.current_theme['panel_bg'])
+        left_frame = ttk.Frame(main_paned)
         main_paned.add(left_frame, weight=1)
 
         # 분석 결과 라벨
-        result_label = tk.Label(left_frame, text="Analysis Results", 
-                               font=('Arial', 11, 'bold'), bg=self.current_theme['panel_bg'], fg=self.current_theme['text_color'])
+        result_label = ttk.Label(left_frame, text="Analysis Results", font=('Arial', 11, 'bold'))
         result_label.pack(anchor='w', pady=(0, 5))
 
         # 스크롤 가능한 텍스트 영역
-        text_container = tk.Frame(left_frame, bg=self.current_theme['panel_bg'])
+        text_container = ttk.Frame(left_frame)
         text_container.pack(fill=tk.BOTH, expand=True)
 
         self.analysis_text = tk.Text(text_container, wrap=tk.WORD, 
                                     font=('Consolas', 9), bg=self.current_theme['tree_bg'], 
                                     fg=self.current_theme['text_color'], height=20,
                                     insertbackground=self.current_theme['text_color'])
+        self._register(self.analysis_text, 'text')
         text_scrollbar = ttk.Scrollbar(text_container, command=self.analysis_text.yview)
         self.analysis_text.configure(yscrollcommand=text_scrollbar.set)
 
@@ -1189,16 +914,15 @@ class CSVAnalyzerApp:
         text_scrollbar.pack(side='right', fill='y')
 
         # 오른쪽: 시각화 영역
-        right_frame = tk.Frame(main_paned, bg=self.current_theme['panel_bg'])
+        right_frame = ttk.Frame(main_paned)
         main_paned.add(right_frame, weight=1)
 
         # 시각화 라벨
-        viz_label = tk.Label(right_frame, text="Visualization", 
-                            font=('Arial', 11, 'bold'), bg=self.current_theme['panel_bg'], fg=self.current_theme['text_color'])
+        viz_label = ttk.Label(right_frame, text="Visualization", font=('Arial', 11, 'bold'))
         viz_label.pack(anchor='w', pady=(0, 5))
 
         # 시각화 캔버스 영역
-        self.viz_frame = tk.Frame(right_frame, bg=self.current_theme['panel_bg'], relief='sunken', bd=1)
+        self.viz_frame = ttk.Frame(right_frame, relief='sunken', borderwidth=1)
         self.viz_frame.pack(fill=tk.BOTH, expand=True)
 
         # 초기 메시지
@@ -1206,10 +930,16 @@ class CSVAnalyzerApp:
         self.analysis_text.configure(state='disabled')
 
         # 초기 시각화 메시지
-        initial_viz_label = tk.Label(self.viz_frame, text="Select a column and click 'Create Visualization'\nto generate charts.", 
-                                    font=('Arial', 10), fg=self.current_theme['secondary_text'], bg=self.current_theme['panel_bg'])
+        initial_viz_label = ttk.Label(self.viz_frame,
+                                      text="Select a column and click 'Create Visualization'\nto generate charts.",
+                                      font=('Arial', 10), style='Secondary.TLabel')
         initial_viz_label.pack(expand=True)
 
+        # 차트 Figure/캔버스는 한 번만 생성 (첫 시각화 때 배치하고 이후에는 축만 다시 그림)
+        self.viz_fig = Figure(figsize=(8, 6))
+        self.viz_axes = self.viz_fig.subplots(2, 2)
+        self.viz_canvas = FigureCanvasTkAgg(self.viz_fig, self.viz_frame)
+
     def show_toast(self, message: str, kind: str = "info"):
         """토스트 메시지 표시"""
         if self.toast:
@@ -1266,41 +996,40 @@ class CSVAnalyzerApp:
             return
 
         self.begin_busy("Loading...")
+        self._load_request_id += 1
+        request_id = self._load_request_id
 
-        def load_thread():
-            try:
-                # 큰 파일 처리를 위한 청킹
-                chunk_size = 50000  # 50K로 증가
-                chunks = []
-                total_rows = 0
-                
-                # 파일 크기 체크
-                file_size = Path(file_path).stat().st_size
-                if file_size > 100 * 1024 * 1024:  # 100MB 이상 (기준 상향)
-                    # 샘플링 로드 (처음 50000행으로 증가)
-                    self.state.df = pd.read_csv(file_path, nrows=50000)
-                    self.root.after(0, lambda: self.on_csv_loaded(file_path, is_sample=True))
-                else:
-                    # 전체 로드
-                    self.state.df = pd.read_csv(file_path)
-                    self.root.after(0, lambda: self.on_csv_loaded(file_path, is_sample=False))
-                    
-                self.state.numeric_cols = self.state.df.select_dtypes(include='number').columns.tolist()
-                
-            except Exception as e:
-                self.root.after(0, lambda: self.on_csv_error(str(e)))
+        # 파싱은 작업 스레드에서 (pandas/pyarrow C 코드는 GIL을 놓으므로 Tk 루프가 계속 그려짐)
+        def load_task():
+            # 100MB 이상은 처음 50000행만 샘플링 로드
+            is_sample = Path(file_path).stat().st_size > 100 * 1024 * 1024
+            return load_frame(file_path, self.frame_cache, nrows=50000 if is_sample else None) + (is_sample,)
 
-        threading.Thread(target=load_thread, daemon=True).start()
+        def on_complete(result):
+            if request_id != self._load_request_id:
+                return  # 이후에 시작된 로드가 있으므로 이 결과는 버림
+            if result.success:
+                (self.state.df, self.state.numeric_cols, self.state.memory_bytes,
+                 self.state.dtype_report, is_sample) = result.data
+                self.on_csv_loaded(file_path, is_sample=is_sample)
+            else:
+                self.on_csv_error(result.error)
+
+        self.task_manager.run_task(load_task, on_complete)
 
     def on_csv_loaded(self, file_path: str, is_sample: bool = False):
         """CSV 로드 완료"""
-        # 통계 업데이트 (테마 색상도 함께 적용)
-        self.rows_label.config(text=f"{len(self.state.df):,}" + (" (sample)" if is_sample else ""),
-                              bg=self.current_theme['panel_bg'], fg=self.current_theme['text_color'])
-        self.cols_label.config(text=f"{len(self.state.df.columns):,}",
-                              bg=self.current_theme['panel_bg'], fg=self.current_theme['text_color'])
-        self.memory_label.config(text=format_bytes(self.state.df.memory_usage(deep=True).sum()),
-                                bg=self.current_theme['panel_bg'], fg=self.current_theme['text_color'])
+        # 이전 데이터 기준으로 만든 캐시 항목 제거
+        self.data_cache.clear()
+
+        # 통계 업데이트 (색상은 ttk 스타일이 담당)
+        self.rows_label.config(text=f"{len(self.state.df):,}" + (" (sample)" if is_sample else ""))
+        self.cols_label.config(text=f"{len(self.state.df.columns):,}")
+        saved = sum(entry[2] for entry in self.state.dtype_report.values())
+        memory_text = format_bytes(self.state.memory_bytes)
+        if saved > 0:
+            memory_text += f" (-{format_bytes(saved)})"
+        self.memory_label.config(text=memory_text)
 
         # 컬럼 콤보박스 업데이트
         self.column_combo['values'] = list(self.state.df.columns)
@@ -1323,11 +1052,8 @@ class CSVAnalyzerApp:
 
     def update_preview_table(self):
         """미리보기 테이블 업데이트 (슬라이싱 적용)"""
-        # 기존 데이터 제거
-        for item in self.preview_tree.get_children():
-            self.preview_tree.delete(item)
-
         if self.state.df is None or self.state.df.empty:
+            self.preview_table.set_frame(None)
             self.row_count_label.config(text="No data loaded")
             return
 
@@ -1349,18 +1075,9 @@ class CSVAnalyzerApp:
 
         # 데이터 추가 (1000행으로 제한 - 슬라이싱 증가)
         preview_data = self.state.df.head(1000)
-        
-        for idx, row in preview_data.iterrows():
-            # 텍스트 길이 제한 (50자)
-            values = []
-            for val in row:
-                str_val = str(val)
-                if len(str_val) > 50:
-                    values.append(str_val[:47] + '...')
-                else:
-                    values.append(str_val)
-            
-            self.preview_tree.insert('', 'end', text=str(idx), values=values)
+
+        # 보이는 구간만 문자열로 변환해 삽입 (텍스트는 50자로 제한)
+        self.preview_table.set_frame(preview_data)
         
         total_loaded = len(self.state.df)
         preview_shown = len(preview_data)
@@ -1371,6 +1088,11 @@ class CSVAnalyzerApp:
         # Treeview 업데이트 강제
         self.preview_tree.update_idletasks()
 
+    @staticmethod
+    def _format_preview_rows(window: pd.DataFrame) -> list:
+        """미리보기 표시 구간의 셀 포맷 (50자 초과는 생략 표시)"""
+        return truncate_cells(window, 50)
+
     def analyze_column(self):
         """컬럼 분석"""
         if self.state.df is None:
@@ -1383,7 +1105,12 @@ class CSVAnalyzerApp:
             return
 
         try:
-            info = column_profile(self.state.df, column)
+            # 같은 데이터/컬럼의 프로파일은 캐시에서 재사용 (새 파일 로드 시 캐시 초기화)
+            cache_key = ("profile", id(self.state.df), column, len(self.state.df))
+            info = self.data_cache.get(cache_key)
+            if info is None:
+                info = column_profile(self.state.df, column)
+                self.data_cache.set(cache_key, info)
 
             # 분석 결과 표시
             self.analysis_text.configure(state='normal')
@@ -1424,9 +1151,22 @@ class CSVAnalyzerApp:
             return
 
         try:
-            # 기존 시각화 제거
+            # 기존 안내 문구/캐시 이미지 제거 (차트 캔버스 위젯은 재사용)
+            canvas_widget = self.viz_canvas.get_tk_widget()
             for widget in self.viz_frame.winfo_children():
-                widget.destroy()
+                if widget is not canvas_widget:
+                    widget.destroy()
+
+            # 같은 컬럼/데이터/테마로 그린 차트는 렌더링된 PNG를 그대로 표시
+            cache_key = ("viz", column, str(self.state.df[column].dtype), len(self.state.df), self.is_dark_mode)
+            cached_png = self.data_cache.get(cache_key)
+            if cached_png is not None:
+                canvas_widget.pack_forget()
+                photo = tk.PhotoImage(data=cached_png)
+                image_label = ttk.Label(self.viz_frame, image=photo)
+                image_label.image = photo  # PhotoImage 참조 유지
+                image_label.pack(fill=tk.BOTH, expand=True)
+                return
 
             # matplotlib 한글 폰트 설정
             plt.rcParams['font.family'] = ['Malgun Gothic', 'DejaVu Sans']
@@ -1435,9 +1175,13 @@ class CSVAnalyzerApp:
             # 다크모드에 따른 색상 설정
             current_theme = self.themes['dark'] if self.is_dark_mode else self.themes['light']
             
-            # Figure 생성 및 테마 적용
-            fig, axes = plt.subplots(2, 2, figsize=(8, 6))
-            
+            # 탭에서 한 번 만든 Figure를 재사용 (축만 비우고 다시 그림)
+            fig, axes = self.viz_fig, self.viz_axes
+            for ax in axes.flat:
+                ax.clear()
+                # clear()는 배경/눈금 색상과 파이 차트의 aspect를 초기화하지 않음
+                ax.set_aspect('auto')
+
             if self.is_dark_mode:
                 fig.patch.set_facecolor('#2B2B2B')
                 text_color = '#CCCCCC'
@@ -1467,11 +1211,16 @@ class CSVAnalyzerApp:
                         ax.spines['left'].set_color(text_color)
                         ax.grid(True, color=grid_color, alpha=0.3)
                     else:
-                        ax.tick_params(labelsize=8)
+                        ax.set_facecolor('white')
+                        ax.tick_params(colors='black', labelsize=8)
+                        for spine in ax.spines.values():
+                            spine.set_color('black')
                         ax.grid(True, alpha=0.3)
                 
-                # 1. 히스토그램
-                axes[0, 0].hist(data, bins=20, alpha=0.7, color=chart_colors[0], edgecolor=text_color)
+                # 1. 히스토그램 (구간 개수는 커널로 계산하고 막대만 그림)
+                counts, edges = histogram(data.to_numpy(dtype=np.float64), nbins=20)
+                axes[0, 0].bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+                               alpha=0.7, color=chart_colors[0], edgecolor=text_color)
                 axes[0, 0].set_title('Histogram', fontsize=10, color=text_color)
                 
                 # 2. 박스플롯
@@ -1509,7 +1258,10 @@ class CSVAnalyzerApp:
                         ax.spines['left'].set_color(text_color)
                         ax.grid(True, color=grid_color, alpha=0.3)
                     else:
-                        ax.tick_params(labelsize=8)
+                        ax.set_facecolor('white')
+                        ax.tick_params(colors='black', labelsize=8)
+                        for spine in ax.spines.values():
+                            spine.set_color('black')
                         ax.grid(True, alpha=0.3)
                 
                 # 1. 막대 그래프
@@ -1540,12 +1292,18 @@ class CSVAnalyzerApp:
                 if self.is_dark_mode:
                     axes[1, 1].set_facecolor('#2B2B2B')
             
-            plt.tight_layout()
-            
-            # tkinter에 matplotlib 캔버스 추가
-            canvas = FigureCanvasTkAgg(fig, self.viz_frame)
+            fig.tight_layout()
+
+            # 기존 캔버스에 다시 그리기 (Agg 버퍼/Tk 위젯을 새로 만들지 않음)
+            canvas = self.viz_canvas
             canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            if not canvas_widget.winfo_manager():
+                canvas_widget.pack(fill=tk.BOTH, expand=True)
+
+            # 방금 그린 Agg 버퍼를 다시 렌더링하지 않고 PNG로 인코딩해 캐시
+            png = io.BytesIO()
+            plt.imsave(png, np.asarray(canvas.buffer_rgba()), format='png')
+            self.data_cache.set(cache_key, base64.b64encode(png.getvalue()))
             
         except Exception as e:
             self.show_toast(f"Failed to create visualization: {e}", "error")
@@ -1556,67 +1314,83 @@ class CSVAnalyzerApp:
         self.notebook.add(slicer_frame, text="CSV Slicer")
 
         # 컨트롤 영역
-        control_frame = tk.Frame(slicer_frame, bg=self.current_theme['panel_bg'])
+        control_frame = ttk.Frame(slicer_frame)
         control_frame.pack(fill='x', padx=10, pady=10)
 
         # 제목
-        title_label = tk.Label(control_frame, text="CSV Data Slicer", 
-                              font=('Arial', 12, 'bold'), 
-                              bg=self.current_theme['panel_bg'], 
-                              fg=self.current_theme['text_color'])
+        title_label = ttk.Label(control_frame, text="CSV Data Slicer", font=('Arial', 12, 'bold'))
         title_label.pack(anchor='w', pady=(0, 10))
 
         # 행 범위 설정
-        row_frame = tk.Frame(control_frame, bg=self.current_theme['panel_bg'])
+        row_frame = ttk.Frame(control_frame)
         row_frame.pack(fill='x', pady=5)
 
-        tk.Label(row_frame, text="Row Range:", font=('Arial', 10, 'bold'), 
-                bg=self.current_theme['panel_bg'], fg=self.current_theme['text_color']).pack(side='left')
-        tk.Label(row_frame, text="From:", bg=self.current_theme['panel_bg'], 
-                fg=self.current_theme['text_color']).pack(side='left', padx=(10, 5))
+        ttk.Label(row_frame, text="Row Range:", font=('Arial', 10, 'bold')).pack(side='left')
+        ttk.Label(row_frame, text="From:").pack(side='left', padx=(10, 5))
         self.row_start_var = tk.StringVar(value="1")
-        start_entry = tk.Entry(row_frame, textvariable=self.row_start_var, width=10,
-                              bg=self.current_theme['entry_bg'], fg=self.current_theme['text_color'],
-                              insertbackground=self.current_theme['text_color'])
+        start_entry = ttk.Entry(row_frame, textvariable=self.row_start_var, width=10)
         start_entry.pack(side='left', padx=(0, 10))
         
-        tk.Label(row_frame, text="To:", bg=self.current_theme['panel_bg'], 
-                fg=self.current_theme['text_color']).pack(side='left', padx=(0, 5))
+        ttk.Label(row_frame, text="To:").pack(side='left', padx=(0, 5))
         self.row_end_var = tk.StringVar(value="1000")
-        end_entry = tk.Entry(row_frame, textvariable=self.row_end_var, width=10,
-                            bg=self.current_theme['entry_bg'], fg=self.current_theme['text_color'],
-                            insertbackground=self.current_theme['text_color'])
+        end_entry = ttk.Entry(row_frame, textvariable=self.row_end_var, width=10)
         end_entry.pack(side='left')
 
+        # 입력이 멈춘 뒤 한 번만 슬라이싱 (키 입력마다 다시 계산하지 않음)
+        start_entry.bind('<KeyRelease>', self._schedule_slice)
+        end_entry.bind('<KeyRelease>', self._schedule_slice)
+
         # 컬럼 선택
-        col_frame = tk.Frame(control_frame, bg=self.current_theme['panel_bg'])
+        col_frame = ttk.Frame(control_frame)
         col_frame.pack(fill='x', pady=5)
 
-        tk.Label(col_frame, text="Columns:", font=('Arial', 10, 'bold'), 
-                bg=self.current_theme['panel_bg'], fg=self.current_theme['text_color']).pack(side='left')
+        ttk.Label(col_frame, text="Columns:", font=('Arial', 10, 'bold')).pack(side='left')
         
         # 컬럼 선택 프레임
-        self.column_selection_frame = tk.Frame(col_frame, bg=self.current_theme['panel_bg'])
+        self.column_selection_frame = ttk.Frame(col_frame)
         self.column_selection_frame.pack(side='left', padx=(10, 0))
 
+        # 전체 선택/해제 버튼
+        select_frame = ttk.Frame(self.column_selection_frame)
+        select_frame.pack(fill='x', pady=(0, 5))
+
+        tk.Button(select_frame, text="All", font=('Arial', 8),
+                  command=self.select_all_columns).pack(side='left', padx=(0, 5))
+        tk.Button(select_frame, text="None", font=('Arial', 8),
+                  command=self.deselect_all_columns).pack(side='left')
+
+        # 컬럼 목록 (컬럼 수와 관계없이 위젯 하나, 테마도 위젯 하나만 갱신)
+        list_frame = ttk.Frame(self.column_selection_frame)
+        list_frame.pack(fill='x')
+        self.column_listbox = tk.Listbox(list_frame, selectmode=tk.MULTIPLE, exportselection=False,
+                                         height=8, width=24, font=('Arial', 8), activestyle='none',
+                                         bg=self.current_theme['entry_bg'], fg=self.current_theme['text_color'],
+                                         selectbackground=self.current_theme['accent'])
+        self._register(self.column_listbox, 'listbox')
+        column_scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.column_listbox.yview)
+        self.column_listbox.configure(yscrollcommand=column_scrollbar.set)
+        self.column_listbox.pack(side='left', fill='x')
+        column_scrollbar.pack(side='left', fill='y')
+        self.column_listbox.bind('<<ListboxSelect>>', self._schedule_slice)
+
         # 버튼 영역
-        button_frame = tk.Frame(control_frame, bg=self.current_theme['panel_bg'])
+        button_frame = ttk.Frame(control_frame)
         button_frame.pack(fill='x', pady=10)
 
         slice_btn = self.create_styled_button(button_frame, "Apply Slice", 
                                              self.apply_slice, '#27AE60')
         slice_btn.pack(side='left', padx=(0, 10))
 
-        export_btn = self.create_styled_button(button_frame, "Export Sliced Data", 
-                                              self.export_sliced_data, '#F39C12')
-        export_btn.pack(side='left')
+        self.export_btn = self.create_styled_button(button_frame, "Export Sliced Data", 
+                                                   self.export_sliced_data, '#F39C12')
+        self.export_btn.pack(side='left')
 
         # 슬라이싱 결과 영역
-        result_frame = tk.Frame(slicer_frame, bg=self.current_theme['panel_bg'])
+        result_frame = ttk.Frame(slicer_frame)
         result_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
 
         # 결과 테이블
-        self.slice_tree_container = tk.Frame(result_frame, bg=self.current_theme['panel_bg'])
+        self.slice_tree_container = ttk.Frame(result_frame)
         self.slice_tree_container.pack(fill=tk.BOTH, expand=True)
 
         # 슬라이싱된 데이터용 Treeview
@@ -1626,7 +1400,10 @@ class CSVAnalyzerApp:
         slice_v_scrollbar = ttk.Scrollbar(self.slice_tree_container, orient=tk.VERTICAL, command=self.slice_tree.yview)
         slice_h_scrollbar = ttk.Scrollbar(self.slice_tree_container, orient=tk.HORIZONTAL, command=self.slice_tree.xview)
         
-        self.slice_tree.configure(yscrollcommand=slice_v_scrollbar.set, xscrollcommand=slice_h_scrollbar.set)
+        self.slice_tree.configure(xscrollcommand=slice_h_scrollbar.set)
+        # 세로 스크롤은 보이는 행만 채우는 가상 테이블이 담당
+        self.slice_table = VirtualTable(self.root, self.slice_tree, slice_v_scrollbar,
+                                        formatter=self._format_slice_rows)
         
         # 그리드 배치
         self.slice_tree.grid(row=0, column=0, sticky='nsew')
@@ -1637,46 +1414,33 @@ class CSVAnalyzerApp:
         self.slice_tree_container.grid_columnconfigure(0, weight=1)
 
     def update_column_checkboxes(self):
-        """컬럼 체크박스 업데이트"""
-        for widget in self.column_selection_frame.winfo_children():
-            widget.destroy()
-
+        """컬럼 목록 업데이트 (기본값: 전체 선택)"""
+        self.column_listbox.delete(0, 'end')
         if self.state.df is not None:
-            self.column_vars = {}
-            columns = list(self.state.df.columns)
-            
-            # 전체 선택/해제 버튼
-            select_frame = tk.Frame(self.column_selection_frame, bg=self.current_theme['panel_bg'])
-            select_frame.pack(fill='x', pady=(0, 5))
-            
-            tk.Button(select_frame, text="All", font=('Arial', 8), 
-                     command=self.select_all_columns).pack(side='left', padx=(0, 5))
-            tk.Button(select_frame, text="None", font=('Arial', 8), 
-                     command=self.deselect_all_columns).pack(side='left')
-
-            # 컬럼별 체크박스 (최대 10개만 표시)
-            for col in columns[:10]:
-                var = tk.BooleanVar(value=True)
-                self.column_vars[col] = var
-                cb = tk.Checkbutton(self.column_selection_frame, text=col[:15], variable=var, 
-                                   bg=self.current_theme['panel_bg'], fg=self.current_theme['text_color'], 
-                                   font=('Arial', 8), selectcolor=self.current_theme['entry_bg'])
-                cb.pack(anchor='w')
+            self.column_listbox.insert('end', *map(str, self.state.df.columns))
+            self.column_listbox.selection_set(0, 'end')
 
     def select_all_columns(self):
-        if hasattr(self, 'column_vars'):
-            for var in self.column_vars.values():
-                var.set(True)
+        self.column_listbox.selection_set(0, 'end')
 
     def deselect_all_columns(self):
-        if hasattr(self, 'column_vars'):
-            for var in self.column_vars.values():
-                var.set(False)
+        self.column_listbox.selection_clear(0, 'end')
+
+    def _schedule_slice(self, event=None):
+        """행 범위 입력 디바운스 (마지막 키 입력 150ms 후 슬라이싱)"""
+        if self._slice_after_id is not None:
+            self.root.after_cancel(self._slice_after_id)
+        self._slice_after_id = self.root.after(150, self._do_slice)
 
-    def apply_slice(self):
-        """슬라이싱 적용"""
+    def _do_slice(self):
+        self._slice_after_id = None
+        self.apply_slice(notify=False)
+
+    def apply_slice(self, notify: bool = True):
+        """슬라이싱 적용 (notify=False면 입력 중 자동 갱신이므로 알림 없이 처리)"""
         if self.state.df is None:
-            self.show_toast("No data loaded", "error")
+            if notify:
+                self.show_toast("No data loaded", "error")
             return
 
         try:
@@ -1686,47 +1450,54 @@ class CSVAnalyzerApp:
             if start_row < 0: start_row = 0
             if end_row > len(self.state.df): end_row = len(self.state.df)
             
-            selected_columns = []
-            if hasattr(self, 'column_vars'):
-                for col, var in self.column_vars.items():
-                    if var.get():
-                        selected_columns.append(col)
-            
-            if not selected_columns:
-                selected_columns = list(self.state.df.columns)
-
-            sliced_data = self.state.df.iloc[start_row:end_row][selected_columns]
+            # 목록 순서가 DataFrame 컬럼 순서와 같으므로 선택 인덱스가 곧 컬럼 위치
+            col_idx = column_positions(self.column_listbox.curselection())
+            if not col_idx:
+                col_idx = slice(None)
+
+            # 복사 없이 범위만 기록 (표시할 구간과 내보낼 때만 실체화)
+            sliced_data = LazySlice(self.state.df, slice(start_row, end_row), col_idx)
+            selected_columns = sliced_data.columns
             self.current_sliced_data = sliced_data
             self.update_slice_table(sliced_data)
             
-            self.show_toast(f"Sliced: {len(sliced_data)} rows, {len(selected_columns)} cols", "success")
+            if notify:
+                self.show_toast(f"Sliced: {len(sliced_data)} rows, {len(selected_columns)} cols", "success")
 
         except Exception as e:
-            self.show_toast(f"Failed to slice: {e}", "error")
+            # 입력 중에는 "12" -> "" 처럼 일시적으로 잘못된 값이 흔하므로 조용히 무시
+            if notify:
+                self.show_toast(f"Failed to slice: {e}", "error")
 
     def update_slice_table(self, data):
         """슬라이싱 결과 테이블 업데이트"""
-        for item in self.slice_tree.get_children():
-            self.slice_tree.delete(item)
-
         if data is None or data.empty:
+            self.slice_table.set_frame(None)
             return
 
         columns = list(data.columns)
-        self.slice_tree['columns'] = columns
         self.slice_tree['show'] = 'tree headings'
         
         self.slice_tree.heading('#0', text='Index', anchor='w')
         self.slice_tree.column('#0', width=60, anchor='w')
 
-        for col in columns:
-            self.slice_tree.heading(col, text=col, anchor='w')
-            self.slice_tree.column(col, width=100, anchor='w')
+        self.slice_table.set_columns(columns, [100] * len(columns), anchor='w')
+
+        # 보이는 구간만 삽입하므로 500행 제한 없이 전체 슬라이스 표시
+        self.slice_table.set_frame(data)
+
+    @staticmethod
+    def _format_slice_rows(window: pd.DataFrame) -> list:
+        """슬라이싱 결과 표시 구간의 셀 포맷 (실수는 소수 둘째 자리, 결측은 빈 칸, 30자 초과는 생략 표시)
 
-        display_data = data.head(500)
-        for idx, row in display_data.iterrows():
-            values = [str(val)[:30] + ('...' if len(str(val)) > 30 else '') for val in row]
-            self.slice_tree.insert('', 'end', text=str(idx), values=values)
+        컬럼 타입으로 포맷 함수를 한 번 고른 뒤 셀에는 그 함수만 호출합니다.
+        표시 구간은 수십 행이라 컬럼마다 pandas 연산을 만드는 것보다 빠릅니다.
+        """
+        formatters = [_format_float_cell if pd.api.types.is_float_dtype(dtype) else _format_cell
+                      for dtype in window.dtypes]
+        rows = [[fmt(val) for fmt, val in zip(formatters, row)]
+                for row in window.to_numpy(dtype=object).tolist()]
+        return truncate_cells(rows, 30) if rows and formatters else []
 
     def export_sliced_data(self):
         """슬라이싱된 데이터 내보내기"""
@@ -1742,65 +1513,27 @@ class CSVAnalyzerApp:
             )
             
             if file_path:
-                self.current_sliced_data.to_csv(file_path, index=True)
-                self.show_toast(f"Exported to {file_path}", "success")
+                self._export_in_background(self.current_sliced_data, file_path, self.export_btn)
                 
         except Exception as e:
             self.show_toast(f"Export failed: {e}", "error")
 
-    def display_data_paginated(self, df: pd.DataFrame, page: int = 0, page_size: int = 1000):
-        """페이지네이션으로 대용량 데이터 효율적 표시"""
-        if df is None or df.empty:
-            return
-        
-        start_idx = page * page_size
-        end_idx = min(start_idx + page_size, len(df))
-        
-        # 현재 페이지 데이터만 표시
-        page_data = df.iloc[start_idx:end_idx]
-        
-        # 캐시 키 생성
-        cache_key = f"page_{page}_{page_size}_{hash(str(df.columns.tolist()))}"
-        cached_data = self.data_cache.get(cache_key)
-        
-        if cached_data is not None:
-            # 캐시된 데이터 사용
-            display_data = cached_data
-        else:
-            # 새로 처리 및 캐시에 저장
-            display_data = page_data.copy()
-            self.data_cache.set(cache_key, display_data)
-        
-        # Treeview 업데이트 (기존 데이터 클리어 후 추가)
-        if hasattr(self, 'preview_tree'):
-            for item in self.preview_tree.get_children():
-                self.preview_tree.delete(item)
-            
-            # 컬럼 헤더 설정 (최초 1회만)
-            if not self.preview_tree.get_children():
-                self.preview_tree['columns'] = list(display_data.columns)
-                for col in display_data.columns:
-                    self.preview_tree.heading(col, text=col)
-                    self.preview_tree.column(col, width=min(150, len(str(col)) * 10))
-            
-            # 데이터 행 추가 (최적화된 방식)
-            for idx, row in display_data.iterrows():
-                values = []
-                for val in row:
-                    if isinstance(val, float):
-                        values.append(f"{val:.2f}")
-                    elif pd.isna(val):
-                        values.append("")
-                    else:
-                        values.append(str(val))
-                self.preview_tree.insert('', 'end', values=values)
-            
-            # 페이지 정보 업데이트
-            if hasattr(self, 'row_count_label'):
-                total_rows = len(df)
-                self.row_count_label.config(
-                    text=f"Rows: {start_idx + 1}-{end_idx} of {total_rows:,}"
-                )
+    def _export_in_background(self, sliced: LazySlice, file_path: str, button):
+        """슬라이스 CSV 저장을 백그라운드 스레드에서 실행 (저장 중에는 내보내기 버튼 비활성화)"""
+        button.config(state='disabled')
+
+        def export_task():
+            write_csv(sliced.to_frame(), file_path)
+            return file_path
+
+        def on_complete(result: TaskResult):
+            button.config(state='normal')
+            if result.success:
+                self.show_toast(f"Exported to {result.data}", "success")
+            else:
+                self.show_toast(f"Export failed: {result.error}", "error")
+
+        self.task_manager.run_task(export_task, on_complete)
 
     def animate_spinner_optimized(self):
         """최적화된 스피너 애니메이션"""
@@ -0,0 +1,122 @@
+"""
+Virtualized DataFrame table component
+"""
+from __future__ import annotations
+from typing import Callable, Optional
+from tkinter import ttk
+
+import pandas as pd
+
+
+def _format_cells(window: pd.DataFrame) -> list:
+    """기본 셀 포맷 (모든 값을 문자열로)"""
+    return window.astype(str).to_numpy().tolist()
+
+
+class VirtualTable:
+    """DataFrame을 Treeview에 보이는 행만 채워 표시 (스크롤하면 해당 구간만 다시 삽입)
+
+    Treeview에는 화면에 보이는 만큼의 행만 들어가고, 세로 스크롤바는
+    (시작 행 / 전체 행 수) 비율로 직접 갱신합니다. 표시 비용이 전체 행 수가
+    아니라 보이는 행 수에 비례합니다.
+    """
+
+    def __init__(self, root, tree: ttk.Treeview, scrollbar: ttk.Scrollbar,
+                 formatter: Optional[Callable[[pd.DataFrame], list]] = None, delay_ms: int = 30):
+        self.root = root
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.formatter = formatter or _format_cells
+        self.delay_ms = delay_ms
+        self.df = None  # DataFrame 또는 window()/len()을 제공하는 지연 슬라이스
+        self.start = 0
+        self._window = None  # 마지막으로 삽입한 (시작, 끝) 행 범위
+        self._after_id = None
+        self._columns = None  # 마지막으로 설정한 (컬럼, 너비, 옵션)
+
+        # Treeview 자체 스크롤 대신 스크롤바를 직접 제어
+        tree.configure(yscrollcommand=lambda *args: None)
+        scrollbar.configure(command=self._on_scrollbar)
+        tree.bind('<Configure>', lambda event: self._schedule_render())
+        tree.bind('<MouseWheel>', self._on_wheel)
+        tree.bind('<Button-4>', self._on_wheel)
+        tree.bind('<Button-5>', self._on_wheel)
+
+    def set_columns(self, columns, widths, **options):
+        """헤더와 컬럼 너비 설정 (이전과 같은 구성이면 Tk 호출 생략)
+
+        options(anchor 등)는 heading과 column에 함께 적용됩니다.
+        """
+        key = (tuple(columns), tuple(widths), tuple(sorted(options.items())))
+        if key == self._columns:
+            return
+        self._columns = key
+        self.tree['columns'] = list(columns)
+        heading, column = self.tree.heading, self.tree.column
+        for col, width in zip(columns, widths):
+            heading(col, text=col, **options)
+            column(col, width=width, **options)
+
+    def set_frame(self, df):
+        """표시할 DataFrame 교체 (맨 위부터 표시)"""
+        self.df = df
+        self.start = 0
+        self._window = None
+        self.render()
+
+    @property
+    def visible_rows(self) -> int:
+        row_height = int(ttk.Style().lookup('Treeview', 'rowheight') or 20)
+        return max(1, self.tree.winfo_height() // row_height)
+
+    def _scroll_to(self, start: int):
+        n = 0 if self.df is None else len(self.df)
+        start = max(0, min(start, n - self.visible_rows))
+        if start != self.start:
+            self.start = start
+            self._schedule_render()
+
+    def _on_scrollbar(self, *args):
+        if self.df is None:
+            return
+        if args[0] == 'moveto':
+            self._scroll_to(int(float(args[1]) * len(self.df)))
+        elif args[0] == 'scroll':
+            step = self.visible_rows if args[2] == 'pages' else 1
+            self._scroll_to(self.start + int(args[1]) * step)
+
+    def _on_wheel(self, event):
+        up = event.num == 4 or getattr(event, 'delta', 0) > 0
+        self._scroll_to(self.start + (-3 if up else 3))
+        return 'break'  # Treeview 기본 스크롤 막기
+
+    def _schedule_render(self):
+        # 연속 스크롤 이벤트는 마지막 한 번만 반영
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+        self._after_id = self.root.after(self.delay_ms, self.render)
+
+    def render(self):
+        """현재 시작 행부터 보이는 구간만 Treeview에 삽입"""
+        self._after_id = None
+        if self.df is None or self.df.empty:
+            self.tree.delete(*self.tree.get_children())
+            self._window = None
+            self.scrollbar.set(0, 1)
+            return
+
+        n = len(self.df)
+        end = min(n, self.start + self.visible_rows)
+        if (self.start, end) == self._window:
+            return  # 같은 구간이면 다시 삽입하지 않음
+        self._window = (self.start, end)
+
+        if isinstance(self.df, pd.DataFrame):
+            window = self.df.iloc[self.start:end]
+        else:
+            window = self.df.window(self.start, end)  # 지연 슬라이스는 보이는 구간만 실체화
+        self.tree.delete(*self.tree.get_children())
+        insert = self.tree.insert
+        for idx, values in zip(window.index.tolist(), self.formatter(window)):
+            insert('', 'end', text=str(idx), values=values)
+        self.scrollbar.set(self.start / n, end / n)
@@ -0,0 +1,72 @@
+"""
+분석 탭 히스토그램 커널
+
+연속 float64 배열의 구간별 개수를 계산합니다. numba가 설치되어 있으면
+@njit(parallel=True) 커널로 스레드별 부분 히스토그램을 만든 뒤 합치고,
+없으면 같은 인터페이스의 np.histogram 구현을 사용합니다.
+
+값은 float64로 다룹니다. float32는 2^24를 넘는 값(epoch 초, ID 등)의 간격을
+표현하지 못해 구간이 뭉개집니다.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+# 선택적 의존성
+try:
+    from numba import get_num_threads, njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _hist_numpy(x, edges):
+    return np.histogram(x, bins=edges.size - 1, range=(edges[0], edges[-1]))[0]
+
+
+if HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _hist_numba(x, edges, nchunks):
+        n = x.size
+        nbins = edges.size - 1
+        lo, hi = edges[0], edges[nbins]
+        scale = nbins / (hi - lo)
+        step = (n + nchunks - 1) // nchunks
+        # 스레드(청크)마다 별도 행에 누적해 경합 없이 병렬 처리
+        partial = np.zeros((nchunks, nbins), dtype=np.int64)
+        for c in prange(nchunks):
+            for r in range(c * step, min(n, (c + 1) * step)):
+                v = x[r]
+                # NaN과 범위 밖 값은 np.histogram과 같이 제외
+                if not (v >= lo and v <= hi):
+                    continue
+                b = int((v - lo) * scale)
+                if b >= nbins:
+                    b = nbins - 1  # 마지막 구간은 오른쪽 끝 포함
+                # 반올림 오차로 경계를 넘은 값은 np.histogram과 같이 경계 비교로 보정
+                if v < edges[b]:
+                    b -= 1
+                elif b < nbins - 1 and v >= edges[b + 1]:
+                    b += 1
+                partial[c, b] += 1
+        return partial.sum(axis=0)
+
+
+def hist(x: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """등간격 구간 경계 edges에 대한 개수 (np.histogram과 같은 구간 규칙)"""
+    if HAS_NUMBA:
+        return _hist_numba(x, edges, get_num_threads())
+    return _hist_numpy(x, edges)
+
+
+def histogram(x: np.ndarray, nbins: int = 20) -> tuple[np.ndarray, np.ndarray]:
+    """(개수, 구간 경계) 반환 (값이 모두 같으면 np.histogram처럼 ±0.5 범위 사용)"""
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    if x.size == 0:
+        lo, hi = 0.0, 1.0
+    else:
+        lo, hi = float(np.nanmin(x)), float(np.nanmax(x))
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+    edges = np.linspace(lo, hi, nbins + 1)
+    return hist(x, edges), edges
@@ -2,10 +2,44 @@
 GUI Application State
 """
 from __future__ import annotations
+from dataclasses import dataclass
 from typing import Optional
 import pandas as pd
 
 
+@dataclass
+class LazySlice:
+    """복사하지 않은 슬라이스 (원본 참조 + 행 범위 + 컬럼 위치, 필요한 구간만 실체화)"""
+    df: pd.DataFrame
+    rows: slice
+    cols: slice | list[int]
+
+    def _row_range(self) -> range:
+        return range(*self.rows.indices(len(self.df)))
+
+    def __len__(self) -> int:
+        return len(self._row_range())
+
+    @property
+    def columns(self) -> pd.Index:
+        return self.df.columns[self.cols]
+
+    @property
+    def empty(self) -> bool:
+        return len(self) == 0 or len(self.columns) == 0
+
+    def window(self, start: int, stop: int) -> pd.DataFrame:
+        """슬라이스 기준 [start, stop) 행만 실체화"""
+        r = self._row_range()[start:stop]
+        return self.df.iloc[r.start:r.stop, self.cols]
+
+    def head(self, n: int = 5) -> pd.DataFrame:
+        return self.window(0, n)
+
+    def to_frame(self) -> pd.DataFrame:
+        return self.df.iloc[self.rows, self.cols]
+
+
 class AppState:
     """Application state for GUI"""
     def __init__(self):
@@ -15,3 +49,7 @@ class AppState:
         self.page_size: int = 100
         self.numeric_cols: list[str] = []
         self.categorical_cols: list[str] = []
+        # df.memory_usage(deep=True) 합계 (로드 시 한 번만 계산)
+        self.memory_bytes: int = 0
+        # 로드 시 타입을 줄인 컬럼: {컬럼: (이전 타입, 이후 타입, 절약한 바이트)}
+        self.dtype_report: dict[str, tuple[str, str, int]] = {}
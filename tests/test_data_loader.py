@@ -0,0 +1,40 @@
+"""
+data_loader 회귀 테스트
+"""
+import pytest
+
+from src.core import data_loader
+from src.core.data_loader import load_csv_optimized
+from src.utils import AppState
+
+pytestmark = pytest.mark.skipif(not data_loader.HAS_PYARROW, reason="pyarrow not installed")
+
+
+def test_nrows_load_survives_type_change_after_first_block(tmp_path):
+    # 스트리밍 리더의 첫 블록(8MB)을 넘긴 뒤에 정수 컬럼에 문자열이 나오는 파일
+    path = tmp_path / "late_type_change.csv"
+    rows = 1_200_000
+    with open(path, "w") as f:
+        f.write("a,b\n")
+        f.writelines(f"{i},x{i}\n" for i in range(rows))
+        f.write("oops,y\n")
+    assert path.stat().st_size > 8 << 20
+
+    state = load_csv_optimized(AppState(), path, nrows=rows + 10)
+
+    assert len(state.df) == rows + 1
+    # 컬럼 전체가 한 가지 타입(문자열)으로 읽혀야 함
+    assert state.df["a"].iloc[0] == "0"
+    assert state.df["a"].iloc[-1] == "oops"
+    assert not state.preview_only
+
+
+@pytest.mark.parametrize("nrows", [None, 10])
+def test_missing_text_values_load_as_na(tmp_path, nrows):
+    # 문자열 컬럼의 빈 칸과 NA도 pd.read_csv처럼 결측이어야 함
+    path = tmp_path / "missing_text.csv"
+    path.write_text("k,v\na,1\n,2\nNA,\nb,4\n")
+
+    state = load_csv_optimized(AppState(), path, nrows=nrows)
+
+    assert state.df.isna().sum().to_dict() == {"k": 2, "v": 1}